@@ -0,0 +1,208 @@
+import json
+import platform
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from main.objects.matrix import Matrix
+
+# Elements processed are counted per operand element, except for matmul where they are multiply-adds.
+OPERATIONS = ('construct', 'add', 'sub', 'mul', 'scale', 'matmul', 'transpose', 'clone', 'eq')
+DEFAULT_SIZES = (8, 64, 256)
+SHAPES = ('square', 'tall', 'wide')
+DTYPES = ('int', 'float', 'float32')
+# Matrix dtype of each benchmarked element type, None to infer it (see main.objects.dtypes).
+MATRIX_DTYPES = {'int': None, 'float': None, 'float32': 'float32'}
+# Matrix products grow cubically, so they are only timed up to this size.
+MAX_MATMUL_SIZE = 256
+# A run is a regression if it is this much slower (relative) than the baseline.
+DEFAULT_THRESHOLD = 0.10
+
+
+def _shape(shape: str, size: int) -> Tuple[int, int]:
+    """
+    Returns the dimensions of a matrix with about size * size elements.
+    :param shape: 'square', 'tall' (4x more rows than columns) or 'wide' (4x more columns than rows).
+    :param size: The edge of the square shape.
+    :return: A (n_rows, n_cols) tuple.
+    """
+    if shape == 'square':
+        return size, size
+    short = max(size // 2, 1)
+    return (size * 2, short) if shape == 'tall' else (short, size * 2)
+
+
+def _data(n_rows: int, n_cols: int, dtype: str, rng: random.Random) -> List[List]:
+    if dtype == 'int':
+        return [[rng.randint(-100, 100) for _ in range(n_cols)] for _ in range(n_rows)]
+    return [[rng.uniform(-100, 100) for _ in range(n_cols)] for _ in range(n_rows)]
+
+
+def _operations(data: List[List], A: Matrix, B: Matrix, dtype: Optional[str] = None) -> Dict[str, Tuple[Callable[[], object], int]]:
+    """
+    Returns the benchmarked operations on the given operands.
+    :return: A dict mapping the operation name to a (callable, number of elements processed) pair.
+    """
+    n = A.n_rows * A.n_cols
+    B_T = B.T.copy()
+    # An equal copy with its own storage, so that == compares every element: A == B stops at the
+    # first difference, and A == A returns at once because both sides share their storage.
+    A_copy = A.clone()
+    return {
+        'construct': (lambda: Matrix(data, dtype), n),
+        'add': (lambda: A + B, n),
+        'sub': (lambda: A - B, n),
+        'mul': (lambda: A * B, n),
+        'scale': (lambda: A * 3, n),
+        'matmul': (lambda: A @ B_T, A.n_rows * A.n_cols * B_T.n_cols),
+        'transpose': (lambda: A.T.copy(), n),
+        'clone': (lambda: A.clone(), n),
+        'eq': (lambda: A == A_copy, n),
+    }
+
+
+def _time(operation: Callable[[], object], repeat: int) -> float:
+    """Returns the best wall time, in seconds, of several runs of an operation."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        operation()
+        best = min(best, time.perf_counter_ns() - start)
+    return best / 1e9
+
+
+def _peak_memory(operation: Callable[[], object]) -> int:
+    """Returns the peak memory, in bytes, allocated during one run of an operation."""
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes: Iterable[int] = DEFAULT_SIZES, shapes: Iterable[str] = SHAPES, dtypes: Iterable[str] = DTYPES,
+        operations: Iterable[str] = OPERATIONS, repeat: int = 3, max_matmul_size: int = MAX_MATMUL_SIZE,
+        seed: int = 0) -> List[Dict]:
+    """
+    Times Matrix operations over a sweep of sizes, shapes and element types.
+    :param sizes: The edges of the square shapes; tall and wide shapes have about as many elements.
+    :param shapes: Any of 'square', 'tall' and 'wide'.
+    :param dtypes: Any of 'int', 'float' and 'float32'.
+    :param operations: The operations to time, any of OPERATIONS.
+    :param repeat: Number of timed runs; the best one is reported.
+    :param max_matmul_size: Largest size for which matrix products are timed.
+    :param seed: Seed of the random matrix elements.
+    :return: One result dict per operation, size, shape and element type.
+    """
+    operations = list(operations)
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown:
+        raise ValueError(f"Unknown operations: {', '.join(sorted(unknown))}.")
+    rng = random.Random(seed)
+    results = []
+    for size in sizes:
+        for shape in shapes:
+            n_rows, n_cols = _shape(shape, size)
+            for dtype in dtypes:
+                data = _data(n_rows, n_cols, dtype, rng)
+                matrix_dtype = MATRIX_DTYPES[dtype]
+                A, B = Matrix(data, matrix_dtype), Matrix(_data(n_rows, n_cols, dtype, rng), matrix_dtype)
+                available = _operations(data, A, B, matrix_dtype)
+                for name in operations:
+                    if name == 'matmul' and size > max_matmul_size:
+                        continue
+                    operation, elements = available[name]
+                    seconds = _time(operation, repeat)
+                    results.append({
+                        'operation': name,
+                        'shape': shape,
+                        'n_rows': n_rows,
+                        'n_cols': n_cols,
+                        'dtype': dtype,
+                        'seconds': seconds,
+                        'ns_per_element': seconds * 1e9 / elements,
+                        'elements_per_second': elements / seconds if seconds else float('inf'),
+                        'peak_bytes': _peak_memory(operation),
+                    })
+    return results
+
+
+def _key(result: Dict) -> Tuple:
+    return result['operation'], result['n_rows'], result['n_cols'], result['dtype']
+
+
+def compare(baseline: List[Dict], results: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Finds the results that are slower than the matching baseline results.
+    :param baseline: Results of a previous run.
+    :param results: Results of the current run.
+    :param threshold: Relative slowdown tolerated before reporting a regression (0.1 is 10%).
+    :return: One dict per regression, with the baseline and current time per element and the slowdown.
+    """
+    previous = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(_key(result))
+        if old is None or old['ns_per_element'] <= 0:
+            continue
+        slowdown = result['ns_per_element'] / old['ns_per_element'] - 1
+        if slowdown > threshold:
+            regressions.append({
+                'operation': result['operation'],
+                'shape': result['shape'],
+                'n_rows': result['n_rows'],
+                'n_cols': result['n_cols'],
+                'dtype': result['dtype'],
+                'baseline_ns_per_element': old['ns_per_element'],
+                'ns_per_element': result['ns_per_element'],
+                'slowdown': slowdown,
+            })
+    return regressions
+
+
+def save(results: List[Dict], path: str) -> None:
+    """
+    Writes results to a JSON file, together with a description of the machine.
+    :param results: The results of run().
+    :param path: The path of the file to (over)write.
+    """
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def load(path: str) -> List[Dict]:
+    """
+    Reads results written by save().
+    :param path: The path of the file.
+    :return: The results.
+    """
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def format_results(results: List[Dict], regressions: Optional[List[Dict]] = None) -> str:
+    """
+    Formats results (and regressions, if any) as a plain text table.
+    :return: The table.
+    """
+    lines = [f"{'operation':<10} {'shape':<7} {'size':>11} {'dtype':<7} {'time (s)':>12} {'ns/elem':>10} "
+             f"{'elem/s':>12} {'peak (B)':>11}"]
+    for result in results:
+        lines.append(
+            f"{result['operation']:<10} {result['shape']:<7} {result['n_rows']:>5}x{result['n_cols']:<5} "
+            f"{result['dtype']:<7} {result['seconds']:>12.6f} {result['ns_per_element']:>10.1f} "
+            f"{result['elements_per_second']:>12.3g} {result['peak_bytes']:>11}")
+    for regression in regressions or []:
+        lines.append(
+            f"REGRESSION {regression['operation']} {regression['shape']} {regression['n_rows']}x{regression['n_cols']} "
+            f"{regression['dtype']}: {regression['baseline_ns_per_element']:.1f} -> "
+            f"{regression['ns_per_element']:.1f} ns/elem (+{regression['slowdown']:.0%})")
+    return '\n'.join(lines)
@@ -0,0 +1,47 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from main import benchmark
+
+
+def _bench(args: argparse.Namespace) -> int:
+    results = benchmark.run(sizes=args.sizes, shapes=args.shapes, dtypes=args.dtypes, operations=args.operations,
+                            repeat=args.repeat, max_matmul_size=args.max_matmul_size)
+    regressions = []
+    if args.baseline:
+        regressions = benchmark.compare(benchmark.load(args.baseline), results, args.threshold)
+    if args.output:
+        benchmark.save(results, args.output)
+    print(benchmark.format_results(results, regressions))
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point, e.g. python -m main.main bench --sizes 8 64 512 --output results.json
+    :param argv: The command line arguments, sys.argv[1:] if None.
+    :return: The exit status: 1 if a benchmark regressed against the baseline, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog='python -m main.main')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    bench = commands.add_parser('bench', help="Time the Matrix operations.")
+    bench.add_argument('--sizes', type=int, nargs='+', default=benchmark.DEFAULT_SIZES)
+    bench.add_argument('--shapes', nargs='+', choices=benchmark.SHAPES, default=benchmark.SHAPES)
+    bench.add_argument('--dtypes', nargs='+', choices=benchmark.DTYPES, default=benchmark.DTYPES)
+    bench.add_argument('--operations', nargs='+', choices=benchmark.OPERATIONS, default=benchmark.OPERATIONS)
+    bench.add_argument('--repeat', type=int, default=3, help="Timed runs per benchmark, the best one is reported.")
+    bench.add_argument('--max-matmul-size', type=int, default=benchmark.MAX_MATMUL_SIZE)
+    bench.add_argument('--output', help="Write the results to this JSON file.")
+    bench.add_argument('--baseline', help="Compare against the results in this JSON file.")
+    bench.add_argument('--threshold', type=float, default=benchmark.DEFAULT_THRESHOLD,
+                       help="Relative slowdown reported as a regression.")
+    bench.set_defaults(handler=_bench)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
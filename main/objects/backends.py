@@ -0,0 +1,184 @@
+from array import array
+from numbers import Number
+from typing import Dict, List, Optional, Tuple, Union
+
+from main.objects.storage import INT64_MAX, Buffer, typecode_of
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Operations smaller than this (in multiply-adds for matmul, elements otherwise) stay on the pure-Python kernels.
+DEFAULT_THRESHOLD = 4096
+
+
+class Backend:
+    """
+    An accelerated implementation of the Matrix kernels. Every kernel returns the result buffer,
+    or None to let the pure-Python kernel compute it; a backend must only return results that are
+    identical (values and buffer type) to the pure-Python ones.
+    """
+
+    def matmul(self, a: Buffer, b: Buffer, n: int, m: int, p: int) -> Optional[Buffer]:
+        """
+        Multiplies a row-major n x m buffer by a row-major m x p buffer.
+        :return: The row-major n x p product, or None.
+        """
+        return None
+
+    def elementwise(self, op: str, a: Buffer, other: Union[Buffer, Number], n_rows: int,
+                    n_cols: int) -> Optional[Buffer]:
+        """
+        Applies 'add', 'sub' or 'mul' to two buffers of the same length, or to a buffer and a scalar.
+        :return: The result buffer, or None.
+        """
+        return None
+
+    def transpose(self, buf: Buffer, n_rows: int, n_cols: int) -> Optional[Buffer]:
+        """
+        Transposes a row-major n_rows x n_cols buffer.
+        :return: The n_cols x n_rows transposed buffer, or None.
+        """
+        return None
+
+
+class NumpyBackend(Backend):
+    """
+    Runs the kernels on int64 and float64 buffers with NumPy, without copying the operands.
+    Integer results that could overflow int64 and float matrix products (whose summation order
+    differs from the pure-Python kernel) are left to the pure-Python kernels.
+    """
+    DTYPES = {'q': 'int64', 'd': 'float64'}
+
+    def _as_array(self, buf: Buffer):
+        return numpy.frombuffer(buf, dtype=self.DTYPES[typecode_of(buf)])
+
+    @staticmethod
+    def _magnitude(values) -> int:
+        """Returns the largest absolute value of an int64 array, as a Python int."""
+        return max(-int(values.min()), int(values.max()))
+
+    def matmul(self, a: Buffer, b: Buffer, n: int, m: int, p: int) -> Optional[Buffer]:
+        if typecode_of(a) != 'q' or typecode_of(b) != 'q':
+            return None
+        x, y = self._as_array(a), self._as_array(b)
+        if m * self._magnitude(x) * self._magnitude(y) > INT64_MAX:
+            return None
+        return array('q', (x.reshape(n, m) @ y.reshape(m, p)).tobytes())
+
+    def elementwise(self, op: str, a: Buffer, other: Union[Buffer, Number], n_rows: int,
+                    n_cols: int) -> Optional[Buffer]:
+        typecode = typecode_of(a)
+        if typecode not in self.DTYPES:
+            return None
+        if isinstance(other, Number):
+            if type(other) is not {'q': int, 'd': float}[typecode] or (typecode == 'q' and abs(other) > INT64_MAX):
+                return None
+            y = other
+            y_magnitude = abs(other)
+        else:
+            if typecode_of(other) != typecode:
+                return None
+            y = self._as_array(other)
+            y_magnitude = self._magnitude(y) if typecode == 'q' else 0
+        x = self._as_array(a)
+        if typecode == 'q':
+            x_magnitude = self._magnitude(x)
+            bound = x_magnitude * y_magnitude if op == 'mul' else x_magnitude + y_magnitude
+            if bound > INT64_MAX:
+                return None
+        result = {'add': numpy.add, 'sub': numpy.subtract, 'mul': numpy.multiply}[op](x, y)
+        return array(typecode, result.tobytes())
+
+    def transpose(self, buf: Buffer, n_rows: int, n_cols: int) -> Optional[Buffer]:
+        typecode = typecode_of(buf)
+        if typecode not in self.DTYPES:
+            return None
+        return array(typecode, self._as_array(buf).reshape(n_rows, n_cols).T.tobytes())
+
+
+_backends: Dict[str, Backend] = {}
+_active: Optional[str] = None
+_threshold = DEFAULT_THRESHOLD
+
+
+def register(name: str, backend: Backend) -> None:
+    """
+    Makes a backend available to configure().
+    :param name: The name of the backend.
+    :param backend: The Backend object.
+    """
+    _backends[name] = backend
+
+
+def available() -> List[str]:
+    """
+    Returns the names of the registered backends.
+    :return: A list of names, 'numpy' is included when NumPy is importable.
+    """
+    return list(_backends)
+
+
+def configure(backend: Optional[str] = 'auto', threshold: int = DEFAULT_THRESHOLD) -> None:
+    """
+    Selects the backend Matrix operators dispatch to. By default NumPy is used when it is importable.
+    :param backend: The name of a registered backend, 'auto' for NumPy if available, or None for pure Python only.
+    :param threshold: Operations below this amount of work stay on the pure-Python kernels.
+    """
+    global _active, _threshold
+    if threshold < 0:
+        raise ValueError("Threshold must be a non-negative integer.")
+    if backend == 'auto':
+        backend = 'numpy' if 'numpy' in _backends else None
+    if backend is not None and backend not in _backends:
+        raise ValueError(f"Unknown backend '{backend}'. Available backends: {', '.join(_backends) or 'none'}.")
+    _active = backend
+    _threshold = threshold
+
+
+def get_config() -> Tuple[Optional[str], int]:
+    """
+    Returns the current backend configuration.
+    :return: A (backend, threshold) tuple, backend is None when only the pure-Python kernels are used.
+    """
+    return _active, _threshold
+
+
+def _dispatch(work: int) -> Optional[Backend]:
+    if _active is None or work < _threshold:
+        return None
+    return _backends[_active]
+
+
+def accelerated_matmul(a: Buffer, b: Buffer, n: int, m: int, p: int) -> Optional[Buffer]:
+    """
+    Multiplies two buffers with the active backend, if any.
+    :return: The row-major n x p product, or None if the pure-Python kernels must compute it.
+    """
+    backend = _dispatch(n * m * p)
+    return None if backend is None else backend.matmul(a, b, n, m, p)
+
+
+def accelerated_elementwise(op: str, a: Buffer, other: Union[Buffer, Number], n_rows: int,
+                            n_cols: int) -> Optional[Buffer]:
+    """
+    Applies an element-wise operator with the active backend, if any.
+    :return: The result buffer, or None if the pure-Python kernels must compute it.
+    """
+    backend = _dispatch(len(a))
+    return None if backend is None else backend.elementwise(op, a, other, n_rows, n_cols)
+
+
+def accelerated_transpose(buf: Buffer, n_rows: int, n_cols: int) -> Optional[Buffer]:
+    """
+    Transposes a buffer with the active backend, if any.
+    :return: The transposed buffer, or None if the pure-Python kernels must compute it.
+    """
+    backend = _dispatch(len(buf))
+    return None if backend is None else backend.transpose(buf, n_rows, n_cols)
+
+
+if numpy is not None:
+    register('numpy', NumpyBackend())
+configure()
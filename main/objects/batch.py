@@ -0,0 +1,216 @@
+from itertools import cycle, repeat
+from numbers import Number
+from operator import mul
+from typing import Iterable, List, Tuple, Union
+
+from main.objects.matrix import Matrix
+from main.objects.dtypes import common_typecode, pack_as, result_typecode
+from main.objects.storage import Buffer, buffers_equal, copy_buffer, typecode_of
+
+Operand = Union['MatrixBatch', Matrix]
+
+
+class MatrixBatch:
+    """
+    A stack of matrices of the same shape stored in one contiguous row-major buffer, one matrix after the other.
+    Operators work on the whole stack in a single loop, without creating a Matrix object per element.
+    A single Matrix operand is broadcast against every matrix of the batch.
+    Element types follow the promotion rules of Matrix operators (see main.objects.dtypes).
+    """
+    __slots__ = ('_buf', 'size', 'n_rows', 'n_cols')
+
+    def __init__(self, matrices: Iterable[Matrix]) -> None:
+        """
+        Initializes the batch from matrices of the same shape.
+        :param matrices: A non-empty iterable of Matrix objects with the same number of rows and columns.
+        """
+        matrices = list(matrices)
+        if not matrices:
+            raise ValueError("Batch cannot be empty.")
+        if not all(isinstance(matrix, Matrix) for matrix in matrices):
+            raise ValueError("Batch elements must be matrices.")
+        n_rows, n_cols = matrices[0].n_rows, matrices[0].n_cols
+        if not all(matrix.n_rows == n_rows and matrix.n_cols == n_cols for matrix in matrices):
+            raise ValueError("All matrices in a batch must have the same dimensions.")
+        buffers = [matrix._buf for matrix in matrices]
+        flat = []
+        for buf in buffers:
+            flat.extend(buf)
+        self._buf = pack_as(flat, common_typecode(buffers))
+        self.size, self.n_rows, self.n_cols = len(matrices), n_rows, n_cols
+
+    @classmethod
+    def _from_buffer(cls, buf: Buffer, size: int, n_rows: int, n_cols: int) -> 'MatrixBatch':
+        """
+        Wraps an already packed buffer of size * n_rows * n_cols elements without copying or validating it.
+        """
+        batch = cls.__new__(cls)
+        batch._buf = buf
+        batch.size, batch.n_rows, batch.n_cols = size, n_rows, n_cols
+        return batch
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Returns the (number of matrices, number of rows, number of columns) of the batch."""
+        return self.size, self.n_rows, self.n_cols
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, idx: int) -> Matrix:
+        """
+        Returns a copy of one matrix of the batch.
+        :param idx: The index of the matrix, negative values count from the end.
+        :return: A new Matrix object.
+        """
+        if idx < 0:
+            idx += self.size
+        if not 0 <= idx < self.size:
+            raise IndexError("Batch index out of range.")
+        step = self.n_rows * self.n_cols
+        return Matrix._from_buffer(self._buf[idx * step:(idx + 1) * step], self.n_rows, self.n_cols)
+
+    def to_matrices(self) -> List[Matrix]:
+        """
+        Splits the batch into Matrix objects.
+        :return: A list of new Matrix objects, one per matrix of the batch.
+        """
+        return [self[idx] for idx in range(self.size)]
+
+    def _check_same_dimensions(self, other: Operand, phrase: str) -> None:
+        if self.n_rows != other.n_rows or self.n_cols != other.n_cols:
+            raise ValueError(
+                f"Matrices must have the same dimensions {phrase}. One is {self.n_rows}x{self.n_cols} and the other is {other.n_rows}x{other.n_cols}")
+        if isinstance(other, MatrixBatch) and other.size != self.size:
+            raise ValueError(f"Batches must have the same size. One has {self.size} matrices and the other has {other.size}")
+
+    def _elements(self, other: Operand) -> Iterable[Number]:
+        """Returns the elements of other lined up with the elements of this batch, broadcasting a Matrix."""
+        return other._buf if isinstance(other, MatrixBatch) else cycle(other._buf)
+
+    def _like(self, buf: List[Number], other: Union[Operand, Number]) -> 'MatrixBatch':
+        """Wraps the results of an operator between this batch and other, typed as result_typecode gives."""
+        other = other if isinstance(other, Number) else other._buf
+        typecode = result_typecode(self._buf, other)
+        return MatrixBatch._from_buffer(pack_as(buf, typecode), self.size, self.n_rows, self.n_cols)
+
+    def __add__(self, other: Operand) -> 'MatrixBatch':
+        """
+        Adds a batch or a single matrix element-wise to every matrix of the batch.
+        :param other: A MatrixBatch of the same size and dimensions, or a Matrix of the same dimensions.
+        :return: A new MatrixBatch object that is the result of the addition.
+        """
+        if not isinstance(other, (MatrixBatch, Matrix)):
+            return NotImplemented
+        self._check_same_dimensions(other, "to be added")
+        return self._like([x + y for x, y in zip(self._buf, self._elements(other))], other)
+
+    def __radd__(self, other: Matrix) -> 'MatrixBatch':
+        return self.__add__(other)
+
+    def __sub__(self, other: Operand) -> 'MatrixBatch':
+        """
+        Subtracts a batch or a single matrix element-wise from every matrix of the batch.
+        :param other: A MatrixBatch of the same size and dimensions, or a Matrix of the same dimensions.
+        :return: A new MatrixBatch object that is the result of the subtraction.
+        """
+        if not isinstance(other, (MatrixBatch, Matrix)):
+            return NotImplemented
+        self._check_same_dimensions(other, "to be subtracted")
+        return self._like([x - y for x, y in zip(self._buf, self._elements(other))], other)
+
+    def __rsub__(self, other: Matrix) -> 'MatrixBatch':
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        self._check_same_dimensions(other, "to be subtracted")
+        return self._like([y - x for x, y in zip(self._buf, self._elements(other))], other)
+
+    def __mul__(self, other: Union[Operand, Number]) -> 'MatrixBatch':
+        """
+        Performs element-wise multiplication with a batch or a single matrix, or scalar multiplication.
+        :param other: A MatrixBatch, a Matrix or a scalar.
+        :return: A new MatrixBatch object that is the result of the multiplication.
+        """
+        if isinstance(other, Number):
+            return self._like([x * other for x in self._buf], other)
+        if not isinstance(other, (MatrixBatch, Matrix)):
+            raise TypeError("Unsupported operand type(s) for *: 'MatrixBatch' and '{}'".format(type(other).__name__))
+        self._check_same_dimensions(other, "for element-wise multiplication")
+        return self._like([x * y for x, y in zip(self._buf, self._elements(other))], other)
+
+    def __rmul__(self, other: Union[Matrix, Number]) -> 'MatrixBatch':
+        if isinstance(other, Matrix):
+            self._check_same_dimensions(other, "for element-wise multiplication")
+            return self._like([y * x for x, y in zip(self._buf, self._elements(other))], other)
+        return self.__mul__(other)
+
+    @staticmethod
+    def _matmul(left: Operand, right: Operand) -> 'MatrixBatch':
+        """
+        Multiplies every pair of matrices of two batches, broadcasting a single Matrix on either side.
+        """
+        if left.n_cols != right.n_rows:
+            raise ValueError(
+                f"Number of columns in the first matrix ({left.n_cols}) must equal number of rows in the second matrix ({right.n_rows}).")
+        sizes = [operand.size for operand in (left, right) if isinstance(operand, MatrixBatch)]
+        if len(sizes) == 2 and sizes[0] != sizes[1]:
+            raise ValueError(f"Batches must have the same size. One has {sizes[0]} matrices and the other has {sizes[1]}")
+        size, n, m, p = sizes[0], left.n_rows, left.n_cols, right.n_cols
+        a, b = left._buf, right._buf
+        a_offsets = range(0, size * n * m, n * m) if isinstance(left, MatrixBatch) else repeat(0, size)
+        b_offsets = range(0, size * m * p, m * p) if isinstance(right, MatrixBatch) else repeat(0, size)
+        flat = [
+            sum(map(mul, a[row:row + m], b[b_offset + j:b_offset + m * p:p]))
+            for a_offset, b_offset in zip(a_offsets, b_offsets)
+            for row in range(a_offset, a_offset + n * m, m)
+            for j in range(p)
+        ]
+        return MatrixBatch._from_buffer(pack_as(flat, result_typecode(a, b)), size, n, p)
+
+    def __matmul__(self, other: Operand) -> 'MatrixBatch':
+        """
+        Performs matrix multiplication of each matrix of the batch with the matching matrix of other.
+        :param other: A MatrixBatch of the same size, or a single Matrix used for every matrix of the batch.
+        :return: A new MatrixBatch object with the products.
+        """
+        if not isinstance(other, (MatrixBatch, Matrix)):
+            return NotImplemented
+        return MatrixBatch._matmul(self, other)
+
+    def __rmatmul__(self, other: Matrix) -> 'MatrixBatch':
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return MatrixBatch._matmul(other, self)
+
+    @property
+    def T(self) -> 'MatrixBatch':
+        """Returns a batch with the transpose of every matrix."""
+        a, n, m = self._buf, self.n_rows, self.n_cols
+        step = n * m
+        flat = []
+        for offset in range(0, self.size * step, step):
+            for j in range(offset, offset + m):
+                flat.extend(a[j:offset + step:m])
+        return MatrixBatch._from_buffer(pack_as(flat, typecode_of(a)), self.size, m, n)
+
+    def clone(self) -> 'MatrixBatch':
+        """
+        Creates and returns a copy of the batch.
+        :return: A new MatrixBatch object.
+        """
+        return MatrixBatch._from_buffer(copy_buffer(self._buf), self.size, self.n_rows, self.n_cols)
+
+    def __eq__(self, other) -> bool:
+        """Check if two batches hold equal matrices."""
+        if not isinstance(other, MatrixBatch):
+            return NotImplemented
+        return self.shape == other.shape and buffers_equal(self._buf, other._buf)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """
+        Represents the batch in a readable string format.
+        :return: A string representation of the batch.
+        """
+        return f"MatrixBatch({[matrix.data for matrix in self.to_matrices()]})"
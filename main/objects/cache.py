@@ -0,0 +1,117 @@
+import hashlib
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Sequence, Tuple
+
+from main.objects.storage import Buffer, typecode_of
+
+# Total size of the cached results, in bytes, before the least recently used ones are evicted.
+DEFAULT_BUDGET = 64 * 2 ** 20
+
+# key -> (result, size in bytes), from least to most recently used. Operands are identified by a digest
+# of their elements, so entries do not keep them alive and the budget bounds the memory held by the cache.
+_entries: 'OrderedDict[Hashable, Tuple[object, int]]' = OrderedDict()
+_budget = DEFAULT_BUDGET
+_size = 0
+_hits = 0
+_misses = 0
+_evictions = 0
+
+
+def configure(budget: int = DEFAULT_BUDGET) -> None:
+    """
+    Sets the size of the cache of results of operations on frozen matrices. 0 disables the cache.
+    :param budget: The total size of the cached results, in bytes.
+    """
+    global _budget
+    if budget < 0:
+        raise ValueError("Cache budget must be a non-negative integer.")
+    _budget = budget
+    _evict()
+
+
+def clear() -> None:
+    """Removes all cached results and resets the statistics."""
+    global _size, _hits, _misses, _evictions
+    _entries.clear()
+    _size = _hits = _misses = _evictions = 0
+
+
+def get_stats() -> Dict[str, int]:
+    """
+    Returns the cache statistics.
+    :return: A dict with the number of hits, misses, evictions and entries, and the size and budget in bytes.
+    """
+    return {'hits': _hits, 'misses': _misses, 'evictions': _evictions, 'entries': len(_entries),
+            'bytes': _size, 'budget': _budget}
+
+
+def nbytes(buf: Buffer) -> int:
+    """
+    Estimates the memory used by a buffer.
+    :param buf: The buffer.
+    :return: Its size in bytes, including the element objects of plain lists.
+    """
+    if typecode_of(buf) is not None:
+        return memoryview(buf).nbytes
+    return sys.getsizeof(buf) + sum(map(sys.getsizeof, buf))
+
+
+def _digest(storage) -> bytes:
+    """
+    Returns a 128-bit digest of the bytes (typed buffers) or of the types and exact reprs of the elements (lists)
+    of a frozen storage. It is computed on the first lookup and kept, since frozen storage cannot change.
+    """
+    if storage.digest is None:
+        buf = storage.buf
+        if typecode_of(buf) is not None:
+            data = memoryview(buf).cast('B')
+        else:
+            data = repr((list(map(type, buf)), buf)).encode()
+        storage.digest = hashlib.blake2b(data, digest_size=16).digest()
+    return storage.digest
+
+
+def _fingerprint(matrix) -> Tuple:
+    """
+    Identifies the elements of a frozen matrix, including their types, by the digest of its storage
+    and the layout of the matrix (or view) over it.
+    """
+    storage = matrix._storage
+    return (matrix.n_rows, matrix.n_cols, matrix._offset, matrix._row_stride, matrix._col_stride,
+            typecode_of(storage.buf), _digest(storage))
+
+
+def _evict() -> None:
+    global _size, _evictions
+    while _size > _budget:
+        _, (_, size) = _entries.popitem(last=False)
+        _size -= size
+        _evictions += 1
+
+
+def memoize(operation: str, operands: Sequence, compute: Callable[[], object], *args: Hashable):
+    """
+    Returns the cached result of an operation on frozen matrices, computing and caching it on a miss.
+    Results are frozen, so they can be shared by every caller.
+    :param operation: The name of the operation.
+    :param operands: The frozen Matrix operands.
+    :param compute: Computes the result when it is not cached.
+    :param args: Other arguments of the operation.
+    :return: The frozen result.
+    """
+    global _size, _hits, _misses
+    key = (operation, args) + tuple(_fingerprint(operand) for operand in operands)
+    entry = _entries.get(key)
+    if entry is not None:
+        _hits += 1
+        _entries.move_to_end(key)
+        return entry[0]
+    _misses += 1
+    result = compute().freeze()
+    size = nbytes(result._storage.buf)
+    if size <= _budget:
+        _entries[key] = (result, size)
+        _size += size
+        _evict()
+    return result
@@ -0,0 +1,55 @@
+from typing import List, NamedTuple, Sequence, Tuple, Union
+
+# A parenthesization: either the index of an operand or a pair of sub-orders multiplied together.
+Order = Union[int, Tuple['Order', 'Order']]
+
+
+class ChainPlan(NamedTuple):
+    """
+    The cheapest order in which to multiply a chain of matrices.
+    order is a nested tuple of operand indices, e.g. ((0, 1), 2) for (A0 @ A1) @ A2,
+    flops is its number of scalar multiplications and left_to_right_flops the number for (((A0 @ A1) @ A2) @ ...).
+    """
+    order: Order
+    flops: int
+    left_to_right_flops: int
+
+    def __str__(self) -> str:
+        def render(order: Order) -> str:
+            if isinstance(order, int):
+                return f"A{order}"
+            return f"({render(order[0])} @ {render(order[1])})"
+        return render(self.order)
+
+
+def plan(shapes: Sequence[Tuple[int, int]]) -> ChainPlan:
+    """
+    Finds the cheapest parenthesization of a chain of matrix products by dynamic programming (O(n^3) in the chain length).
+    :param shapes: The (n_rows, n_cols) of each operand; consecutive shapes must be compatible.
+    :return: The ChainPlan of the chain.
+    """
+    if not shapes:
+        raise ValueError("Matrix chain cannot be empty.")
+    for (_, n_cols), (n_rows, _) in zip(shapes, shapes[1:]):
+        if n_cols != n_rows:
+            raise ValueError(
+                f"Number of columns in the first matrix ({n_cols}) must equal number of rows in the second matrix ({n_rows}).")
+    n = len(shapes)
+    dims = [shapes[0][0]] + [n_cols for _, n_cols in shapes]
+    # cost[i][j] is the cheapest cost of multiplying operands i..j, split[i][j] where that product is split.
+    cost: List[List[int]] = [[0] * n for _ in range(n)]
+    split: List[List[int]] = [[0] * n for _ in range(n)]
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            cost[i][j], split[i][j] = min(
+                (cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1], k) for k in range(i, j))
+
+    def order(i: int, j: int) -> Order:
+        if i == j:
+            return i
+        k = split[i][j]
+        return order(i, k), order(k + 1, j)
+
+    left_to_right = sum(dims[0] * dims[k] * dims[k + 1] for k in range(1, n))
+    return ChainPlan(order(0, n - 1), cost[0][n - 1], left_to_right)
@@ -0,0 +1,125 @@
+from array import array
+from fractions import Fraction
+from numbers import Number
+from typing import Iterable, List, Optional, Sequence
+
+from main.objects.storage import Buffer, pack, typecode_of
+
+# Element types of a Matrix. int64, float64 and float32 are stored in typed arrays; fraction (exact
+# rationals: ints, big ints and Fractions) and object (anything else, e.g. mixed or complex values) in lists.
+DTYPES = ('int64', 'float64', 'float32', 'fraction', 'object')
+TYPECODES = {'int64': 'q', 'float64': 'd', 'float32': 'f'}
+_NAMES = {typecode: dtype for dtype, typecode in TYPECODES.items()}
+
+# Promotion of two typed operands: the typecode of the result of an element-wise operator or a product.
+# Mixed precision always gives float64, as in NumPy; int64 results that overflow become exact (fraction) results.
+_PROMOTIONS = {
+    ('q', 'q'): 'q', ('q', 'd'): 'd', ('q', 'f'): 'd',
+    ('d', 'q'): 'd', ('d', 'd'): 'd', ('d', 'f'): 'd',
+    ('f', 'q'): 'd', ('f', 'd'): 'd', ('f', 'f'): 'f',
+}
+
+
+def dtype_of(buf: Buffer) -> str:
+    """
+    Returns the dtype of a buffer. Lists are 'fraction' if they only hold ints and Fractions, 'object' otherwise.
+    :param buf: The buffer.
+    :return: One of DTYPES.
+    """
+    typecode = typecode_of(buf)
+    if typecode is not None:
+        return _NAMES[typecode]
+    if all(type(value) is int or isinstance(value, Fraction) for value in buf):
+        return 'fraction'
+    return 'object'
+
+
+def convert(values: Iterable[Number], dtype: str) -> Buffer:
+    """
+    Converts values to a buffer of the given dtype. Conversions to int64 must be exact; conversions
+    to float64 and float32 round to the nearest representable value.
+    :param values: The flat, row-major values.
+    :param dtype: One of DTYPES.
+    :return: The buffer.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"Unknown dtype '{dtype}'. Expected one of: {', '.join(DTYPES)}.")
+    try:
+        if dtype == 'object':
+            return list(values)
+        if dtype == 'fraction':
+            return [value if type(value) is int else Fraction(value) for value in values]
+        if dtype == 'int64':
+            values = list(values)
+            integers = [int(value) for value in values]
+            if integers != values:
+                raise ValueError("Elements must be integers to be converted to int64.")
+            return array('q', integers)
+        return array(TYPECODES[dtype], [float(value) for value in values])
+    except OverflowError:
+        raise ValueError(f"Elements do not fit in {dtype}.") from None
+    except TypeError:
+        raise ValueError(f"Elements cannot be converted to {dtype}.") from None
+
+
+def result_typecode(a: Buffer, other) -> Optional[str]:
+    """
+    Returns the typecode of the result of an operator on a typed buffer and another buffer or a scalar.
+    Python int and float scalars take the type of the buffer when they can (e.g. float32 * 2.5 is float32).
+    :param a: The buffer of the left operand.
+    :param other: The buffer of the right operand, or a scalar.
+    :return: The typecode, or None if it must be inferred from the result values (list operands, other scalars).
+    """
+    return _combine(typecode_of(a), other)
+
+
+def common_typecode(operands: Sequence) -> Optional[str]:
+    """
+    Returns the typecode of the result of a chain of operators on buffers and scalars (e.g. a fused
+    expression), applying the rules of result_typecode to one operand after the other.
+    :param operands: The buffers, then any scalars; the first operand must be a buffer.
+    :return: The typecode, or None if it must be inferred from the result values.
+    """
+    typecode = typecode_of(operands[0])
+    for other in operands[1:]:
+        typecode = _combine(typecode, other)
+    return typecode
+
+
+def _combine(typecode: Optional[str], other) -> Optional[str]:
+    """Returns the typecode of the result of an operator on a buffer of the given typecode and another operand."""
+    if typecode is None:
+        return None
+    if isinstance(other, Number):
+        if type(other) is int:
+            return typecode
+        if type(other) is float:
+            return 'd' if typecode == 'q' else typecode
+        return None
+    other_typecode = typecode_of(other)
+    return None if other_typecode is None else promote(typecode, other_typecode)
+
+
+def promote(typecode: str, other_typecode: str) -> str:
+    """
+    Returns the typecode of the result of an operator on two typed buffers.
+    :param typecode: The typecode of the left operand, 'q', 'd' or 'f'.
+    :param other_typecode: The typecode of the right operand.
+    :return: The typecode of the result.
+    """
+    return _PROMOTIONS[typecode, other_typecode]
+
+
+def pack_as(values: List[Number], typecode: Optional[str]) -> Buffer:
+    """
+    Packs the results of a type-specialized kernel without inspecting their types.
+    :param values: The flat, row-major results.
+    :param typecode: The typecode given by result_typecode, or None to infer it with pack().
+    :return: The buffer; int64 results that overflow are kept in a list.
+    """
+    if typecode is None:
+        return pack(values)
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        return values
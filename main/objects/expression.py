@@ -0,0 +1,223 @@
+from numbers import Number
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from main.objects.matrix import Matrix
+from main.objects.dtypes import common_typecode, pack_as
+
+Operand = Union['Expression', Matrix]
+
+# Generated elementwise kernels, keyed by the shape of the expression tree they evaluate.
+_kernels: Dict[str, Callable[..., List[Number]]] = {}
+
+
+class Expression:
+    """
+    A lazily evaluated Matrix expression, created with Matrix.lazy().
+    Operators build a tree of nodes instead of computing intermediate matrices. On evaluation,
+    each chain of elementwise operators and transposes is compiled into a single loop over the
+    output, walking the rows of every operand (the columns of transposed ones) in lockstep. Matrix products are
+    evaluation barriers: their operands are evaluated first and multiplied with Matrix.matmul.
+    """
+    n_rows: int
+    n_cols: int
+
+    def __init__(self) -> None:
+        self._value: Optional[Matrix] = None
+
+    def evaluate(self) -> Matrix:
+        """
+        Computes the value of the expression. The result is computed once and then reused.
+        :return: A Matrix object holding the value of the expression.
+        """
+        if self._value is None:
+            self._value = self._compute()
+        return self._value
+
+    def _compute(self) -> Matrix:
+        leaves, scalars = [], []
+        code = self._emit(False, leaves, scalars)
+        kernel = _compile(code, len(leaves), len(scalars), any(t for _, t in leaves))
+        buffers = [leaf.evaluate()._buf for leaf, _ in leaves]
+        # The result has the type the same operators would give eagerly (see main.objects.dtypes).
+        result = pack_as(kernel(self.n_rows, self.n_cols, *buffers, *scalars), common_typecode(buffers + scalars))
+        return Matrix._from_buffer(result, self.n_rows, self.n_cols)
+
+    def _emit(self, transposed: bool, leaves: List[Tuple['Expression', bool]], scalars: List[Number]) -> str:
+        """
+        Emits the Python expression computing one element of this node.
+        By default the node is evaluated on its own and read as an operand of the generated loop.
+        :param transposed: Whether the element is read at (j, i) instead of (i, j).
+        :param leaves: Collects the nodes read by the generated loop and their orientation.
+        :param scalars: Collects the scalar constants used by the generated loop.
+        :return: The source of the element expression.
+        """
+        leaves.append((self, transposed))
+        return f"b{len(leaves) - 1}[{'j * R + i' if transposed else 'i * C + j'}]"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.n_rows, self.n_cols
+
+    def __add__(self, other: Operand) -> 'Expression':
+        return Elementwise('+', self, _wrap(other), "to be added")
+
+    def __radd__(self, other: Operand) -> 'Expression':
+        return Elementwise('+', _wrap(other), self, "to be added")
+
+    def __sub__(self, other: Operand) -> 'Expression':
+        return Elementwise('-', self, _wrap(other), "to be subtracted")
+
+    def __rsub__(self, other: Operand) -> 'Expression':
+        return Elementwise('-', _wrap(other), self, "to be subtracted")
+
+    def __mul__(self, other: Union[Operand, Number]) -> 'Expression':
+        if isinstance(other, Number):
+            return Scale(self, other)
+        if isinstance(other, (Expression, Matrix)):
+            return Elementwise('*', self, _wrap(other), "for element-wise multiplication")
+        raise TypeError("Unsupported operand type(s) for *: 'Expression' and '{}'".format(type(other).__name__))
+
+    def __rmul__(self, other: Union[Operand, Number]) -> 'Expression':
+        if isinstance(other, Number):
+            return Scale(self, other)
+        return _wrap(other).__mul__(self)
+
+    def __matmul__(self, other: Operand) -> 'Expression':
+        return MatMul(self, _wrap(other))
+
+    def __rmatmul__(self, other: Operand) -> 'Expression':
+        return MatMul(_wrap(other), self)
+
+    @property
+    def T(self) -> 'Expression':
+        """Returns the transpose of the expression, without moving any data."""
+        return Transpose(self)
+
+    def __getitem__(self, idx):
+        """Evaluates the expression and returns matrix[idx]."""
+        return self.evaluate()[idx]
+
+    def __eq__(self, other) -> bool:
+        """Evaluates the expression and checks if it equals another matrix or expression."""
+        if isinstance(other, Expression):
+            other = other.evaluate()
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.evaluate() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.evaluate())
+
+
+class Leaf(Expression):
+    """An expression node holding a concrete Matrix."""
+
+    def __init__(self, matrix: Matrix) -> None:
+        super().__init__()
+        self._value = matrix
+        self.n_rows, self.n_cols = matrix.n_rows, matrix.n_cols
+
+
+class Elementwise(Expression):
+    """An elementwise +, - or * between two expressions of the same shape."""
+
+    def __init__(self, op: str, left: Expression, right: Expression, phrase: str) -> None:
+        super().__init__()
+        if left.n_rows != right.n_rows or left.n_cols != right.n_cols:
+            raise ValueError(
+                f"Matrices must have the same dimensions {phrase}. One is {left.n_rows}x{left.n_cols} and the other is {right.n_rows}x{right.n_cols}")
+        self.op, self.left, self.right = op, left, right
+        self.n_rows, self.n_cols = left.n_rows, left.n_cols
+
+    def _emit(self, transposed, leaves, scalars) -> str:
+        if self._value is not None:
+            return super()._emit(transposed, leaves, scalars)
+        left = self.left._emit(transposed, leaves, scalars)
+        right = self.right._emit(transposed, leaves, scalars)
+        return f"({left} {self.op} {right})"
+
+
+class Scale(Expression):
+    """A multiplication of an expression by a scalar."""
+
+    def __init__(self, child: Expression, scalar: Number) -> None:
+        super().__init__()
+        self.child, self.scalar = child, scalar
+        self.n_rows, self.n_cols = child.n_rows, child.n_cols
+
+    def _emit(self, transposed, leaves, scalars) -> str:
+        if self._value is not None:
+            return super()._emit(transposed, leaves, scalars)
+        scalars.append(self.scalar)
+        return f"({self.child._emit(transposed, leaves, scalars)} * s{len(scalars) - 1})"
+
+
+class Transpose(Expression):
+    """The transpose of an expression, folded into the indexing of the operands below it."""
+
+    def __init__(self, child: Expression) -> None:
+        super().__init__()
+        self.child = child
+        self.n_rows, self.n_cols = child.n_cols, child.n_rows
+
+    def _emit(self, transposed, leaves, scalars) -> str:
+        if self._value is not None:
+            return super()._emit(transposed, leaves, scalars)
+        return self.child._emit(not transposed, leaves, scalars)
+
+
+class MatMul(Expression):
+    """A matrix product. Its operands are evaluated before multiplying them."""
+
+    def __init__(self, left: Expression, right: Expression) -> None:
+        super().__init__()
+        if left.n_cols != right.n_rows:
+            raise ValueError(
+                f"Number of columns in the first matrix ({left.n_cols}) must equal number of rows in the second matrix ({right.n_rows}).")
+        self.left, self.right = left, right
+        self.n_rows, self.n_cols = left.n_rows, right.n_cols
+
+    def _compute(self) -> Matrix:
+        return self.left.evaluate() @ self.right.evaluate()
+
+
+def _wrap(operand: Operand) -> Expression:
+    if isinstance(operand, Expression):
+        return operand
+    if isinstance(operand, Matrix):
+        return Leaf(operand)
+    raise TypeError(f"Unsupported operand type for a Matrix expression: '{type(operand).__name__}'")
+
+
+def _compile(code: str, n_leaves: int, n_scalars: int, has_transposes: bool) -> Callable[..., List[Number]]:
+    """
+    Compiles an element expression into a function computing the whole flat, row-major output.
+    The function takes the output shape (R, C), then the operand buffers b0.. and the scalars s0..
+    """
+    key = f"{code}|{n_leaves}|{n_scalars}"
+    kernel = _kernels.get(key)
+    if kernel is None:
+        params = ', '.join(['R', 'C'] + [f"b{n}" for n in range(n_leaves)] + [f"s{n}" for n in range(n_scalars)])
+        targets = ''.join(f"x{n}, " for n in range(n_leaves))
+        if has_transposes:
+            # Row i of the output reads row i of the other operands and column i of the transposed ones:
+            # slice both once per row and walk them in lockstep.
+            rows = []
+            for n in range(n_leaves):
+                if f"b{n}[j * R + i]" in code:
+                    code = code.replace(f"b{n}[j * R + i]", f"x{n}")
+                    rows.append(f"b{n}[i::R]")
+                else:
+                    code = code.replace(f"b{n}[i * C + j]", f"x{n}")
+                    rows.append(f"b{n}[i * C:i * C + C]")
+            loop = f"[{code} for i in range(R) for {targets}in zip({', '.join(rows)})]"
+        else:
+            # Every operand is read in storage order, so walk all of them in lockstep.
+            for n in range(n_leaves):
+                code = code.replace(f"b{n}[i * C + j]", f"x{n}")
+            loop = f"[{code} for {targets}in zip({', '.join(f'b{n}' for n in range(n_leaves))})]"
+        kernel = eval(f"lambda {params}: {loop}")
+        _kernels[key] = kernel
+    return kernel
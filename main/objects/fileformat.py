@@ -0,0 +1,154 @@
+import mmap as mmap_module
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Tuple
+
+from main.objects.dtypes import promote
+from main.objects.matmul import matmul_naive
+from main.objects.matrix import Matrix
+from main.objects.storage import typecode_of
+
+# File layout: a fixed header followed by the raw little-endian, row-major element buffer.
+# Header: magic, format version, element typecode ('q' int64, 'd' float64 or 'f' float32), n_rows, n_cols.
+MAGIC = b'MTRX'
+VERSION = 1
+HEADER = struct.Struct('<4sBc2xqq')
+TYPECODES = ('q', 'd', 'f')
+# Edge of the square tiles streamed by matmul_files.
+DEFAULT_TILE_SIZE = 256
+
+
+def _write_header(f: BinaryIO, typecode: str, n_rows: int, n_cols: int) -> None:
+    f.write(HEADER.pack(MAGIC, VERSION, typecode.encode(), n_rows, n_cols))
+
+
+def read_header(f: BinaryIO) -> Tuple[str, int, int]:
+    """
+    Reads and validates the header of a matrix file.
+    :param f: A binary file positioned at the start of the file.
+    :return: A (typecode, n_rows, n_cols) tuple.
+    """
+    raw = f.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        raise ValueError("File is too short to be a matrix file.")
+    magic, version, typecode, n_rows, n_cols = HEADER.unpack(raw)
+    typecode = typecode.decode()
+    if magic != MAGIC:
+        raise ValueError("File is not a matrix file.")
+    if version != VERSION:
+        raise ValueError(f"Unsupported matrix file version {version}.")
+    if typecode not in TYPECODES or n_rows <= 0 or n_cols <= 0:
+        raise ValueError("Matrix file header is corrupt.")
+    return typecode, n_rows, n_cols
+
+
+def save(matrix: Matrix, path: str) -> None:
+    """
+    Writes a matrix to a file. Only int64, float64 and float32 matrices can be saved.
+    :param matrix: The Matrix object to save.
+    :param path: The path of the file to (over)write.
+    """
+    buf = matrix._buf
+    typecode = typecode_of(buf)
+    if typecode not in TYPECODES:
+        raise TypeError("Only matrices stored as int64, float64 or float32 can be saved.")
+    if sys.byteorder != 'little':
+        buf = array(typecode, buf)
+        buf.byteswap()
+    with open(path, 'wb') as f:
+        _write_header(f, typecode, matrix.n_rows, matrix.n_cols)
+        f.write(buf)
+
+
+def _map(path: str, writable: bool) -> Tuple[str, int, int, memoryview]:
+    """
+    Memory-maps a matrix file.
+    :return: A (typecode, n_rows, n_cols, elements) tuple, where elements is a memoryview over the mapped data.
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("Matrix files can only be memory-mapped on little-endian machines.")
+    with open(path, 'r+b' if writable else 'rb') as f:
+        typecode, n_rows, n_cols = read_header(f)
+        mapped = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_WRITE if writable else mmap_module.ACCESS_COPY)
+    size = n_rows * n_cols * array(typecode).itemsize
+    if len(mapped) != HEADER.size + size:
+        raise ValueError("Matrix file size does not match its header.")
+    return typecode, n_rows, n_cols, memoryview(mapped)[HEADER.size:].cast(typecode)
+
+
+def load(path: str, mmap: bool = True, writable: bool = False) -> Matrix:
+    """
+    Reads a matrix from a file.
+    :param path: The path of the file.
+    :param mmap: If True, the matrix is backed by a memory map of the file, so only the pages that
+        are actually touched are read. Otherwise the whole file is read into memory.
+    :param writable: For memory-mapped matrices, whether writes go to the file. If False, writes
+        only change the in-memory copy of the touched pages. Either way, writing a value that does not fit
+        the element type (e.g. a float into an int64 matrix) raises a ValueError instead of copying the matrix.
+    :return: A Matrix object.
+    """
+    if mmap:
+        typecode, n_rows, n_cols, elements = _map(path, writable)
+        return Matrix._from_buffer(elements, n_rows, n_cols)
+    with open(path, 'rb') as f:
+        typecode, n_rows, n_cols = read_header(f)
+        buf = array(typecode)
+        buf.frombytes(f.read())
+    if len(buf) != n_rows * n_cols:
+        raise ValueError("Matrix file size does not match its header.")
+    if sys.byteorder != 'little':
+        buf.byteswap()
+    return Matrix._from_buffer(buf, n_rows, n_cols)
+
+
+def _tile(elements: memoryview, n_cols: int, rows: range, cols: range) -> list:
+    """Copies the elements[rows, cols] tile of a row-major buffer into a flat list."""
+    tile = []
+    for i in rows:
+        start = i * n_cols
+        tile.extend(elements[start + cols.start:start + cols.stop])
+    return tile
+
+
+def matmul_files(a_path: str, b_path: str, out_path: str, tile_size: int = DEFAULT_TILE_SIZE) -> Matrix:
+    """
+    Multiplies two matrix files out of core and writes the product to a third one.
+    The operands are memory-mapped and streamed tile by tile; each tile of the result is accumulated
+    over the inner dimension and written before moving on, so memory use is a few tiles.
+    :param a_path: The file of the left operand.
+    :param b_path: The file of the right operand.
+    :param out_path: The file to (over)write with the product.
+    :param tile_size: The edge of the square tiles.
+    :return: The product, memory-mapped from out_path.
+    """
+    if tile_size <= 0:
+        raise ValueError("Tile size must be a positive integer.")
+    a_typecode, n, m, a = _map(a_path, False)
+    b_typecode, b_rows, p, b = _map(b_path, False)
+    if m != b_rows:
+        raise ValueError(
+            f"Number of columns in the first matrix ({m}) must equal number of rows in the second matrix ({b_rows}).")
+    typecode = promote(a_typecode, b_typecode)
+    with open(out_path, 'wb') as f:
+        _write_header(f, typecode, n, p)
+        f.truncate(HEADER.size + n * p * array(typecode).itemsize)
+    _, _, _, out = _map(out_path, True)
+    for i0 in range(0, n, tile_size):
+        rows = range(i0, min(i0 + tile_size, n))
+        for j0 in range(0, p, tile_size):
+            cols = range(j0, min(j0 + tile_size, p))
+            acc = [0] * (len(rows) * len(cols))
+            for k0 in range(0, m, tile_size):
+                inner = range(k0, min(k0 + tile_size, m))
+                product = matmul_naive(_tile(a, m, rows, inner), _tile(b, p, inner, cols), len(rows), len(inner), len(cols))
+                acc = [x + y for x, y in zip(acc, product)]
+            try:
+                values = array(typecode, acc)
+            except OverflowError:
+                raise OverflowError("Matrix product does not fit in int64.") from None
+            for offset, i in enumerate(rows):
+                start = i * p + j0
+                out[start:start + len(cols)] = values[offset * len(cols):(offset + 1) * len(cols)]
+    out.obj.flush()
+    return Matrix._from_buffer(out, n, p)
@@ -0,0 +1,113 @@
+import sys
+from array import array
+from numbers import Number
+from typing import Dict, Optional
+
+from main.objects.matrix import Matrix
+from main.objects.storage import pack, typecode_of
+
+# Buffer formats that are shared as is: 8-byte signed integers become int64 storage, doubles float64
+# storage and single-precision floats float32 storage.
+_SHARED_FORMATS = {('q', 8): 'q', ('l', 8): 'q', ('d', 8): 'd', ('f', 4): 'f'}
+_TYPESTRS = {'q': 'i8', 'd': 'f8', 'f': 'f4'}
+_BYTEORDER = '<' if sys.byteorder == 'little' else '>'
+
+
+def _format(view: memoryview) -> str:
+    """Returns the format of a buffer without a native byte order prefix."""
+    fmt = view.format
+    return fmt[1:] if len(fmt) == 2 and fmt[0] in '@=' + _BYTEORDER else fmt
+
+
+def from_buffer(obj, n_rows: Optional[int] = None, n_cols: Optional[int] = None) -> Matrix:
+    """
+    Creates a matrix from any object supporting the buffer protocol (array.array, memoryview, bytes, NumPy arrays...).
+    C-contiguous int64, float64 and float32 buffers are shared without copying, so writes to the matrix
+    go to obj and the other way around; other layouts and element types are copied.
+    :param obj: The object exporting the buffer.
+    :param n_rows: Number of rows, taken from the buffer shape if it is 2-dimensional.
+    :param n_cols: Number of columns, taken from the buffer shape if it is 2-dimensional.
+    :return: A Matrix object.
+    """
+    view = memoryview(obj)
+    if n_rows is None or n_cols is None:
+        if view.ndim != 2:
+            raise ValueError("Dimensions must be given for buffers that are not 2-dimensional.")
+        n_rows, n_cols = view.shape
+    if n_rows <= 0 or n_cols <= 0:
+        raise ValueError("Matrix cannot be empty.")
+    if view.nbytes != n_rows * n_cols * view.itemsize:
+        raise ValueError(f"Buffer of {view.nbytes // view.itemsize} elements cannot hold a {n_rows}x{n_cols} matrix.")
+    typecode = _SHARED_FORMATS.get((_format(view), view.itemsize))
+    if typecode is not None and view.c_contiguous:
+        return Matrix._from_buffer(view.cast('B').cast(typecode), n_rows, n_cols)
+    try:
+        values = array(_format(view), view.tobytes()).tolist()
+    except (TypeError, ValueError):
+        raise ValueError(f"Unsupported buffer format '{view.format}'.") from None
+    if not all(isinstance(value, Number) for value in values):
+        raise ValueError("Matrix elements must be Numbers.")
+    return Matrix._from_buffer(pack(values), n_rows, n_cols)
+
+
+def from_numpy(ndarray) -> Matrix:
+    """
+    Creates a matrix from a 2-dimensional NumPy array, sharing its memory when it is a C-contiguous
+    int64, float64 or float32 array. Arrays of Python objects (e.g. Fractions) are copied element by element.
+    :param ndarray: The NumPy array.
+    :return: A Matrix object.
+    """
+    if getattr(ndarray, 'ndim', None) != 2:
+        raise ValueError("Only 2-dimensional arrays can be converted to a matrix.")
+    if ndarray.dtype.kind == 'O':
+        return Matrix(ndarray.tolist())
+    if ndarray.dtype.kind not in 'iuf':
+        raise ValueError("Matrix elements must be Numbers.")
+    return from_buffer(ndarray)
+
+
+def to_numpy(matrix: Matrix, copy: bool = False):
+    """
+    Converts a matrix to a 2-dimensional NumPy array. Matrices stored as int64, float64 or float32 (views included)
+    share their memory with the array unless copy is True (the array is read-only if the matrix is frozen);
+    other matrices become arrays of Python objects.
+    Widening the matrix storage later (e.g. by writing a Fraction into it) detaches it from the array.
+    :param matrix: The Matrix object.
+    :param copy: Whether to always return an independent array.
+    :return: A numpy.ndarray.
+    """
+    import numpy
+    buf = matrix._storage.buf
+    typecode = typecode_of(buf)
+    if typecode not in _TYPESTRS:
+        return numpy.array(matrix.data, dtype=object)
+    itemsize = array(typecode).itemsize
+    ndarray = numpy.ndarray((matrix.n_rows, matrix.n_cols), dtype=_BYTEORDER + _TYPESTRS[typecode], buffer=buf,
+                            offset=matrix._offset * itemsize,
+                            strides=(matrix._row_stride * itemsize, matrix._col_stride * itemsize))
+    if copy:
+        return ndarray.copy()
+    ndarray.flags.writeable = not matrix.frozen
+    return ndarray
+
+
+def array_interface(matrix: Matrix) -> Dict:
+    """
+    Describes the memory of a matrix stored as int64, float64 or float32 with the NumPy array interface (version 3).
+    The storage buffer itself is exported, so the consumer keeps it alive.
+    :param matrix: The Matrix object.
+    :return: The __array_interface__ dict.
+    """
+    buf = matrix._storage.buf
+    typecode = typecode_of(buf)
+    if typecode not in _TYPESTRS:
+        raise AttributeError("Only matrices stored as int64, float64 or float32 expose an array interface.")
+    itemsize = array(typecode).itemsize
+    return {
+        'version': 3,
+        'shape': (matrix.n_rows, matrix.n_cols),
+        'typestr': _BYTEORDER + _TYPESTRS[typecode],
+        'data': memoryview(buf).toreadonly() if matrix.frozen else buf,
+        'offset': matrix._offset * itemsize,
+        'strides': (matrix._row_stride * itemsize, matrix._col_stride * itemsize),
+    }
@@ -0,0 +1,133 @@
+from itertools import repeat
+from numbers import Number
+from operator import mul, sub
+from typing import List, Sequence, Union
+
+from main.objects.matrix import Matrix
+from main.objects.storage import iter_chunks, pack
+
+
+class LU:
+    """
+    The LU factorization with partial pivoting of a square matrix A: the rows of A taken in the order
+    perm are L @ U, with L unit lower triangular and U upper triangular. Both are stored in one list
+    of rows, L below the diagonal and U on and above it. Factoring costs O(n^3) once, after which
+    every solve costs O(n^2) per right-hand side.
+    Elimination is row-oriented: each update of a row is a single pass over it, without per-element
+    Python work. Integer matrices give float factors, Fraction matrices exact ones.
+    """
+    __slots__ = ('n', 'perm', '_rows', '_sign', '_singular')
+
+    def __init__(self, matrix: Matrix) -> None:
+        """
+        Factors a square matrix.
+        :param matrix: The Matrix object to factor.
+        """
+        if not matrix.is_square():
+            raise ValueError(f"Matrix must be square to be factored. It is {matrix.n_rows}x{matrix.n_cols}")
+        n = matrix.n_rows
+        rows = [list(row) for row in iter_chunks(matrix._buf, n)]
+        perm = list(range(n))
+        sign, singular = 1, False
+        for k in range(n):
+            p = max(range(k, n), key=lambda i: abs(rows[i][k]))
+            pivot = rows[p][k]
+            if pivot == 0:
+                # The whole column is already zero below the diagonal.
+                singular = True
+                continue
+            if p != k:
+                rows[k], rows[p] = rows[p], rows[k]
+                perm[k], perm[p] = perm[p], perm[k]
+                sign = -sign
+            tail = rows[k][k + 1:]
+            for row in rows[k + 1:]:
+                factor = row[k] / pivot
+                row[k] = factor
+                if factor:
+                    row[k + 1:] = map(sub, row[k + 1:], map(mul, repeat(factor), tail))
+        self.n = n
+        self.perm = perm
+        self._rows = rows
+        self._sign = sign
+        self._singular = singular
+
+    @property
+    def L(self) -> Matrix:
+        """Returns the unit lower triangular factor."""
+        n = self.n
+        flat = []
+        for i, row in enumerate(self._rows):
+            flat.extend(row[:i])
+            flat.append(1)
+            flat.extend(repeat(0, n - i - 1))
+        return Matrix._from_buffer(pack(flat), n, n)
+
+    @property
+    def U(self) -> Matrix:
+        """Returns the upper triangular factor."""
+        n = self.n
+        flat = []
+        for i, row in enumerate(self._rows):
+            flat.extend(repeat(0, i))
+            flat.extend(row[i:])
+        return Matrix._from_buffer(pack(flat), n, n)
+
+    def is_singular(self) -> bool:
+        """
+        Checks if the factored matrix is singular.
+        :return: True if U has a zero on its diagonal, False otherwise.
+        """
+        return self._singular
+
+    def det(self) -> Number:
+        """
+        Computes the determinant of the factored matrix in O(n).
+        :return: The determinant.
+        """
+        det = self._sign
+        for i, row in enumerate(self._rows):
+            det *= row[i]
+        return det
+
+    def _solve_vector(self, b: Sequence[Number]) -> List[Number]:
+        """Solves A x = b for one right-hand side by forward and back substitution."""
+        rows = self._rows
+        y = []
+        for i, source in enumerate(self.perm):
+            # map stops at the end of y, i.e. after the i elements of L left of the diagonal.
+            y.append(b[source] - sum(map(mul, rows[i], y)))
+        x = [0] * self.n
+        for i in reversed(range(self.n)):
+            row = rows[i]
+            x[i] = (y[i] - sum(map(mul, row[i + 1:], x[i + 1:]))) / row[i]
+        return x
+
+    def solve(self, b: Union[Matrix, Sequence[Number]]) -> Union[Matrix, List[Number]]:
+        """
+        Solves A x = b, reusing the factorization.
+        :param b: A Matrix with n rows, one right-hand side per column, or a sequence of n numbers.
+        :return: A Matrix with the solution of each column of b, or a list for a sequence.
+        """
+        if self._singular:
+            raise ValueError("Matrix is singular.")
+        if not isinstance(b, Matrix):
+            if len(b) != self.n:
+                raise ValueError(f"Right-hand side must have {self.n} elements, got {len(b)}.")
+            return self._solve_vector(b)
+        if b.n_rows != self.n:
+            raise ValueError(f"Right-hand side must have {self.n} rows, got {b.n_rows}.")
+        columns = iter_chunks(Matrix._transpose_buffer(b._buf, b.n_rows, b.n_cols), b.n_rows)
+        solutions = [self._solve_vector(column) for column in columns]
+        flat = [x for row in zip(*solutions) for x in row]
+        return Matrix._from_buffer(pack(flat), self.n, b.n_cols)
+
+    def inverse(self) -> Matrix:
+        """
+        Computes the inverse of the factored matrix.
+        :return: A new Matrix object that is the inverse.
+        """
+        return self.solve(Matrix.identity(self.n))
+
+    def __repr__(self) -> str:
+        return f"LU({self.n}x{self.n}, perm={self.perm})"
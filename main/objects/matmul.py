@@ -0,0 +1,198 @@
+from numbers import Number
+from operator import add, mul, sub
+from typing import List, Optional
+
+from main.objects.storage import Buffer
+
+# Tile edge used by the blocked kernel when no block size is given.
+DEFAULT_BLOCK_SIZE = 64
+# Right operands with at least this many elements use the blocked kernel, which never
+# holds more than one tile of transposed columns at a time.
+BLOCKED_MIN_ELEMENTS = 512 * 512
+# Operands whose smallest dimension reaches this size may use Strassen (see choose_algorithm).
+STRASSEN_MIN_SIZE = 128
+# Strassen sub-problems at or below this size are handed to the naive kernel.
+STRASSEN_CUTOFF = 64
+
+
+def matmul_naive(a: Buffer, b: Buffer, n: int, m: int, p: int) -> List[Number]:
+    """
+    Multiplies an n x m by an m x p row-major buffer by dotting rows of a with columns of b.
+    The columns of b are transposed once up front so every dot product walks two contiguous sequences.
+    :return: The n x p product as a flat row-major list.
+    """
+    columns = [b[j::p] for j in range(p)]
+    return [
+        sum(map(mul, a[i:i + m], column))
+        for i in range(0, n * m, m) for column in columns
+    ]
+
+
+def matmul_blocked(a: Buffer, b: Buffer, n: int, m: int, p: int, block_size: Optional[int] = None) -> List[Number]:
+    """
+    Multiplies an n x m by an m x p row-major buffer tile by tile.
+    Only block_size columns of b are transposed at a time, and each tile of columns is reused
+    for block_size rows of a before moving on, so the working set stays bounded for wide operands.
+    :param block_size: The tile edge, DEFAULT_BLOCK_SIZE if None.
+    :return: The n x p product as a flat row-major list.
+    """
+    block_size = block_size or DEFAULT_BLOCK_SIZE
+    if block_size <= 0:
+        raise ValueError("Block size must be a positive integer.")
+    out = [0] * (n * p)
+    for j0 in range(0, p, block_size):
+        j1 = min(j0 + block_size, p)
+        columns = [b[j::p] for j in range(j0, j1)]
+        for i0 in range(0, n, block_size):
+            for i in range(i0, min(i0 + block_size, n)):
+                row = a[i * m:(i + 1) * m]
+                out[i * p + j0:i * p + j1] = [sum(map(mul, row, column)) for column in columns]
+    return out
+
+
+def _pad(a: Buffer, n_rows: int, n_cols: int, size: int) -> List[Number]:
+    """
+    Embeds an n_rows x n_cols buffer in the top-left corner of a size x size zero buffer.
+    """
+    padding = [0] * (size - n_cols)
+    out = []
+    for i in range(0, n_rows * n_cols, n_cols):
+        out.extend(a[i:i + n_cols])
+        out.extend(padding)
+    out.extend([0] * (size * (size - n_rows)))
+    return out
+
+
+def _crop(a: List[Number], size: int, n_rows: int, n_cols: int) -> List[Number]:
+    """
+    Extracts the top-left n_rows x n_cols corner of a size x size buffer.
+    """
+    out = []
+    for i in range(0, n_rows * size, size):
+        out.extend(a[i:i + n_cols])
+    return out
+
+
+def _quadrants(a: List[Number], size: int) -> List[List[Number]]:
+    """
+    Splits a size x size buffer (size even) into its four half-size quadrants.
+    """
+    half = size // 2
+    quadrants = [[], [], [], []]
+    for i in range(size):
+        start = i * size
+        offset = 0 if i < half else 2
+        quadrants[offset].extend(a[start:start + half])
+        quadrants[offset + 1].extend(a[start + half:start + size])
+    return quadrants
+
+
+def _strassen(a: List[Number], b: List[Number], size: int, cutoff: int) -> List[Number]:
+    """
+    Multiplies two size x size buffers with Strassen's recursion, peeling odd sizes by zero padding.
+    """
+    if size <= cutoff:
+        return matmul_naive(a, b, size, size, size)
+    if size % 2:
+        padded = size + 1
+        product = _strassen(_pad(a, size, size, padded), _pad(b, size, size, padded), padded, cutoff)
+        return _crop(product, padded, size, size)
+    half = size // 2
+    a11, a12, a21, a22 = _quadrants(a, size)
+    b11, b12, b21, b22 = _quadrants(b, size)
+
+    def plus(x, y):
+        return list(map(add, x, y))
+
+    def minus(x, y):
+        return list(map(sub, x, y))
+
+    m1 = _strassen(plus(a11, a22), plus(b11, b22), half, cutoff)
+    m2 = _strassen(plus(a21, a22), b11, half, cutoff)
+    m3 = _strassen(a11, minus(b12, b22), half, cutoff)
+    m4 = _strassen(a22, minus(b21, b11), half, cutoff)
+    m5 = _strassen(plus(a11, a12), b22, half, cutoff)
+    m6 = _strassen(minus(a21, a11), plus(b11, b12), half, cutoff)
+    m7 = _strassen(minus(a12, a22), plus(b21, b22), half, cutoff)
+
+    c11 = plus(minus(plus(m1, m4), m5), m7)
+    c12 = plus(m3, m5)
+    c21 = plus(m2, m4)
+    c22 = plus(plus(minus(m1, m2), m3), m6)
+
+    out = []
+    for i in range(0, half * half, half):
+        out.extend(c11[i:i + half])
+        out.extend(c12[i:i + half])
+    for i in range(0, half * half, half):
+        out.extend(c21[i:i + half])
+        out.extend(c22[i:i + half])
+    return out
+
+
+def matmul_strassen(a: Buffer, b: Buffer, n: int, m: int, p: int, cutoff: Optional[int] = None) -> List[Number]:
+    """
+    Multiplies an n x m by an m x p row-major buffer with Strassen's algorithm.
+    Non-square operands are zero padded to a common square size first.
+    :param cutoff: The sub-problem size handed to the naive kernel, STRASSEN_CUTOFF if None.
+    :return: The n x p product as a flat row-major list.
+    """
+    cutoff = cutoff or STRASSEN_CUTOFF
+    if cutoff <= 0:
+        raise ValueError("Strassen cutoff must be a positive integer.")
+    size = max(n, m, p)
+    if n == m == p:
+        return _strassen(list(a), list(b), size, cutoff)
+    product = _strassen(_pad(a, n, m, size), _pad(b, m, p, size), size, cutoff)
+    return _crop(product, size, n, p)
+
+
+def strassen_cost(size: int, cutoff: Optional[int] = None) -> int:
+    """
+    Estimates the multiply-adds of Strassen's recursion on size x size operands: the products of the
+    naive kernel at the leaves plus the 18 quadrant additions and subtractions of every split.
+    :param cutoff: The sub-problem size handed to the naive kernel, STRASSEN_CUTOFF if None.
+    :return: The estimated cost, comparable to the n * m * p multiply-adds of the naive kernel.
+    """
+    cutoff = cutoff or STRASSEN_CUTOFF
+    if size <= cutoff:
+        return size ** 3
+    if size % 2:
+        return strassen_cost(size + 1, cutoff)
+    half = size // 2
+    return 7 * strassen_cost(half, cutoff) + 18 * half * half
+
+
+def choose_algorithm(n: int, m: int, p: int) -> str:
+    """
+    Picks the multiplication kernel for an n x m by m x p product. Strassen pads its operands to a
+    max(n, m, p) cube, so it is only picked when that padded product still costs less than n * m * p.
+    :return: The name of the kernel in ALGORITHMS.
+    """
+    if min(n, m, p) >= STRASSEN_MIN_SIZE and strassen_cost(max(n, m, p)) < n * m * p:
+        return 'strassen'
+    if m * p >= BLOCKED_MIN_ELEMENTS:
+        return 'blocked'
+    return 'naive'
+
+
+ALGORITHMS = ('auto', 'naive', 'blocked', 'strassen')
+
+
+def matmul(a: Buffer, b: Buffer, n: int, m: int, p: int, algorithm: str = 'auto',
+           block_size: Optional[int] = None) -> List[Number]:
+    """
+    Multiplies an n x m by an m x p row-major buffer with the requested kernel.
+    :param algorithm: One of ALGORITHMS; 'auto' picks a kernel by shape (see choose_algorithm).
+    :param block_size: The tile edge for 'blocked', or the recursion cutoff for 'strassen'.
+    :return: The n x p product as a flat row-major list.
+    """
+    if algorithm == 'auto':
+        algorithm = choose_algorithm(n, m, p)
+    if algorithm == 'naive':
+        return matmul_naive(a, b, n, m, p)
+    if algorithm == 'blocked':
+        return matmul_blocked(a, b, n, m, p, block_size)
+    if algorithm == 'strassen':
+        return matmul_strassen(a, b, n, m, p, block_size)
+    raise ValueError(f"Unknown matrix multiplication algorithm '{algorithm}'. Expected one of {', '.join(ALGORITHMS)}.")
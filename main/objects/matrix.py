@@ -1,21 +1,226 @@
+from array import array
 from numbers import Number
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from main.objects.backends import accelerated_elementwise, accelerated_matmul, accelerated_transpose
+from main.objects.cache import memoize
+from main.objects.chain import ChainPlan, Order, plan
+from main.objects.dtypes import convert, dtype_of, pack_as, result_typecode
+from main.objects.matmul import matmul
+from main.objects.parallel import parallel_elementwise, parallel_matmul, parallel_transpose, should_parallelize
+from main.objects.storage import (Buffer, Row, Storage, buffers_equal, copy_buffer, empty_like, fits, iter_chunks,
+                                  pack, typecode_of)
 
 
 class Matrix:
-    def __init__(self, data: List[List[Number]]) -> None:
+    __slots__ = ('_storage', '_offset', '_row_stride', '_col_stride', 'n_rows', 'n_cols', '_hash', '_lu')
+
+    def __init__(self, data: List[List[Number]], dtype: Optional[str] = None) -> None:
         """
         Initializes the Matrix object and validates the input data.
+        The elements are stored row-major in a single flat buffer (see main.objects.storage).
         :param data: A list of lists where each sublist represents a row in the matrix.
+        :param dtype: The element type, one of 'int64', 'float64', 'float32', 'fraction' and 'object'
+            (see main.objects.dtypes), or None to infer it from the elements.
         """
-        self._is_valid_data(data)
-        self.data = data
+        flat = self._validate_and_flatten(data)
+        self._storage = Storage(pack(flat) if dtype is None else convert(flat, dtype))
         self.n_rows = len(data)
         self.n_cols = len(data[0])
+        self._offset, self._row_stride, self._col_stride = 0, self.n_cols, 1
+        self._hash = None
+        self._lu = None
+
+    @classmethod
+    def _from_buffer(cls, buf: Buffer, n_rows: int, n_cols: int) -> 'Matrix':
+        """
+        Wraps an already packed, row-major buffer without copying or validating it.
+        :param buf: A flat buffer of n_rows * n_cols elements.
+        :param n_rows: Number of rows.
+        :param n_cols: Number of columns.
+        :return: A Matrix object backed by buf.
+        """
+        matrix = cls.__new__(cls)
+        matrix._storage = Storage(buf)
+        matrix.n_rows = n_rows
+        matrix.n_cols = n_cols
+        matrix._offset, matrix._row_stride, matrix._col_stride = 0, n_cols, 1
+        matrix._hash = None
+        matrix._lu = None
+        return matrix
+
+    def _view(self, offset: int, n_rows: int, n_cols: int, row_stride: int, col_stride: int) -> 'Matrix':
+        """
+        Creates a Matrix sharing this matrix's storage, where element (i, j) is read from
+        storage index offset + i * row_stride + j * col_stride.
+        :return: A Matrix object viewing the same storage.
+        """
+        view = Matrix.__new__(Matrix)
+        view._storage = self._storage
+        view.n_rows = n_rows
+        view.n_cols = n_cols
+        view._offset, view._row_stride, view._col_stride = offset, row_stride, col_stride
+        view._hash = None
+        view._lu = None
+        return view
+
+    def _is_contiguous(self) -> bool:
+        """
+        Checks if the matrix covers its whole storage in row-major order (i.e., it is not a strided view).
+        :return: True if the storage can be used as the matrix's flat buffer, False otherwise.
+        """
+        return (self._offset == 0 and self._col_stride == 1 and self._row_stride == self.n_cols
+                and len(self._storage.buf) == self.n_rows * self.n_cols)
+
+    @property
+    def _buf(self) -> Buffer:
+        """
+        Returns the elements as a flat row-major buffer: the storage itself for a contiguous matrix,
+        or a gathered copy for a strided view.
+        :return: A buffer of n_rows * n_cols elements.
+        """
+        buf = self._storage.buf
+        if self._is_contiguous():
+            return buf
+        n_rows, n_cols, offset, row_stride, col_stride = (
+            self.n_rows, self.n_cols, self._offset, self._row_stride, self._col_stride)
+        if offset == 0 and row_stride == 1 and col_stride == n_rows and len(buf) == n_rows * n_cols:
+            # The transpose of a whole contiguous matrix.
+            return self._transpose_buffer(buf, n_cols, n_rows)
+        span = col_stride * (n_cols - 1) + 1
+        rows = (buf[start:start + span:col_stride] for start in range(offset, offset + n_rows * row_stride, row_stride))
+        gathered = empty_like(buf)
+        for row in rows:
+            gathered.extend(row)
+        return gathered
+
+    @property
+    def dtype(self) -> str:
+        """
+        Returns the element type of the matrix (see main.objects.dtypes). Writing a value that does not
+        fit the element type (e.g. a Fraction into an int64 matrix) widens it to 'fraction' or 'object',
+        except for matrices backed by a file or shared buffer, which raise a ValueError instead.
+        """
+        return dtype_of(self._storage.buf)
+
+    def astype(self, dtype: str) -> 'Matrix':
+        """
+        Converts the matrix to another element type.
+        :param dtype: One of 'int64' (exact conversions only), 'float64', 'float32', 'fraction' and 'object'.
+        :return: A new Matrix object with the converted elements.
+        """
+        return Matrix._from_buffer(convert(self._buf, dtype), self.n_rows, self.n_cols)
+
+    @property
+    def data(self) -> List[List[Number]]:
+        """
+        Returns the matrix elements as a new list of lists, one list per row.
+        :return: A list of lists holding a copy of the matrix elements.
+        """
+        return [list(row) for row in iter_chunks(self._buf, self.n_cols)]
+
+    def _store(self, index: int, value: Number) -> None:
+        """
+        Writes a value into the storage. If the value does not fit the typed buffer
+        (e.g. a float written into an int matrix), the storage is widened to a plain list first,
+        for this matrix and every view sharing it. Storage mapped from a file or shared with another
+        object (a memoryview) is never widened, since later writes would silently stop reaching it.
+        :param index: The storage index to write.
+        :param value: The value to store.
+        """
+        storage = self._storage
+        storage.check_writable()
+        if not fits(storage.buf, value):
+            storage.buf = self._widen(storage.buf, value)
+        storage.buf[index] = value
+
+    @staticmethod
+    def _widen(buf: Buffer, value: Number) -> List[Number]:
+        """
+        Copies a typed buffer into a plain list, so that it can hold a value that does not fit it.
+        :param buf: The buffer to widen.
+        :param value: The value that does not fit the buffer.
+        :return: A list with the elements of buf.
+        """
+        if isinstance(buf, memoryview):
+            raise ValueError(f"{value!r} does not fit a {dtype_of(buf)} matrix backed by a file or shared buffer. "
+                             f"Use astype() or clone() to get an in-memory copy first.")
+        return list(buf)
+
+    def freeze(self) -> 'Matrix':
+        """
+        Makes the matrix immutable, so that it can be hashed and the results of matrix products,
+        transposes and powers of frozen matrices can be cached (see main.objects.cache).
+        The storage is frozen, so views sharing it are frozen too; use clone() to get a mutable copy.
+        :return: This matrix.
+        """
+        self._storage.frozen = True
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        """Returns True if the matrix cannot be modified."""
+        return self._storage.frozen
+
+    def __hash__(self) -> int:
+        """
+        Returns a hash of the dimensions and elements of a frozen matrix, computed once.
+        Mutable matrices are unhashable.
+        """
+        if not self._storage.frozen:
+            raise TypeError("unhashable type: 'Matrix' (call freeze() first)")
+        if self._hash is None:
+            self._hash = hash((self.n_rows, self.n_cols, tuple(self._buf)))
+        return self._hash
+
+    @staticmethod
+    def _validate_and_flatten(data: List[List[Number]]) -> List[Number]:
+        """
+        Validates the input data in a single pass and returns its elements flattened row-major.
+        Performs the same checks, in the same order of precedence and with the same messages,
+        as the _check_* methods used by _is_valid_data.
+        :param data: The data to be validated.
+        :return: A flat list with all elements of data.
+        """
+        if not isinstance(data, list):
+            raise ValueError("Data must be a list of lists.")
+        n_cols = len(data[0]) if data and isinstance(data[0], list) else 0
+        flat = []
+        has_ragged_rows = False
+        has_non_numeric = False
+        for row in data:
+            if not isinstance(row, list):
+                raise ValueError("Each row must be a list.")
+            if len(row) != n_cols:
+                has_ragged_rows = True
+            elif not has_non_numeric:
+                has_non_numeric = not Matrix._is_numeric_row(row)
+                flat.extend(row)
+        if n_cols == 0:
+            raise ValueError("Matrix cannot be empty.")
+        if has_ragged_rows:
+            raise ValueError("All rows must have the same length.")
+        if has_non_numeric:
+            raise ValueError("Matrix elements must be Numbers.")
+        return flat
+
+    @staticmethod
+    def _is_numeric_row(row: Iterable) -> bool:
+        """
+        Checks that every element of a row is a Number, with a cheap exact type check for ints and floats.
+        :param row: The row to check.
+        :return: True if all elements are Numbers, False otherwise.
+        """
+        for element in row:
+            if type(element) is not int and type(element) is not float and not isinstance(element, Number):
+                return False
+        return True
 
     def _is_valid_data(self, data: List[List[Number]]) -> None:
         """
-        Validates that the input data is a list of lists containing numeric values.
+        Validates that the input data is a list of lists containing numeric values, one _check_* method at a time.
+        The constructor uses the equivalent single-pass _validate_and_flatten instead; this method is kept
+        as the reference for the order of the checks and their messages.
         :param data: The data to be validated.
         """
         self._check_data_is_list(data)
@@ -24,6 +229,130 @@ class Matrix:
         self._check_rows_have_same_size(data)
         self._check_rows_elements_are_numeric(data)
 
+    def lazy(self) -> 'Expression':
+        """
+        Starts a lazily evaluated expression (see main.objects.expression).
+        Operators on the result build an expression tree, which is computed by evaluate().
+        :return: An Expression wrapping this matrix.
+        """
+        from main.objects.expression import Leaf
+        return Leaf(self)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the matrix to a binary file (see main.objects.fileformat).
+        :param path: The path of the file to (over)write.
+        """
+        from main.objects.fileformat import save
+        save(self, path)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True, writable: bool = False) -> 'Matrix':
+        """
+        Reads a matrix written by save().
+        :param path: The path of the file.
+        :param mmap: If True, the matrix is backed by a memory map of the file instead of being read into memory.
+        :param writable: For memory-mapped matrices, whether writes to the matrix go to the file.
+        :return: A Matrix object.
+        """
+        from main.objects.fileformat import load
+        return load(path, mmap, writable)
+
+    @staticmethod
+    def from_buffer(obj, n_rows: Optional[int] = None, n_cols: Optional[int] = None) -> 'Matrix':
+        """
+        Creates a matrix from an object supporting the buffer protocol, sharing its memory when it is
+        C-contiguous int64, float64 or float32 data (see main.objects.interop).
+        :param obj: The object exporting the buffer.
+        :param n_rows: Number of rows, taken from the buffer shape if it is 2-dimensional.
+        :param n_cols: Number of columns, taken from the buffer shape if it is 2-dimensional.
+        :return: A Matrix object.
+        """
+        from main.objects.interop import from_buffer
+        return from_buffer(obj, n_rows, n_cols)
+
+    @staticmethod
+    def from_numpy(ndarray) -> 'Matrix':
+        """
+        Creates a matrix from a 2-dimensional NumPy array, sharing its memory when the layout allows.
+        :param ndarray: The NumPy array.
+        :return: A Matrix object.
+        """
+        from main.objects.interop import from_numpy
+        return from_numpy(ndarray)
+
+    def to_numpy(self, copy: bool = False):
+        """
+        Converts the matrix to a NumPy array, sharing its memory when it is stored as int64, float64 or float32.
+        :param copy: Whether to always return an independent array.
+        :return: A numpy.ndarray.
+        """
+        from main.objects.interop import to_numpy
+        return to_numpy(self, copy)
+
+    def __array__(self, dtype=None, copy=None):
+        """Converts the matrix when it is passed to numpy.asarray() and similar functions."""
+        ndarray = self.to_numpy(copy=bool(copy))
+        return ndarray if dtype is None else ndarray.astype(dtype, copy=False)
+
+    @property
+    def __array_interface__(self) -> dict:
+        """Exposes the storage of int64, float64 and float32 matrices to NumPy without copying."""
+        from main.objects.interop import array_interface
+        return array_interface(self)
+
+    @staticmethod
+    def from_rows(rows: Iterable[Sequence[Number]], n_cols: Optional[int] = None) -> 'Matrix':
+        """
+        Builds a matrix from an iterable of rows (e.g. a generator), validating and packing the rows
+        as they arrive instead of materializing a list of lists first (see main.objects.streaming).
+        :param rows: An iterable of rows, each a list, tuple or array of numbers.
+        :param n_cols: The expected number of columns, taken from the first row if None.
+        :return: A Matrix object.
+        """
+        from main.objects.streaming import from_rows
+        return from_rows(rows, n_cols)
+
+    @staticmethod
+    def from_csv(source, delimiter: str = ',') -> 'Matrix':
+        """
+        Reads a matrix from a CSV file, one row at a time.
+        :param source: The path of the file, or an open text file.
+        :param delimiter: The field delimiter.
+        :return: A Matrix object.
+        """
+        from main.objects.streaming import from_rows, read_csv
+        return from_rows(read_csv(source, delimiter))
+
+    def to_csv(self, target, delimiter: str = ',') -> None:
+        """
+        Writes the matrix to a CSV file, one row at a time.
+        :param target: The path of the file to (over)write, or an open text file.
+        :param delimiter: The field delimiter.
+        """
+        from main.objects.streaming import write_csv
+        write_csv(self.iter_rows(), target, delimiter)
+
+    def iter_rows(self) -> Iterator[List[Number]]:
+        """
+        Iterates over the rows without copying the whole matrix.
+        :return: An iterator of lists, one copy per row.
+        """
+        for i in range(self.n_rows):
+            yield Row(self, self._row_start(i)).tolist()
+
+    def iter_chunks(self, k: int) -> Iterator['Matrix']:
+        """
+        Iterates over consecutive blocks of k rows (the last one may have fewer), so that element-wise
+        operations can be applied block by block.
+        :param k: The number of rows per block.
+        :return: An iterator of Matrix views over the same storage.
+        """
+        if k <= 0:
+            raise ValueError("Chunk size must be a positive integer.")
+        for start in range(0, self.n_rows, k):
+            yield self[start:start + k]
+
     def is_square(self) -> bool:
         """
         Check if the matrix is square (i.e., number of rows == number of columns).
@@ -32,12 +361,20 @@ class Matrix:
         return self.n_rows == self.n_cols
 
     @staticmethod
-    def identity(n) -> 'Matrix':
-        """Returns an identity matrix of size n x n."""
+    def identity(n, sparse: bool = False) -> Union['Matrix', 'SparseMatrix']:
+        """
+        Returns an identity matrix of size n x n.
+        :param n: Size of the identity matrix.
+        :param sparse: If True, returns a SparseMatrix (see main.objects.sparse) using O(n) memory.
+        """
         if n <= 0:
             raise ValueError("Size of the identity matrix must be a positive integer.")
-        identity_data = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
-        return Matrix(identity_data)
+        if sparse:
+            from main.objects.sparse import SparseMatrix
+            return SparseMatrix.identity(n)
+        identity_data = array('q', bytes(8 * n * n))
+        identity_data[::n + 1] = array('q', [1]) * n
+        return Matrix._from_buffer(identity_data, n, n)
 
     @staticmethod
     def zero(n_rows: int, n_cols: int) -> 'Matrix':
@@ -49,8 +386,8 @@ class Matrix:
         """
         if n_rows <= 0 or n_cols <= 0:
             raise ValueError("Number of rows and columns must be positive integers.")
-        zero_data = [[0 for _ in range(n_cols)] for _ in range(n_rows)]
-        return Matrix(zero_data)
+        zero_data = array('q', bytes(8 * n_rows * n_cols))
+        return Matrix._from_buffer(zero_data, n_rows, n_cols)
 
     @staticmethod
     def _check_data_is_list(data: List[List[Number]]) -> None:
@@ -105,17 +442,40 @@ class Matrix:
         :param other: Another matrix to add to this matrix.
         :return: A new Matrix object that is the result of the addition.
         """
-        # Step 1: Check if the matrices have the same dimensions.
-        # Hint: The number of rows and columns must be the same for both matrices.
-        if ...: # WRITE YOUR CODE HERE
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other)
+
+    def __iadd__(self, other: 'Matrix') -> 'Matrix':
+        """
+        Adds another matrix to this matrix in place (i.e., matrix += other).
+        :param other: Another matrix to add to this matrix.
+        :return: This matrix, holding the result of the addition.
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other, out=self)
+
+    def add(self, other: 'Matrix', out: Optional['Matrix'] = None) -> 'Matrix':
+        """
+        Adds two matrices element-wise.
+        :param other: Another matrix to add to this matrix.
+        :param out: A matrix of the same dimensions to write the result into, or None to create a new one.
+        :return: The Matrix object holding the result of the addition.
+        """
+        if self.n_rows != other.n_rows or self.n_cols != other.n_cols:
             raise ValueError(
                 f"Matrices must have the same dimensions to be added. One is {self.n_rows}x{self.n_cols} and the other is {other.n_rows}x{other.n_cols}")
 
-        # Step 2: Perform element-wise addition.
-        result_data = [...]
+        a, b = self._buf, other._buf
+        if should_parallelize(len(a), a, b):
+            result_data = parallel_elementwise('add', a, b, self.n_rows, self.n_cols)
+        else:
+            result_data = accelerated_elementwise('add', a, b, self.n_rows, self.n_cols)
+            if result_data is None:
+                result_data = pack_as([x + y for x, y in zip(a, b)], result_typecode(a, b))
 
-        # Step 3: Return a new Matrix object using the result_data list.
-        return Matrix(result_data)
+        return self._result(result_data, self.n_rows, self.n_cols, out)
 
     def __sub__(self, other: 'Matrix') -> 'Matrix':
         """
@@ -123,17 +483,40 @@ class Matrix:
         :param other: Another matrix to subtract from this matrix.
         :return: A new Matrix object that is the result of the subtraction.
         """
-        # Step 1: Check if the matrices have the same dimensions.
-        # Hint: The number of rows and columns must be the same for both matrices.
-        if ...: # WRITE YOUR CODE HERE
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.sub(other)
+
+    def __isub__(self, other: 'Matrix') -> 'Matrix':
+        """
+        Subtracts another matrix from this matrix in place (i.e., matrix -= other).
+        :param other: Another matrix to subtract from this matrix.
+        :return: This matrix, holding the result of the subtraction.
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.sub(other, out=self)
+
+    def sub(self, other: 'Matrix', out: Optional['Matrix'] = None) -> 'Matrix':
+        """
+        Subtracts one matrix from another element-wise.
+        :param other: Another matrix to subtract from this matrix.
+        :param out: A matrix of the same dimensions to write the result into, or None to create a new one.
+        :return: The Matrix object holding the result of the subtraction.
+        """
+        if self.n_rows != other.n_rows or self.n_cols != other.n_cols:
             raise ValueError(
                 f"Matrices must have the same dimensions to be subtracted. One is {self.n_rows}x{self.n_cols} and the other is {other.n_rows}x{other.n_cols}")
 
-        # Step 2: Perform element-wise subtraction
-        result_data = [...] # WRITE YOUR CODE HERE
+        a, b = self._buf, other._buf
+        if should_parallelize(len(a), a, b):
+            result_data = parallel_elementwise('sub', a, b, self.n_rows, self.n_cols)
+        else:
+            result_data = accelerated_elementwise('sub', a, b, self.n_rows, self.n_cols)
+            if result_data is None:
+                result_data = pack_as([x - y for x, y in zip(a, b)], result_typecode(a, b))
 
-        # Step 3: Return a new Matrix object using the result_data list.
-        return Matrix(result_data)
+        return self._result(result_data, self.n_rows, self.n_cols, out)
 
     def __mul__(self, other) -> 'Matrix':
         """
@@ -141,25 +524,55 @@ class Matrix:
         :param other: Another matrix to multiply element-wise or a scalar.
         :return: A new Matrix object that is the result of the multiplication.
         """
+        if not isinstance(other, (Matrix, Number)):
+            from main.objects.batch import MatrixBatch
+            from main.objects.expression import Expression
+            if isinstance(other, (Expression, MatrixBatch)):
+                return NotImplemented
+        return self.mul(other)
+
+    def __imul__(self, other) -> 'Matrix':
+        """
+        Multiplies this matrix in place, element-wise or by a scalar (i.e., matrix *= other).
+        :param other: Another matrix to multiply element-wise or a scalar.
+        :return: This matrix, holding the result of the multiplication.
+        """
+        if not isinstance(other, (Matrix, Number)):
+            return NotImplemented
+        return self.mul(other, out=self)
+
+    def mul(self, other, out: Optional['Matrix'] = None) -> 'Matrix':
+        """
+        Performs element-wise multiplication of two matrices, or scalar multiplication if 'other' is a number.
+        :param other: Another matrix to multiply element-wise or a scalar.
+        :param out: A matrix of the same dimensions to write the result into, or None to create a new one.
+        :return: The Matrix object holding the result of the multiplication.
+        """
         if isinstance(other, Matrix):
             # Element-wise matrix multiplication
             if self.n_rows != other.n_rows or self.n_cols != other.n_cols:
                 raise ValueError(
                     f"Matrices must have the same dimensions for element-wise multiplication. One is {self.n_rows}x{self.n_cols} and the other is {other.n_rows}x{other.n_cols}")
-            result_data = [
-                [self[i][j] * other[i][j] for j in range(self.n_cols)]
-                for i in range(self.n_rows)
-            ]
+            a, b = self._buf, other._buf
+            if should_parallelize(len(a), a, b):
+                result_data = parallel_elementwise('mul', a, b, self.n_rows, self.n_cols)
+            else:
+                result_data = accelerated_elementwise('mul', a, b, self.n_rows, self.n_cols)
+                if result_data is None:
+                    result_data = pack_as([x * y for x, y in zip(a, b)], result_typecode(a, b))
         elif isinstance(other, Number):
             # Scalar multiplication
-            result_data = [
-                [self[i][j] * other for j in range(self.n_cols)]
-                for i in range(self.n_rows)
-            ]
+            a = self._buf
+            if type(other) in (int, float) and should_parallelize(len(a), a):
+                result_data = parallel_elementwise('mul', a, other, self.n_rows, self.n_cols)
+            else:
+                result_data = accelerated_elementwise('mul', a, other, self.n_rows, self.n_cols)
+                if result_data is None:
+                    result_data = pack_as([x * other for x in a], result_typecode(a, other))
         else:
             raise TypeError("Unsupported operand type(s) for *: 'Matrix' and '{}'".format(type(other).__name__))
 
-        return Matrix(result_data)
+        return self._result(result_data, self.n_rows, self.n_cols, out)
 
     def __rmul__(self, other: Number) -> 'Matrix':
         """
@@ -175,35 +588,317 @@ class Matrix:
         :param other: Another matrix to multiply with this matrix.
         :return: A new Matrix object that is the result of the matrix multiplication.
         """
-        # Step 1: Check if the matrices can be multiplied.
-        # Hint: The number of columns in the first matrix (self) must be equal to
-        # the number of rows in the second matrix (other). If not, raise a ValueError.
-        if ...: # WRITE YOUR CODE HERE
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self._storage.frozen and other._storage.frozen:
+            return memoize('matmul', (self, other), lambda: self.matmul(other))
+        return self.matmul(other)
+
+    def __imatmul__(self, other: 'Matrix') -> 'Matrix':
+        """
+        Performs matrix multiplication in place (i.e., matrix @= other).
+        The result is written into this matrix when other is square, so the dimensions are unchanged;
+        otherwise a new Matrix object is returned.
+        :param other: Another matrix to multiply with this matrix.
+        :return: The Matrix object holding the result of the matrix multiplication.
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.matmul(other, out=self if other.is_square() else None)
+
+    def matmul(self, other: 'Matrix', algorithm: str = 'auto', block_size: Optional[int] = None,
+               out: Optional['Matrix'] = None) -> 'Matrix':
+        """
+        Performs matrix multiplication with a selectable kernel (see main.objects.matmul).
+        :param other: Another matrix to multiply with this matrix.
+        :param algorithm: 'naive', 'blocked', 'strassen', or 'auto' to pick one by shape
+            (or to use the accelerated backend, see main.objects.backends, or to split the rows
+            across worker processes, see main.objects.parallel).
+        :param block_size: The tile edge for 'blocked', or the recursion cutoff for 'strassen'.
+        :param out: A matrix with the dimensions of the product to write the result into, or None to
+            create a new one. It may be self or other: the product is complete before it is written.
+        :return: The Matrix object holding the result of the matrix multiplication.
+        """
+        if self.n_cols != other.n_rows:
             raise ValueError(
                 f"Number of columns in the first matrix ({self.n_cols}) must equal number of rows in the second matrix ({other.n_rows}).")
+        n, m, p = self.n_rows, self.n_cols, other.n_cols
+        a, b = self._buf, other._buf
+        result_data = accelerated_matmul(a, b, n, m, p) if algorithm == 'auto' else None
+        if result_data is None:
+            if algorithm == 'auto' and should_parallelize(n * m * p, a, b):
+                result_data = parallel_matmul(a, b, n, m, p)
+            else:
+                result_data = pack_as(matmul(a, b, n, m, p, algorithm, block_size), result_typecode(a, b))
+        return self._result(result_data, n, p, out)
 
-        # Step 2: Perform matrix multiplication by iterating over rows and columns.
-        # - For each row in the first matrix (self), and each column in the second matrix (other),
-        #   compute the dot product between the row and the column.
-        # - To do this, multiply corresponding elements from the row and column, and sum them up.
-        result_data = [...] # WRITE YOUR CODE HERE
+    def lu(self) -> 'LU':
+        """
+        Returns the LU factorization of a square matrix (see main.objects.lu), used to solve linear systems
+        and to compute the determinant and the inverse. The factorization is cached on the matrix until
+        the matrix (or a view sharing its storage) is modified.
+        :return: An LU object.
+        """
+        version = self._storage.version
+        if self._lu is None or self._lu[0] != version:
+            from main.objects.lu import LU
+            self._lu = (version, LU(self))
+        return self._lu[1]
 
-        # Step 3: Return a new Matrix object using the result_data list.
-        return Matrix(result_data)
+    @staticmethod
+    def plan_chain(matrices: Sequence['Matrix']) -> ChainPlan:
+        """
+        Finds the cheapest order in which to multiply a chain of matrices (see main.objects.chain).
+        :param matrices: The matrices of the chain, in order.
+        :return: A ChainPlan with the chosen parenthesization and its cost in scalar multiplications.
+        """
+        return plan([(matrix.n_rows, matrix.n_cols) for matrix in matrices])
+
+    @staticmethod
+    def multi_dot(matrices: Sequence['Matrix']) -> 'Matrix':
+        """
+        Multiplies a chain of matrices in the cheapest order, which can be much cheaper than
+        evaluating A @ B @ C @ ... from left to right when the shapes differ.
+        :param matrices: The matrices of the chain, in order.
+        :return: A new Matrix object that is the product of the chain.
+        """
+        matrices = list(matrices)
+        if len(matrices) == 1:
+            return matrices[0].clone()
+
+        def multiply(order: Order) -> 'Matrix':
+            if isinstance(order, int):
+                return matrices[order]
+            return multiply(order[0]) @ multiply(order[1])
+
+        return multiply(Matrix.plan_chain(matrices).order)
+
+    def __pow__(self, k: int) -> 'Matrix':
+        """
+        Raises a square matrix to a non-negative integer power (i.e., matrix ** k).
+        :param k: The exponent.
+        :return: A new Matrix object that is the result of the exponentiation.
+        """
+        if not isinstance(k, int):
+            return NotImplemented
+        return self.power(k)
+
+    def power(self, k: int) -> 'Matrix':
+        """
+        Raises a square matrix to a non-negative integer power by repeated squaring,
+        which takes O(log k) matrix multiplications instead of k - 1.
+        :param k: The exponent.
+        :return: A new Matrix object that is the result of the exponentiation.
+        """
+        if not self.is_square():
+            raise ValueError(f"Matrix must be square to be raised to a power. It is {self.n_rows}x{self.n_cols}")
+        if k < 0:
+            raise ValueError("Exponent must be a non-negative integer.")
+        if self._storage.frozen:
+            return memoize('power', (self,), lambda: self._power(k), k)
+        return self._power(k)
+
+    def _power(self, k: int) -> 'Matrix':
+        """
+        Computes self^k by exponentiation by squaring, without validating the operands or using the cache.
+        :param k: The non-negative exponent.
+        :return: A new Matrix object, the identity if k is 0.
+        """
+        if k == 0:
+            return Matrix.identity(self.n_rows)
+        # Multiply in the squares base = self^(2^i) for the set bits of k, starting from a copy so self is never returned.
+        base = self
+        while not k & 1:
+            base = base @ base
+            k >>= 1
+        result = base.clone()
+        k >>= 1
+        while k:
+            base = base @ base
+            if k & 1:
+                result = result @ base
+            k >>= 1
+        return result
+
+    @staticmethod
+    def _result(buf: Buffer, n_rows: int, n_cols: int, out: Optional['Matrix']) -> 'Matrix':
+        """
+        Wraps a computed buffer in a new Matrix, or copies it into the storage of out.
+        :param buf: The computed, row-major result.
+        :param n_rows: Number of rows of the result.
+        :param n_cols: Number of columns of the result.
+        :param out: The destination matrix, or None.
+        :return: The Matrix object holding the result.
+        """
+        if out is None:
+            return Matrix._from_buffer(buf, n_rows, n_cols)
+        if out.n_rows != n_rows or out.n_cols != n_cols:
+            raise ValueError(f"Output matrix must be {n_rows}x{n_cols}, got {out.n_rows}x{out.n_cols}.")
+        out._assign(buf)
+        return out
+
+    def _assign(self, buf: Buffer) -> None:
+        """
+        Overwrites all elements with the values of a buffer of the same length, reusing the
+        existing storage when the values fit it and widening it otherwise.
+        :param buf: The new row-major values.
+        """
+        self._storage.check_writable()
+        if not self._is_contiguous():
+            for i, row in enumerate(iter_chunks(buf, self.n_cols)):
+                start = self._row_start(i)
+                for j, value in enumerate(row):
+                    self._store(start + j * self._col_stride, value)
+            return
+        current = self._storage.buf
+        typecode = typecode_of(current)
+        if isinstance(current, list):
+            current[:] = buf
+        elif typecode_of(buf) == typecode:
+            current[:] = buf
+        elif all(fits(current, value) for value in buf):
+            current[:] = array(typecode, buf)
+        else:
+            self._widen(current, next(value for value in buf if not fits(current, value)))
+            self._storage.buf = buf
 
     @property
     def T(self):
-        """Returns the transpose of the matrix."""
-        transposed_data = [[self[j][i] for j in range(self.n_rows)] for i in range(self.n_cols)]
-        return Matrix(transposed_data)
+        """
+        Returns the transpose of the matrix as a view over the same storage, without copying.
+        Use copy() to get an independent matrix. For a frozen matrix, the transpose is materialized
+        once and cached instead (see main.objects.cache).
+        """
+        transposed = self._view(self._offset, self.n_cols, self.n_rows, self._col_stride, self._row_stride)
+        if self._storage.frozen:
+            return memoize('T', (self,), transposed.copy)
+        return transposed
+
+    @staticmethod
+    def _transpose_buffer(buf: Buffer, n_rows: int, n_cols: int) -> Buffer:
+        """
+        Transposes a flat row-major buffer.
+        :param buf: The n_rows x n_cols buffer to transpose.
+        :return: The n_cols x n_rows transposed buffer.
+        """
+        if should_parallelize(len(buf), buf):
+            return parallel_transpose(buf, n_rows, n_cols)
+        transposed = accelerated_transpose(buf, n_rows, n_cols)
+        if transposed is not None:
+            return transposed
+        transposed = [buf[i::n_cols] for i in range(n_cols)]
+        if isinstance(buf, list):
+            return [element for column in transposed for element in column]
+        flat = empty_like(buf)
+        for column in transposed:
+            flat.extend(column)
+        return flat
+
+    def _shares_layout(self, other: 'Matrix') -> bool:
+        """
+        Checks if two matrices read the same elements of the same storage (e.g. a matrix and itself).
+        :return: True if they are necessarily equal, False if the elements must be compared.
+        """
+        return (self._storage is other._storage and self._offset == other._offset and self.n_rows == other.n_rows
+                and self.n_cols == other.n_cols and self._row_stride == other._row_stride
+                and self._col_stride == other._col_stride)
 
     def __eq__(self, other):
         """Check if two matrices are equal."""
         if not isinstance(other, Matrix):
-            return False
+            return NotImplemented
         if self.n_rows != other.n_rows or self.n_cols != other.n_cols:
             return False
-        return all(self[i][j] == other[i][j] for i in range(self.n_rows) for j in range(self.n_cols))
+        if self._shares_layout(other):
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            # Both are frozen and already hashed.
+            return False
+        return buffers_equal(self._buf, other._buf)
+
+    def sum(self, axis: Optional[int] = None) -> Union[Number, 'Matrix']:
+        """
+        Sums the elements (see main.objects.reductions).
+        :param axis: None for the sum of all elements, 0 for a 1 x n_cols matrix of column sums,
+            1 for an n_rows x 1 matrix of row sums.
+        :return: The sum, or a matrix of sums along the axis.
+        """
+        from main.objects.reductions import total
+        return total(self, axis)
+
+    def mean(self, axis: Optional[int] = None) -> Union[Number, 'Matrix']:
+        """
+        Averages the elements.
+        :param axis: None, 0 (per column) or 1 (per row).
+        :return: The mean, or a matrix of means along the axis.
+        """
+        from main.objects.reductions import mean
+        return mean(self, axis)
+
+    def max(self, axis: Optional[int] = None) -> Union[Number, 'Matrix']:
+        """
+        Finds the largest element.
+        :param axis: None, 0 (per column) or 1 (per row).
+        :return: The maximum, or a matrix of maxima along the axis.
+        """
+        from main.objects.reductions import maximum
+        return maximum(self, axis)
+
+    def min(self, axis: Optional[int] = None) -> Union[Number, 'Matrix']:
+        """
+        Finds the smallest element.
+        :param axis: None, 0 (per column) or 1 (per row).
+        :return: The minimum, or a matrix of minima along the axis.
+        """
+        from main.objects.reductions import minimum
+        return minimum(self, axis)
+
+    def argmax(self, axis: Optional[int] = None) -> Union[Tuple[int, int], 'Matrix']:
+        """
+        Finds the position of the largest element.
+        :param axis: None for its (row, column), 0 for its row in each column, 1 for its column in each row.
+        :return: The position, or a matrix of indices along the axis.
+        """
+        from main.objects.reductions import argmax
+        return argmax(self, axis)
+
+    def argmin(self, axis: Optional[int] = None) -> Union[Tuple[int, int], 'Matrix']:
+        """
+        Finds the position of the smallest element.
+        :param axis: None for its (row, column), 0 for its row in each column, 1 for its column in each row.
+        :return: The position, or a matrix of indices along the axis.
+        """
+        from main.objects.reductions import argmin
+        return argmin(self, axis)
+
+    def norm(self, ord: Union[str, float] = 'fro') -> float:
+        """
+        Computes a matrix norm.
+        :param ord: 'fro' (Frobenius), 1 / -1 (largest / smallest absolute column sum)
+            or math.inf / -math.inf (largest / smallest absolute row sum).
+        :return: The norm.
+        """
+        from main.objects.reductions import norm
+        return norm(self, ord)
+
+    def trace(self) -> Number:
+        """
+        Sums the diagonal of a square matrix.
+        :return: The trace.
+        """
+        from main.objects.reductions import trace
+        return trace(self)
+
+    def allclose(self, other: 'Matrix', rtol: float = 1e-05, atol: float = 1e-08) -> bool:
+        """
+        Checks if two matrices are element-wise equal within a tolerance: |a - b| <= atol + rtol * |b|.
+        :param other: The matrix to compare with.
+        :param rtol: The relative tolerance.
+        :param atol: The absolute tolerance.
+        :return: True if the matrices have the same dimensions and all elements are close, False otherwise.
+        """
+        from main.objects.reductions import allclose
+        return allclose(self, other, rtol, atol)
 
     def __repr__(self) -> str:
         """
@@ -212,28 +907,102 @@ class Matrix:
         """
         return f"Matrix({self.data})"
 
-    def __getitem__(self, idx: int) -> List[Number]:
+    def _row_start(self, idx: int) -> int:
         """
-        Allows access to a specific row using matrix[row].
-        :param idx: The row index to access.
-        :return: The row at the specified index.
+        Translates a row index into the storage index of the first element of that row.
+        :param idx: The row index, negative values count from the end.
+        :return: The index into the storage.
         """
-        return self.data[idx]
+        if idx < 0:
+            idx += self.n_rows
+        if not 0 <= idx < self.n_rows:
+            raise IndexError("Matrix row index out of range.")
+        return self._offset + idx * self._row_stride
 
-    def __setitem__(self, idx: int, row: List[Number]) -> None:
-        """
-        Allows setting a specific row using matrix[row] = new_row.
-        :param idx: The row index to modify.
-        :param row: The new row data to set at the specified index.
+    @staticmethod
+    def _span(idx: Union[int, slice], size: int) -> Tuple[int, int, int]:
+        """
+        Resolves a row or column index or slice against a dimension.
+        :param idx: An index or a slice with a positive step.
+        :param size: The size of the dimension.
+        :return: A (start, count, step) tuple.
+        """
+        if not isinstance(idx, slice):
+            if idx < 0:
+                idx += size
+            if not 0 <= idx < size:
+                raise IndexError("Matrix index out of range.")
+            return idx, 1, 1
+        start, stop, step = idx.indices(size)
+        if step < 0:
+            raise ValueError("Matrix slices must have a positive step.")
+        count = len(range(start, stop, step))
+        if count == 0:
+            raise ValueError("Matrix cannot be empty.")
+        return start, count, step
+
+    def __getitem__(self, idx: Union[int, slice, Tuple[Union[int, slice], Union[int, slice]]]) -> Union[Row, 'Matrix', Number]:
         """
+        Allows access to a specific row using matrix[row].
+        The row is a live view, so matrix[row][col] = value modifies the matrix.
+        matrix[row, col] returns a single element, and slicing (matrix[r0:r1] or matrix[r0:r1, c0:c1])
+        returns a submatrix that is a view over the same storage.
+        :param idx: The row index, a slice of rows, or a (row, column) pair of indices or slices.
+        :return: The row, element or submatrix view at the specified index.
+        """
+        if isinstance(idx, tuple):
+            row_idx, col_idx = idx
+            if not isinstance(row_idx, slice) and not isinstance(col_idx, slice):
+                return self[row_idx][col_idx]
+        elif isinstance(idx, slice):
+            row_idx, col_idx = idx, slice(None)
+        else:
+            return Row(self, self._row_start(idx))
+        row_start, n_rows, row_step = self._span(row_idx, self.n_rows)
+        col_start, n_cols, col_step = self._span(col_idx, self.n_cols)
+        offset = self._offset + row_start * self._row_stride + col_start * self._col_stride
+        return self._view(offset, n_rows, n_cols, self._row_stride * row_step, self._col_stride * col_step)
+
+    def __setitem__(self, idx: Union[int, Tuple[int, int]], row: List[Number]) -> None:
+        """
+        Allows setting a specific row using matrix[row] = new_row, or an element using matrix[row, col] = value.
+        :param idx: The row index to modify, or a (row, column) pair.
+        :param row: The new row data to set at the specified index, or the new element.
+        """
+        if isinstance(idx, tuple):
+            row_idx, col_idx = idx
+            self[row_idx][col_idx] = row
+            return
+        if isinstance(idx, slice):
+            raise TypeError("Matrix rows must be assigned one at a time.")
         if len(row) != self.n_cols:
             raise ValueError(f"Row must have exactly {self.n_cols} elements.")
-        self.data[idx] = row
+        target = self[idx]
+        for col_idx, value in enumerate(list(row)):
+            target[col_idx] = value
+
+    def col(self, idx: int) -> 'Matrix':
+        """
+        Returns a column as an n_rows x 1 matrix that is a view over the same storage.
+        :param idx: The column index.
+        :return: The column view.
+        """
+        return self[:, idx]
 
     def clone(self) -> 'Matrix':
         """
         Creates and returns a deep copy (clone) of the matrix.
+        For views the result is a new, contiguous matrix independent of the viewed storage.
         :return: A new Matrix object that is a clone of this matrix.
         """
-        cloned_data = [row[:] for row in self.data]  # Create a deep copy of the data
-        return Matrix(cloned_data)
\ No newline at end of file
+        buf = self._buf
+        if self._is_contiguous():
+            buf = copy_buffer(buf)  # Single bulk copy of the buffer
+        return Matrix._from_buffer(buf, self.n_rows, self.n_cols)
+
+    def copy(self) -> 'Matrix':
+        """
+        Returns an independent, contiguous copy of the matrix (or view). Same as clone().
+        :return: A new Matrix object.
+        """
+        return self.clone()
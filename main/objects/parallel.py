@@ -0,0 +1,243 @@
+import atexit
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from numbers import Number
+from operator import add, mul, sub
+from typing import List, Optional, Tuple, Union
+
+from main.objects.matmul import matmul_naive
+from main.objects.storage import Buffer
+
+# Operations smaller than this (in multiply-adds for matmul, elements otherwise) stay serial.
+DEFAULT_THRESHOLD = 1_000_000
+
+OPERATORS = {'add': add, 'sub': sub, 'mul': mul}
+
+_workers = 0
+_threshold = DEFAULT_THRESHOLD
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def configure(workers: Optional[int] = None, threshold: int = DEFAULT_THRESHOLD) -> None:
+    """
+    Enables or disables parallel execution of Matrix operators. Parallel execution is off by default.
+    :param workers: Number of worker processes, os.cpu_count() if None, 0 or 1 to disable.
+    :param threshold: Operations below this amount of work stay serial.
+    """
+    global _workers, _threshold
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 0 or threshold < 0:
+        raise ValueError("Number of workers and threshold must be non-negative integers.")
+    shutdown()
+    _workers = workers if workers > 1 else 0
+    _threshold = threshold
+
+
+def get_config() -> Tuple[int, int]:
+    """
+    Returns the current parallel configuration.
+    :return: A (workers, threshold) tuple, workers is 0 when parallel execution is disabled.
+    """
+    return _workers, _threshold
+
+
+@atexit.register
+def shutdown() -> None:
+    """Stops the worker processes, if any. They are started again on demand."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=_workers)
+    return _executor
+
+
+def _is_shareable(buf) -> bool:
+    return isinstance(buf, array) and buf.typecode in 'qd'
+
+
+def should_parallelize(work: int, *buffers: Buffer) -> bool:
+    """
+    Checks if an operation should be split across worker processes.
+    Only typed (int64/float64) buffers can be shared with the workers; anything else stays serial.
+    :param work: The amount of work of the operation.
+    :param buffers: The operand buffers.
+    :return: True if the operation should run in parallel, False otherwise.
+    """
+    return _workers > 1 and work >= _threshold and all(_is_shareable(buf) for buf in buffers)
+
+
+def _bands(n_rows: int) -> List[Tuple[int, int]]:
+    """Splits n_rows into one contiguous band of rows per worker."""
+    n_bands = min(_workers, n_rows)
+    size, extra = divmod(n_rows, n_bands)
+    bands, start = [], 0
+    for band in range(n_bands):
+        stop = start + size + (band < extra)
+        bands.append((start, stop))
+        start = stop
+    return bands
+
+
+def _share(buf: array) -> SharedMemory:
+    shm = SharedMemory(create=True, size=max(len(buf) * buf.itemsize, 1))
+    shm.buf[:len(buf) * buf.itemsize] = buf.tobytes()
+    return shm
+
+
+def _attach(name: str, typecode: str, length: int) -> Tuple[SharedMemory, memoryview]:
+    shm = SharedMemory(name=name)
+    return shm, shm.buf.cast(typecode)[:length]
+
+
+def _write_band(out_name: str, out_typecode: str, out_length: int, start: int, values: List[Number]) -> Optional[List[Number]]:
+    """
+    Writes a computed band into the shared output buffer.
+    :return: None if the band was written, or the band itself if it does not fit the output type.
+    """
+    shm, out = _attach(out_name, out_typecode, out_length)
+    try:
+        out[start:start + len(values)] = array(out_typecode, values)
+        return None
+    except (OverflowError, TypeError):
+        return values
+    finally:
+        out.release()
+        shm.close()
+
+
+def _matmul_band(a_spec, b_spec, out_spec, n_inner: int, n_cols: int, row_start: int, row_stop: int):
+    """Worker task: computes rows row_start:row_stop of a matrix product."""
+    a_shm, a = _attach(*a_spec)
+    b_shm, b = _attach(*b_spec)
+    try:
+        values = matmul_naive(a[row_start * n_inner:row_stop * n_inner], b, row_stop - row_start, n_inner, n_cols)
+    finally:
+        a.release(), b.release()
+        a_shm.close(), b_shm.close()
+    return _write_band(*out_spec, row_start * n_cols, values)
+
+
+def _elementwise_band(op: str, a_spec, b_spec, scalar: Number, out_spec, start: int, stop: int):
+    """Worker task: applies an elementwise operator to the flat slice start:stop."""
+    a_shm, a = _attach(*a_spec)
+    b_shm, b = _attach(*b_spec) if b_spec else (None, None)
+    try:
+        operator = OPERATORS[op]
+        if b is None:
+            values = [operator(x, scalar) for x in a[start:stop]]
+        else:
+            values = list(map(operator, a[start:stop], b[start:stop]))
+    finally:
+        a.release(), a_shm.close()
+        if b is not None:
+            b.release(), b_shm.close()
+    return _write_band(*out_spec, start, values)
+
+
+def _transpose_band(a_spec, out_spec, n_rows: int, n_cols: int, col_start: int, col_stop: int):
+    """Worker task: writes columns col_start:col_stop of the input as rows of the output."""
+    a_shm, a = _attach(*a_spec)
+    try:
+        values = []
+        for j in range(col_start, col_stop):
+            values.extend(a[j::n_cols])
+    finally:
+        a.release(), a_shm.close()
+    return _write_band(*out_spec, col_start * n_rows, values)
+
+
+def _run(out_typecode: str, out_length: int, band_starts: List[int], submit) -> Buffer:
+    """
+    Runs one task per band against a shared output buffer and collects the result.
+    :param submit: Called with the output spec, submits the tasks and returns their futures.
+    :return: The result as an array, or as a list if some band did not fit the output type.
+    """
+    out_shm = SharedMemory(create=True, size=max(out_length * array(out_typecode).itemsize, 1))
+    try:
+        futures = submit((out_shm.name, out_typecode, out_length))
+        overflows = [future.result() for future in futures]
+        result = array(out_typecode)
+        result.frombytes(out_shm.buf[:out_length * result.itemsize])
+    finally:
+        out_shm.close()
+        out_shm.unlink()
+    if any(band is not None for band in overflows):
+        result = list(result)
+        for start, band in zip(band_starts, overflows):
+            if band is not None:
+                result[start:start + len(band)] = band
+    return result
+
+
+def parallel_matmul(a: array, b: array, n: int, m: int, p: int) -> Buffer:
+    """
+    Multiplies an n x m by an m x p typed buffer, one band of output rows per worker.
+    :return: The n x p product as a flat row-major buffer.
+    """
+    out_typecode = 'd' if 'd' in (a.typecode, b.typecode) else 'q'
+    bands = _bands(n)
+    a_shm, b_shm = _share(a), _share(b)
+    try:
+        a_spec, b_spec = (a_shm.name, a.typecode, len(a)), (b_shm.name, b.typecode, len(b))
+        executor = _get_executor()
+        return _run(out_typecode, n * p, [start * p for start, _ in bands], lambda out_spec: [
+            executor.submit(_matmul_band, a_spec, b_spec, out_spec, m, p, start, stop) for start, stop in bands
+        ])
+    finally:
+        for shm in (a_shm, b_shm):
+            shm.close()
+            shm.unlink()
+
+
+def parallel_elementwise(op: str, a: array, other: Union[array, Number], n_rows: int, n_cols: int) -> Buffer:
+    """
+    Applies 'add', 'sub' or 'mul' elementwise between a typed buffer and another buffer or a scalar,
+    one band of rows per worker.
+    :return: The result as a flat row-major buffer.
+    """
+    if isinstance(other, array):
+        out_typecode = 'd' if 'd' in (a.typecode, other.typecode) else 'q'
+        scalar, shared = None, [_share(a), _share(other)]
+    else:
+        out_typecode = 'd' if a.typecode == 'd' or isinstance(other, float) else 'q'
+        scalar, shared = other, [_share(a)]
+    bands = [(start * n_cols, stop * n_cols) for start, stop in _bands(n_rows)]
+    try:
+        a_spec = (shared[0].name, a.typecode, len(a))
+        b_spec = (shared[1].name, other.typecode, len(other)) if len(shared) > 1 else None
+        executor = _get_executor()
+        return _run(out_typecode, len(a), [start for start, _ in bands], lambda out_spec: [
+            executor.submit(_elementwise_band, op, a_spec, b_spec, scalar, out_spec, start, stop)
+            for start, stop in bands
+        ])
+    finally:
+        for shm in shared:
+            shm.close()
+            shm.unlink()
+
+
+def parallel_transpose(a: array, n_rows: int, n_cols: int) -> Buffer:
+    """
+    Transposes an n_rows x n_cols typed buffer, one band of output rows per worker.
+    :return: The n_cols x n_rows transpose as a flat row-major buffer.
+    """
+    bands = _bands(n_cols)
+    a_shm = _share(a)
+    try:
+        a_spec = (a_shm.name, a.typecode, len(a))
+        executor = _get_executor()
+        return _run(a.typecode, len(a), [start * n_rows for start, _ in bands], lambda out_spec: [
+            executor.submit(_transpose_band, a_spec, out_spec, n_rows, n_cols, start, stop) for start, stop in bands
+        ])
+    finally:
+        a_shm.close()
+        a_shm.unlink()
@@ -0,0 +1,262 @@
+import functools
+import inspect
+import io
+import json
+import pstats
+from collections import Counter
+from numbers import Number
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from main.objects.cache import nbytes
+from main.objects.matrix import Matrix
+
+# (elements, estimated FLOPs, bytes allocated, operand shapes) of one call, from its arguments and result.
+Metrics = Tuple[int, int, int, str]
+
+
+def _shape(operand) -> str:
+    if isinstance(operand, Matrix):
+        return f"{operand.n_rows}x{operand.n_cols}"
+    return 'scalar' if isinstance(operand, Number) else type(operand).__name__
+
+
+def _allocated(result, *operands) -> int:
+    """Returns the size of the storage of result, unless it is shared with an operand (e.g. a view)."""
+    if not isinstance(result, Matrix) or any(result._storage is operand._storage for operand in operands):
+        return 0
+    return nbytes(result._storage.buf)
+
+
+def _size(matrix: Matrix) -> int:
+    return matrix.n_rows * matrix.n_cols
+
+
+def _construct(args, result) -> Metrics:
+    self = args[0]
+    return _size(self), 0, nbytes(self._storage.buf), _shape(self)
+
+
+def _validate(args, result) -> Metrics:
+    data = args[-1]
+    return sum(map(len, data)), 0, 0, f"{len(data)}x{len(data[0])}"
+
+
+def _elementwise(args, result) -> Metrics:
+    self, other = args[0], args[1]
+    operands = (self, other) if isinstance(other, Matrix) else (self,)
+    return _size(self), _size(self), _allocated(result, *operands), f"{_shape(self)}, {_shape(other)}"
+
+
+def _matmul(args, result) -> Metrics:
+    self, other = args[0], args[1]
+    flops = 2 * self.n_rows * self.n_cols * other.n_cols
+    return self.n_rows * other.n_cols, flops, _allocated(result, self, other), f"{_shape(self)}, {_shape(other)}"
+
+
+def _unary(args, result) -> Metrics:
+    self = args[0]
+    return _size(self), 0, _allocated(result, self), _shape(self)
+
+
+def _transpose_buffer(args, result) -> Metrics:
+    buf, n_rows, n_cols = args[-3:]
+    return len(buf), 0, nbytes(result), f"{n_rows}x{n_cols}"
+
+
+def _power(args, result) -> Metrics:
+    self, k = args[0], args[1]
+    # Exponentiation by squaring takes about 2 log2(k) products.
+    flops = 2 * self.n_rows ** 3 * 2 * max(k.bit_length() - 1, 0)
+    return _size(self), flops, _allocated(result, self), f"{_shape(self)}, k={k}"
+
+
+def _lu(args, result) -> Metrics:
+    self = args[0]
+    return _size(self), 2 * self.n_rows ** 3 // 3, 0, _shape(self)
+
+
+# Instrumented Matrix attributes: (reported name, attribute, metrics).
+OPERATORS: List[Tuple[str, str, Callable[..., Metrics]]] = [
+    ('construct', '__init__', _construct),
+    ('validate', '_validate_and_flatten', _validate),
+    ('add', 'add', _elementwise),
+    ('sub', 'sub', _elementwise),
+    ('mul', 'mul', _elementwise),
+    ('matmul', 'matmul', _matmul),
+    ('power', 'power', _power),
+    ('T', 'T', _unary),
+    ('transpose_buffer', '_transpose_buffer', _transpose_buffer),
+    ('clone', 'clone', _unary),
+    ('lu', 'lu', _lu),
+]
+
+
+class OperatorStats:
+    """Totals of the calls of one operator."""
+    __slots__ = ('calls', 'seconds', 'self_seconds', 'elements', 'flops', 'bytes', 'shapes')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+        self.elements = 0
+        self.flops = 0
+        self.bytes = 0
+        self.shapes: Counter = Counter()
+
+    def to_dict(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'seconds': self.seconds,
+            'self_seconds': self.self_seconds,
+            'elements': self.elements,
+            'flops': self.flops,
+            'bytes': self.bytes,
+            'shapes': dict(self.shapes),
+        }
+
+
+class Profile:
+    """
+    Records the calls of Matrix operators while it is active, as a context manager or between
+    enable() and disable(). seconds includes the time spent in nested operators (e.g. the transpose
+    materialized by a product of views), self_seconds excludes it.
+    Nothing is instrumented while no profile is active, so profiling costs nothing when disabled.
+    """
+
+    def __init__(self) -> None:
+        self.operators: Dict[str, OperatorStats] = {}
+        self.stats: Dict = {}
+
+    def __enter__(self) -> 'Profile':
+        return enable(self)
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        disable(self)
+
+    def record(self, name: str, seconds: float, self_seconds: float, metrics: Metrics) -> None:
+        """Adds one call of an operator to the totals."""
+        stats = self.operators.get(name)
+        if stats is None:
+            stats = self.operators[name] = OperatorStats()
+        elements, flops, allocated, shape = metrics
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.self_seconds += self_seconds
+        stats.elements += elements
+        stats.flops += flops
+        stats.bytes += allocated
+        stats.shapes[shape] += 1
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """
+        Exports the totals.
+        :return: A dict mapping each called operator to its calls, times, elements, FLOPs, bytes and shape histogram.
+        """
+        return {name: stats.to_dict() for name, stats in self.operators.items()}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """
+        Exports the totals as JSON.
+        :return: The JSON text of to_dict().
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def create_stats(self) -> None:
+        """
+        Fills self.stats in the format of cProfile, so that pstats.Stats(profile) can sort, print or dump the totals.
+        """
+        self.stats = {('~', 0, f"Matrix.{name}"): (stats.calls, stats.calls, stats.self_seconds, stats.seconds, {})
+                      for name, stats in self.operators.items()}
+
+    def summary(self, sort: str = 'cumulative') -> str:
+        """
+        Formats the totals as a pstats report.
+        :param sort: A pstats sort key, e.g. 'cumulative', 'tottime' or 'ncalls'.
+        :return: The report.
+        """
+        stream = io.StringIO()
+        pstats.Stats(self, stream=stream).sort_stats(sort).print_stats()
+        return stream.getvalue()
+
+
+_profiles: List[Profile] = []
+# Time spent in nested instrumented calls, one entry per instrumented call in progress.
+_children: List[float] = []
+_originals: Dict[str, object] = {}
+
+
+def _wrap(name: str, function: Callable, metrics: Callable[..., Metrics]) -> Callable:
+    @functools.wraps(function)
+    def instrumented(*args, **kwargs):
+        _children.append(0.0)
+        start = perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            seconds = perf_counter() - start
+            nested = _children.pop()
+            if _children:
+                _children[-1] += seconds
+        measured = metrics(args, result)
+        for profile in _profiles:
+            profile.record(name, seconds, seconds - nested, measured)
+        return result
+    return instrumented
+
+
+def _install() -> None:
+    for name, attribute, metrics in OPERATORS:
+        original = inspect.getattr_static(Matrix, attribute)
+        _originals[attribute] = original
+        if isinstance(original, staticmethod):
+            wrapped = staticmethod(_wrap(name, original.__func__, metrics))
+        elif isinstance(original, property):
+            wrapped = property(_wrap(name, original.fget, metrics), original.fset, original.fdel, original.__doc__)
+        else:
+            wrapped = _wrap(name, original, metrics)
+        setattr(Matrix, attribute, wrapped)
+
+
+def _uninstall() -> None:
+    for attribute, original in _originals.items():
+        setattr(Matrix, attribute, original)
+    _originals.clear()
+
+
+def enable(profile: Optional[Profile] = None) -> Profile:
+    """
+    Starts recording Matrix operators. Profiles can be nested; every active profile records every call.
+    :param profile: The Profile to record into, or None for a new one.
+    :return: The active Profile.
+    """
+    if profile is None:
+        profile = Profile()
+    if not _profiles:
+        _install()
+    _profiles.append(profile)
+    return profile
+
+
+def disable(profile: Optional[Profile] = None) -> Optional[Profile]:
+    """
+    Stops recording into a profile, and removes the instrumentation when no profile is active anymore.
+    :param profile: The Profile to stop, or None for the most recently enabled one.
+    :return: The stopped Profile, or None if no profile was active.
+    """
+    if not _profiles:
+        return None
+    if profile is None:
+        profile = _profiles[-1]
+    _profiles.remove(profile)
+    if not _profiles:
+        _uninstall()
+    return profile
+
+
+def profile() -> Profile:
+    """
+    Returns a new Profile, to be used as a context manager: with profile() as p: ...
+    """
+    return Profile()
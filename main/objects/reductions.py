@@ -0,0 +1,167 @@
+import math
+from array import array
+from numbers import Number
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+from main.objects.matrix import Matrix
+from main.objects.storage import Buffer, iter_chunks, pack, typecode_of
+
+# Every reduction runs over contiguous slices of the flat buffer with the C-level builtins (sum, max, min,
+# math.hypot...), so each statistic is one pass without per-element Python code. Reductions along an axis
+# keep it: axis=0 gives a 1 x n_cols matrix (one value per column), axis=1 an n_rows x 1 matrix.
+Axis = Optional[int]
+NORMS = ('fro', 1, -1, math.inf, -math.inf)
+# Elements passed to math.hypot per call by the Frobenius norm, so that only one chunk is boxed at a time.
+NORM_CHUNK_SIZE = 1024
+
+
+def _lines(matrix: Matrix, axis: Axis) -> Iterable[Buffer]:
+    """Returns the whole buffer (axis None), the columns (axis 0) or the rows (axis 1)."""
+    buf = matrix._buf
+    if axis is None:
+        return [buf]
+    if axis == 0:
+        return (buf[j::matrix.n_cols] for j in range(matrix.n_cols))
+    if axis == 1:
+        return iter_chunks(buf, matrix.n_cols)
+    raise ValueError("Axis must be None, 0 or 1.")
+
+
+def _reduce(matrix: Matrix, axis: Axis, reduction: Callable[[Buffer], Number]) -> Union[Number, Matrix]:
+    """Applies a reduction to the whole buffer, or to every column or row."""
+    values = [reduction(line) for line in _lines(matrix, axis)]
+    if axis is None:
+        return values[0]
+    if axis == 0:
+        return Matrix._from_buffer(pack(values), 1, matrix.n_cols)
+    return Matrix._from_buffer(pack(values), matrix.n_rows, 1)
+
+
+def total(matrix: Matrix, axis: Axis = None) -> Union[Number, Matrix]:
+    """
+    Sums the elements.
+    :param matrix: The Matrix object.
+    :param axis: None for the sum of all elements, 0 for the sum of each column, 1 for the sum of each row.
+    :return: The sum, or a matrix of sums along the axis.
+    """
+    return _reduce(matrix, axis, sum)
+
+
+def mean(matrix: Matrix, axis: Axis = None) -> Union[Number, Matrix]:
+    """
+    Averages the elements. Fractions give exact means, ints and floats float means.
+    :param matrix: The Matrix object.
+    :param axis: None, 0 (per column) or 1 (per row).
+    :return: The mean, or a matrix of means along the axis.
+    """
+    return _reduce(matrix, axis, lambda line: sum(line) / len(line))
+
+
+def maximum(matrix: Matrix, axis: Axis = None) -> Union[Number, Matrix]:
+    """
+    Finds the largest element.
+    :param matrix: The Matrix object.
+    :param axis: None, 0 (per column) or 1 (per row).
+    :return: The maximum, or a matrix of maxima along the axis.
+    """
+    return _reduce(matrix, axis, max)
+
+
+def minimum(matrix: Matrix, axis: Axis = None) -> Union[Number, Matrix]:
+    """
+    Finds the smallest element.
+    :param matrix: The Matrix object.
+    :param axis: None, 0 (per column) or 1 (per row).
+    :return: The minimum, or a matrix of minima along the axis.
+    """
+    return _reduce(matrix, axis, min)
+
+
+def _arg(matrix: Matrix, axis: Axis, select: Callable) -> Union[Tuple[int, int], Matrix]:
+    result = _reduce(matrix, axis, lambda line: select(range(len(line)), key=line.__getitem__))
+    return divmod(result, matrix.n_cols) if axis is None else result
+
+
+def argmax(matrix: Matrix, axis: Axis = None) -> Union[Tuple[int, int], Matrix]:
+    """
+    Finds the position of the largest element (the first one in row-major order if there are ties).
+    :param matrix: The Matrix object.
+    :param axis: None for the (row, column) of the maximum, 0 for its row in each column, 1 for its column in each row.
+    :return: The position, or a matrix of indices along the axis.
+    """
+    return _arg(matrix, axis, max)
+
+
+def argmin(matrix: Matrix, axis: Axis = None) -> Union[Tuple[int, int], Matrix]:
+    """
+    Finds the position of the smallest element (the first one in row-major order if there are ties).
+    :param matrix: The Matrix object.
+    :param axis: None for the (row, column) of the minimum, 0 for its row in each column, 1 for its column in each row.
+    :return: The position, or a matrix of indices along the axis.
+    """
+    return _arg(matrix, axis, min)
+
+
+def norm(matrix: Matrix, ord: Union[str, float] = 'fro') -> float:
+    """
+    Computes a matrix norm.
+    :param matrix: The Matrix object.
+    :param ord: 'fro' (Frobenius), 1 / -1 (largest / smallest absolute column sum)
+        or math.inf / -math.inf (largest / smallest absolute row sum).
+    :return: The norm.
+    """
+    if ord == 'fro':
+        return _frobenius(matrix._buf)
+    if ord not in NORMS:
+        raise ValueError(f"Unsupported norm order {ord!r}. Expected one of 'fro', 1, -1, inf and -inf.")
+    axis = 0 if abs(ord) == 1 else 1
+    sums = [sum(map(abs, line)) for line in _lines(matrix, axis)]
+    return max(sums) if ord > 0 else min(sums)
+
+
+def _frobenius(buf: Buffer) -> float:
+    """
+    Computes the Euclidean norm of a buffer as the hypot of the hypots of its chunks. hypot scales
+    its arguments, so squaring large elements cannot overflow.
+    """
+    if typecode_of(buf) is None:
+        # abs() turns complex elements into their magnitudes; ints beyond the float range have an infinite norm.
+        try:
+            return _frobenius(array('d', map(abs, buf)))
+        except OverflowError:
+            return math.inf
+    return math.hypot(*(math.hypot(*chunk) for chunk in iter_chunks(buf, NORM_CHUNK_SIZE)))
+
+
+def trace(matrix: Matrix) -> Number:
+    """
+    Sums the diagonal of a square matrix, read with a single strided slice of the storage (views included).
+    :param matrix: The Matrix object.
+    :return: The trace.
+    """
+    if not matrix.is_square():
+        raise ValueError(f"Matrix must be square to compute its trace. It is {matrix.n_rows}x{matrix.n_cols}")
+    step = matrix._row_stride + matrix._col_stride
+    start = matrix._offset
+    return sum(matrix._storage.buf[start:start + step * (matrix.n_rows - 1) + 1:step])
+
+
+def allclose(matrix: Matrix, other: Matrix, rtol: float = 1e-05, atol: float = 1e-08) -> bool:
+    """
+    Checks if two matrices are element-wise equal within a tolerance: |a - b| <= atol + rtol * |b|.
+    Stops at the first element that is not close.
+    :param matrix: The Matrix object.
+    :param other: The matrix to compare with.
+    :param rtol: The relative tolerance.
+    :param atol: The absolute tolerance.
+    :return: True if the matrices have the same dimensions and all elements are close, False otherwise.
+    """
+    if rtol < 0 or atol < 0:
+        raise ValueError("Tolerances must be non-negative.")
+    if matrix.n_rows != other.n_rows or matrix.n_cols != other.n_cols:
+        return False
+    if matrix._shares_layout(other):
+        return True
+    # Non-finite pairs are close only if equal: an infinite y gives an infinite tolerance, which is rejected,
+    # and an infinite x (or NaN) never falls within a finite one. x == y first also skips the arithmetic.
+    return all(x == y or abs(x - y) <= atol + rtol * abs(y) < math.inf for x, y in zip(matrix._buf, other._buf))
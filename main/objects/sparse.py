@@ -0,0 +1,293 @@
+from array import array
+from itertools import repeat
+from numbers import Number
+from operator import add, mul
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from main.objects.matrix import Matrix
+from main.objects.dtypes import pack_as, result_typecode
+from main.objects.storage import typecode_of
+
+
+class SparseMatrix:
+    """
+    A matrix stored in compressed sparse row (CSR) form: for row i, the column indices and values
+    of its non-zero elements are indices[indptr[i]:indptr[i + 1]] and values[indptr[i]:indptr[i + 1]].
+    Column indices are sorted within each row, and no zeros are stored. Memory is O(n_rows + nnz).
+    Values keep the element type of typed inputs (e.g. float32), and results follow the promotion
+    rules of Matrix operators (see main.objects.dtypes).
+    """
+    __slots__ = ('n_rows', 'n_cols', 'indptr', 'indices', 'values')
+
+    def __init__(self, n_rows: int, n_cols: int, indptr: Sequence[int], indices: Sequence[int],
+                 values: Sequence[Number]) -> None:
+        """
+        Initializes the SparseMatrix object from CSR arrays, which must already be in canonical form
+        (sorted column indices within each row, no duplicates and no explicit zeros).
+        Use from_coo to build a matrix from unordered (row, column, value) triplets.
+        :param n_rows: Number of rows.
+        :param n_cols: Number of columns.
+        :param indptr: n_rows + 1 offsets into indices and values.
+        :param indices: The column index of each stored element.
+        :param values: The value of each stored element. A typed array keeps its element type.
+        """
+        if n_rows <= 0 or n_cols <= 0:
+            raise ValueError("Number of rows and columns must be positive integers.")
+        if len(indptr) != n_rows + 1 or indptr[0] != 0 or indptr[-1] != len(indices) or len(indices) != len(values):
+            raise ValueError("CSR arrays are inconsistent with the matrix dimensions.")
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.indptr = array('q', indptr)
+        self.indices = array('q', indices)
+        self.values = pack_as(list(values), typecode_of(values))
+
+    @staticmethod
+    def from_coo(rows: Sequence[int], cols: Sequence[int], values: Sequence[Number], n_rows: int,
+                 n_cols: int) -> 'SparseMatrix':
+        """
+        Builds a sparse matrix from coordinate (COO) triplets. Duplicate coordinates are summed and zeros dropped.
+        :param rows: The row index of each element.
+        :param cols: The column index of each element.
+        :param values: The value of each element.
+        :param n_rows: Number of rows.
+        :param n_cols: Number of columns.
+        :return: A SparseMatrix object.
+        """
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError("Rows, columns and values must have the same length.")
+        if n_rows <= 0 or n_cols <= 0:
+            raise ValueError("Number of rows and columns must be positive integers.")
+        row_entries: List[Dict[int, Number]] = [{} for _ in range(n_rows)]
+        for i, j, value in zip(rows, cols, values):
+            if not (0 <= i < n_rows and 0 <= j < n_cols):
+                raise ValueError(f"Coordinate ({i}, {j}) is outside a {n_rows}x{n_cols} matrix.")
+            if not isinstance(value, Number):
+                raise ValueError("Matrix elements must be Numbers.")
+            entries = row_entries[i]
+            entries[j] = entries[j] + value if j in entries else value
+        return SparseMatrix._from_rows(row_entries, n_cols)
+
+    @staticmethod
+    def _from_rows(row_entries: List[Dict[int, Number]], n_cols: int,
+                   typecode: Optional[str] = None) -> 'SparseMatrix':
+        """
+        Builds a sparse matrix from one {column: value} dict per row, dropping zeros.
+        The values are stored with the given typecode, or with the type inferred from them if None.
+        """
+        indptr, indices, values = [0], [], []
+        for entries in row_entries:
+            for j in sorted(entries):
+                value = entries[j]
+                if value != 0:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(indices))
+        return SparseMatrix(len(row_entries), n_cols, indptr, indices, pack_as(values, typecode))
+
+    @staticmethod
+    def from_dense(matrix: Matrix) -> 'SparseMatrix':
+        """
+        Converts a dense matrix into a sparse one, keeping only its non-zero elements.
+        :param matrix: The dense Matrix object.
+        :return: A SparseMatrix object with the same elements.
+        """
+        buf, n_cols = matrix._buf, matrix.n_cols
+        indptr, indices, values = [0], [], []
+        for start in range(0, len(buf), n_cols):
+            for j, value in enumerate(buf[start:start + n_cols]):
+                if value != 0:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(indices))
+        return SparseMatrix(matrix.n_rows, n_cols, indptr, indices, pack_as(values, typecode_of(buf)))
+
+    @staticmethod
+    def identity(n: int) -> 'SparseMatrix':
+        """Returns a sparse identity matrix of size n x n."""
+        if n <= 0:
+            raise ValueError("Size of the identity matrix must be a positive integer.")
+        return SparseMatrix(n, n, range(n + 1), range(n), [1] * n)
+
+    def to_dense(self) -> Matrix:
+        """
+        Converts the sparse matrix into a dense Matrix.
+        :return: A Matrix object with the same elements.
+        """
+        flat = [self._zero()] * (self.n_rows * self.n_cols)
+        for i, j, value in self.items():
+            flat[i * self.n_cols + j] = value
+        return Matrix._from_buffer(pack_as(flat, typecode_of(self.values)), self.n_rows, self.n_cols)
+
+    def _zero(self) -> Number:
+        """Returns a zero of the same type as the stored values."""
+        return self.values[0] * 0 if len(self.values) else 0
+
+    @property
+    def nnz(self) -> int:
+        """Returns the number of stored (non-zero) elements."""
+        return len(self.values)
+
+    def _row(self, i: int) -> Tuple[Sequence[int], Sequence[Number]]:
+        """Returns the column indices and values of the non-zero elements of row i."""
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:stop], self.values[start:stop]
+
+    def items(self) -> Iterator[Tuple[int, int, Number]]:
+        """
+        Iterates over the non-zero elements in row-major order.
+        :return: An iterator of (row, column, value) triplets.
+        """
+        for i in range(self.n_rows):
+            cols, values = self._row(i)
+            for j, value in zip(cols, values):
+                yield i, j, value
+
+    def __add__(self, other: Union['SparseMatrix', Matrix]) -> Union['SparseMatrix', Matrix]:
+        """
+        Adds a sparse or dense matrix element-wise.
+        :param other: Another SparseMatrix (giving a sparse result) or a Matrix (giving a dense result).
+        :return: The result of the addition.
+        """
+        if isinstance(other, Matrix):
+            return self.to_dense() + other
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+        if self.n_rows != other.n_rows or self.n_cols != other.n_cols:
+            raise ValueError(
+                f"Matrices must have the same dimensions to be added. One is {self.n_rows}x{self.n_cols} and the other is {other.n_rows}x{other.n_cols}")
+        row_entries = []
+        for i in range(self.n_rows):
+            entries = dict(zip(*self._row(i)))
+            for j, value in zip(*other._row(i)):
+                entries[j] = entries[j] + value if j in entries else value
+            row_entries.append(entries)
+        return SparseMatrix._from_rows(row_entries, self.n_cols, result_typecode(self.values, other.values))
+
+    def __radd__(self, other: Matrix) -> Matrix:
+        if isinstance(other, Matrix):
+            return other + self.to_dense()
+        return NotImplemented
+
+    def __sub__(self, other: Union['SparseMatrix', Matrix]) -> Union['SparseMatrix', Matrix]:
+        """
+        Subtracts a sparse or dense matrix element-wise.
+        :param other: Another SparseMatrix (giving a sparse result) or a Matrix (giving a dense result).
+        :return: The result of the subtraction.
+        """
+        if isinstance(other, Matrix):
+            return self.to_dense() - other
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+        if self.n_rows != other.n_rows or self.n_cols != other.n_cols:
+            raise ValueError(
+                f"Matrices must have the same dimensions to be subtracted. One is {self.n_rows}x{self.n_cols} and the other is {other.n_rows}x{other.n_cols}")
+        return self + other * -1
+
+    def __rsub__(self, other: Matrix) -> Matrix:
+        if isinstance(other, Matrix):
+            return other - self.to_dense()
+        return NotImplemented
+
+    def __mul__(self, other: Number) -> 'SparseMatrix':
+        """
+        Performs scalar multiplication.
+        :param other: A scalar value to multiply the matrix by.
+        :return: A new SparseMatrix object that is the result of the multiplication.
+        """
+        if not isinstance(other, Number):
+            raise TypeError("Unsupported operand type(s) for *: 'SparseMatrix' and '{}'".format(type(other).__name__))
+        row_entries = [{j: value * other for j, value in zip(*self._row(i))} for i in range(self.n_rows)]
+        return SparseMatrix._from_rows(row_entries, self.n_cols, result_typecode(self.values, other))
+
+    def __rmul__(self, other: Number) -> 'SparseMatrix':
+        return self.__mul__(other)
+
+    def __matmul__(self, other: Union['SparseMatrix', Matrix]) -> Union['SparseMatrix', Matrix]:
+        """
+        Performs matrix multiplication, only visiting the non-zero elements of this matrix.
+        :param other: Another SparseMatrix (giving a sparse result) or a Matrix (giving a dense result).
+        :return: The result of the matrix multiplication.
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if self.n_cols != other.n_rows:
+            raise ValueError(
+                f"Number of columns in the first matrix ({self.n_cols}) must equal number of rows in the second matrix ({other.n_rows}).")
+        if isinstance(other, SparseMatrix):
+            # Gustavson's algorithm: row i of the product combines the rows of other selected by row i of self.
+            row_entries = []
+            for i in range(self.n_rows):
+                entries: Dict[int, Number] = {}
+                for k, value in zip(*self._row(i)):
+                    for j, other_value in zip(*other._row(k)):
+                        product = value * other_value
+                        entries[j] = entries[j] + product if j in entries else product
+                row_entries.append(entries)
+            return SparseMatrix._from_rows(row_entries, other.n_cols, result_typecode(self.values, other.values))
+        b, p = other._buf, other.n_cols
+        zero = self._zero() * b[0]
+        flat = []
+        for i in range(self.n_rows):
+            acc = [zero] * p
+            for k, value in zip(*self._row(i)):
+                acc = list(map(add, acc, map(mul, repeat(value), b[k * p:(k + 1) * p])))
+            flat.extend(acc)
+        return Matrix._from_buffer(pack_as(flat, result_typecode(self.values, b)), self.n_rows, p)
+
+    def __rmatmul__(self, other: Matrix) -> Matrix:
+        """
+        Performs dense @ sparse matrix multiplication, only visiting the non-zero elements of this matrix.
+        :param other: A dense Matrix on the left.
+        :return: A new Matrix object that is the result of the matrix multiplication.
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if other.n_cols != self.n_rows:
+            raise ValueError(
+                f"Number of columns in the first matrix ({other.n_cols}) must equal number of rows in the second matrix ({self.n_rows}).")
+        a, m, p = other._buf, other.n_cols, self.n_cols
+        zero = a[0] * self._zero()
+        rows = [self._row(k) for k in range(m)]
+        flat = []
+        for start in range(0, len(a), m):
+            acc = [zero] * p
+            for a_value, (cols, values) in zip(a[start:start + m], rows):
+                for j, value in zip(cols, values):
+                    acc[j] += a_value * value
+            flat.extend(acc)
+        return Matrix._from_buffer(pack_as(flat, result_typecode(a, self.values)), other.n_rows, p)
+
+    @property
+    def T(self) -> 'SparseMatrix':
+        """Returns the transpose of the matrix."""
+        counts = [0] * (self.n_cols + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(self.n_cols):
+            counts[j + 1] += counts[j]
+        next_free = counts[:-1]
+        indices, values = [0] * self.nnz, [0] * self.nnz
+        for i, j, value in self.items():
+            position = next_free[j]
+            indices[position], values[position] = i, value
+            next_free[j] += 1
+        return SparseMatrix(self.n_cols, self.n_rows, counts, indices, pack_as(values, typecode_of(self.values)))
+
+    def __eq__(self, other) -> bool:
+        """Check if the matrix is equal to another sparse or dense matrix."""
+        if isinstance(other, Matrix):
+            return self.n_rows == other.n_rows and self.n_cols == other.n_cols and self.to_dense() == other
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+        return (self.n_rows == other.n_rows and self.n_cols == other.n_cols and self.indptr == other.indptr
+                and self.indices == other.indices and list(self.values) == list(other.values))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """
+        Represents the matrix by its dimensions and non-zero elements.
+        :return: A string representation of the matrix.
+        """
+        entries = {(i, j): value for i, j, value in self.items()}
+        return f"SparseMatrix({self.n_rows}x{self.n_cols}, {entries})"
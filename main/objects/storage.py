@@ -0,0 +1,211 @@
+from array import array
+from numbers import Number
+from typing import Iterable, Iterator, List, Optional, Union
+
+# A memoryview is used for storage mapped from a file (see main.objects.fileformat).
+Buffer = Union[array, memoryview, List[Number]]
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+# Largest integer magnitudes that float64 and float32 slots represent exactly.
+FLOAT64_EXACT_INT = 2 ** 53
+FLOAT32_EXACT_INT = 2 ** 24
+
+
+def pack(values: List[Number]) -> Buffer:
+    """
+    Packs a flat sequence of numbers into the most compact buffer that holds them exactly.
+    Plain ints become an int64 array, plain floats a float64 array and anything else
+    (mixed types, Fractions, complex numbers, big ints) stays in a plain list.
+    :param values: The flat, row-major values to pack.
+    :return: An array('q'), an array('d') or a list holding the values.
+    """
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return array('q', values)
+        except OverflowError:
+            return list(values)
+    if types == {float}:
+        return array('d', values)
+    return list(values)
+
+
+def typecode_of(buf: Buffer) -> Optional[str]:
+    """
+    Returns the element type of a typed buffer.
+    :param buf: The buffer.
+    :return: 'q', 'd' or 'f' for typed buffers, None for plain lists.
+    """
+    if isinstance(buf, memoryview):
+        return buf.format
+    return getattr(buf, 'typecode', None)
+
+
+def empty_like(buf: Buffer) -> Buffer:
+    """
+    Returns an empty, growable buffer of the same element type.
+    :param buf: The buffer to mimic.
+    :return: An empty array of the same typecode, or an empty list.
+    """
+    typecode = typecode_of(buf)
+    return [] if typecode is None else array(typecode)
+
+
+def copy_buffer(buf: Buffer) -> Buffer:
+    """
+    Copies a buffer into memory with a single bulk copy.
+    :param buf: The buffer to copy.
+    :return: A new array or list with the same elements.
+    """
+    if isinstance(buf, memoryview):
+        copy = array(buf.format)
+        copy.frombytes(buf.cast('B'))
+        return copy
+    return buf[:]
+
+
+def fits(buf: Buffer, value: Number) -> bool:
+    """
+    Checks if a value can be stored in the buffer without changing it.
+    :param buf: The buffer that would receive the value.
+    :param value: The value to store.
+    :return: True if the value fits the buffer's element type, False otherwise.
+    """
+    typecode = typecode_of(buf)
+    if typecode is None:
+        return True
+    if typecode == 'q':
+        return type(value) is int and INT64_MIN <= value <= INT64_MAX
+    if type(value) is int:
+        exact = FLOAT32_EXACT_INT if typecode == 'f' else FLOAT64_EXACT_INT
+        return -exact <= value <= exact
+    # Floats written into a float32 buffer are rounded, as for any float32 result.
+    return type(value) is float
+
+
+def buffers_equal(a: Buffer, b: Buffer) -> bool:
+    """
+    Compares two buffers of the same length element by element.
+    :param a: The first buffer.
+    :param b: The second buffer.
+    :return: True if all elements compare equal, False otherwise.
+    """
+    if type(a) is type(b) and typecode_of(a) == typecode_of(b):
+        return a == b
+    return all(x == y for x, y in zip(a, b))
+
+
+class Storage:
+    """
+    A mutable holder of a flat buffer, shared by a Matrix and every view over it,
+    so that widening the buffer is seen by all of them.
+    version is incremented by every write made through a Matrix, and a frozen storage rejects writes.
+    digest caches the content digest of a frozen storage (see main.objects.cache), which cannot change.
+    """
+    __slots__ = ('buf', 'version', 'frozen', 'digest')
+
+    def __init__(self, buf: Buffer) -> None:
+        self.buf = buf
+        self.version = 0
+        self.frozen = False
+        self.digest: Optional[bytes] = None
+
+    def check_writable(self) -> None:
+        """
+        Raises an error if the storage is frozen, and otherwise counts the upcoming write.
+        """
+        if self.frozen:
+            raise ValueError("Matrix is frozen and cannot be modified.")
+        self.version += 1
+
+
+class Row:
+    """
+    A live view over one row of a Matrix. Reads and writes go straight to the matrix storage.
+    """
+    __slots__ = ('_matrix', '_start')
+
+    def __init__(self, matrix, start: int) -> None:
+        """
+        Initializes the row view.
+        :param matrix: The Matrix (or Matrix view) the row belongs to.
+        :param start: The storage index of the first element of the row.
+        """
+        self._matrix = matrix
+        self._start = start
+
+    def _index(self, idx: int) -> int:
+        """
+        Translates a column index into a storage index.
+        :param idx: The column index, negative values count from the end.
+        :return: The index into the matrix storage.
+        """
+        n_cols = self._matrix.n_cols
+        if idx < 0:
+            idx += n_cols
+        if not 0 <= idx < n_cols:
+            raise IndexError("Row index out of range.")
+        return self._start + idx * self._matrix._col_stride
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Number, List[Number]]:
+        """
+        Allows access to an element using row[col], or to a copy of a part of the row using a slice.
+        :param idx: The column index or slice to access.
+        :return: The element, or a list of elements for a slice.
+        """
+        if isinstance(idx, slice):
+            return self.tolist()[idx]
+        return self._matrix._storage.buf[self._index(idx)]
+
+    def __setitem__(self, idx: Union[int, slice], value: Union[Number, Iterable[Number]]) -> None:
+        """
+        Allows setting an element using row[col] = value, or a part of the row using row[start:stop] = values.
+        :param idx: The column index or slice to modify.
+        :param value: The new value, or as many values as the slice selects.
+        """
+        if isinstance(idx, slice):
+            columns = range(self._matrix.n_cols)[idx]
+            values = list(value)
+            if len(values) != len(columns):
+                raise ValueError(f"Cannot assign {len(values)} values to {len(columns)} elements of a matrix row.")
+            for column, element in zip(columns, values):
+                self._matrix._store(self._index(column), element)
+            return
+        self._matrix._store(self._index(idx), value)
+
+    def __len__(self) -> int:
+        return self._matrix.n_cols
+
+    def __iter__(self) -> Iterator[Number]:
+        matrix = self._matrix
+        stride = matrix._col_stride
+        return iter(matrix._storage.buf[self._start:self._start + stride * (matrix.n_cols - 1) + 1:stride])
+
+    def tolist(self) -> List[Number]:
+        """
+        Returns a copy of the row as a list.
+        :return: The row elements in a new list.
+        """
+        return list(self)
+
+    def __eq__(self, other) -> bool:
+        """Check if the row holds the same elements as another row or list."""
+        if not isinstance(other, (Row, list)):
+            return NotImplemented
+        return self.tolist() == list(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+
+def iter_chunks(buf: Buffer, size: int) -> Iterable[Buffer]:
+    """
+    Splits a flat buffer into consecutive slices of the given size.
+    :param buf: The buffer to split.
+    :param size: The length of every slice.
+    :return: An iterator over the slices.
+    """
+    return (buf[i:i + size] for i in range(0, len(buf), size))
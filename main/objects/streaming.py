@@ -0,0 +1,119 @@
+import csv
+import os
+from array import array
+from fractions import Fraction
+from itertools import islice
+from numbers import Number
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO, Union
+
+from main.objects.matrix import Matrix
+from main.objects.storage import Row, pack, typecode_of
+
+Source = Union[str, os.PathLike, TextIO]
+ROW_TYPES = (list, tuple, array, Row)
+
+
+def from_rows(rows: Iterable[Sequence[Number]], n_cols: Optional[int] = None) -> Matrix:
+    """
+    Builds a matrix from an iterable of rows, validating and packing each row as it arrives,
+    so the rows never have to be materialized as a list of lists. Rows are validated with the element
+    check of the Matrix constructor, and raise its messages as soon as an invalid row arrives; unlike
+    the constructor, rows may also be tuples, arrays or matrix rows.
+    :param rows: An iterable of rows, each a list, tuple, array or matrix row of numbers.
+    :param n_cols: The expected number of columns, taken from the first row if None.
+    :return: A Matrix object.
+    """
+    buf = None
+    n_rows = 0
+    for row in rows:
+        if not isinstance(row, ROW_TYPES):
+            raise ValueError("Each row must be a list, tuple, array or matrix row.")
+        if n_cols is None:
+            n_cols = len(row)
+        if n_cols == 0:
+            raise ValueError("Matrix cannot be empty.")
+        if len(row) != n_cols:
+            raise ValueError("All rows must have the same length.")
+        # Matrix rows can only hold numbers; arrays can hold characters ('u' and 'w' typecodes).
+        if not isinstance(row, Row) and not Matrix._is_numeric_row(row):
+            raise ValueError("Matrix elements must be Numbers.")
+        packed = pack(list(row))
+        if buf is None:
+            buf = packed
+        elif typecode_of(packed) == typecode_of(buf):
+            buf.extend(packed)
+        else:
+            # Same result as packing all elements at once: mixed types or overflowing ints stay in a list.
+            if not isinstance(buf, list):
+                buf = list(buf)
+            buf.extend(packed)
+        n_rows += 1
+    if buf is None:
+        raise ValueError("Matrix cannot be empty.")
+    return Matrix._from_buffer(buf, n_rows, n_cols)
+
+
+def chunks(rows: Iterable[Sequence[Number]], k: int, n_cols: Optional[int] = None) -> Iterator[Matrix]:
+    """
+    Groups a stream of rows into matrices of k rows (the last one may have fewer), so that a
+    transform can be applied chunk by chunk without holding the whole stream.
+    :param rows: An iterable of rows, as for from_rows.
+    :param k: The number of rows per chunk.
+    :param n_cols: The expected number of columns, taken from the first row if None.
+    :return: An iterator of Matrix objects.
+    """
+    if k <= 0:
+        raise ValueError("Chunk size must be a positive integer.")
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, k))
+        if not batch:
+            return
+        chunk = from_rows(batch, n_cols)
+        n_cols = chunk.n_cols
+        yield chunk
+
+
+def _parse(token: str) -> Number:
+    """Parses a CSV field as an int, a float, a Fraction or a complex number, in that order of preference."""
+    for parse in (int, float, Fraction, complex):
+        try:
+            return parse(token)
+        except ValueError:
+            pass
+    raise ValueError(f"Matrix elements must be Numbers, got '{token}'.")
+
+
+def read_csv(source: Source, delimiter: str = ',') -> Iterator[List[Number]]:
+    """
+    Reads the rows of a CSV file one at a time. Blank lines are skipped.
+    :param source: The path of the file, or an open text file.
+    :param delimiter: The field delimiter.
+    :return: An iterator of rows, each a list of numbers.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        for fields in csv.reader(source, delimiter=delimiter):
+            if fields:
+                yield [_parse(field) for field in fields]
+        return
+    with open(source, newline='') as f:
+        yield from read_csv(f, delimiter)
+
+
+def write_csv(rows: Iterable[Union[Sequence[Number], Matrix]], target: Source, delimiter: str = ',') -> None:
+    """
+    Writes rows to a CSV file one at a time.
+    :param rows: An iterable of rows or of matrices (e.g. chunks), whose rows are written in order.
+    :param target: The path of the file to (over)write, or an open text file.
+    :param delimiter: The field delimiter.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, 'w', newline='') as f:
+            write_csv(rows, f, delimiter)
+        return
+    writer = csv.writer(target, delimiter=delimiter)
+    for row in rows:
+        if isinstance(row, Matrix):
+            writer.writerows(row.iter_rows())
+        else:
+            writer.writerow(row)
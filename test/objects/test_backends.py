@@ -0,0 +1,75 @@
+from unittest import TestCase, skipUnless
+
+from main.objects import backends
+from main.objects.backends import Backend
+from main.objects.matrix import Matrix
+from main.objects.storage import pack
+
+
+class RecordingBackend(Backend):
+    """A backend computing element-wise operators in pure Python and recording the calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def elementwise(self, op, a, other, n_rows, n_cols):
+        self.calls.append(op)
+        if op != 'add':
+            return None
+        return pack([x + y for x, y in zip(a, other)])
+
+
+class TestBackends(TestCase):
+
+    def setUp(self):
+        self.previous = backends.get_config()
+        self.backend = RecordingBackend()
+        backends.register('recording', self.backend)
+        backends.configure('recording', threshold=4)
+
+    def tearDown(self):
+        backends._backends.pop('recording')
+        backends.configure(*self.previous)
+
+    def test_dispatch_above_threshold(self):
+        """Test that only operations above the threshold go to the backend."""
+        Matrix([[1, 2, 3]]) + Matrix([[1, 2, 3]])
+        self.assertEqual([], self.backend.calls)
+        self.assertEqual([[2, 4], [6, 8]], (Matrix([[1, 2], [3, 4]]) + Matrix([[1, 2], [3, 4]])).data)
+        self.assertEqual(['add'], self.backend.calls)
+
+    def test_fallback_when_declined(self):
+        """Test that operations declined by the backend run on the pure-Python kernels."""
+        A = Matrix([[1, 2], [3, 4]])
+        self.assertEqual([[1, 4], [9, 16]], (A * A).data)
+        self.assertEqual([[0, 0], [0, 0]], (A - A).data)
+        self.assertEqual(['mul', 'sub'], self.backend.calls)
+        self.assertEqual([[7, 10], [15, 22]], (A @ A).data)
+
+    def test_configure(self):
+        """Test selecting, disabling and rejecting backends."""
+        self.assertIn('recording', backends.available())
+        self.assertEqual(('recording', 4), backends.get_config())
+        backends.configure(None)
+        Matrix([[1, 2], [3, 4]]) + Matrix([[1, 2], [3, 4]])
+        self.assertEqual([], self.backend.calls)
+        with self.assertRaises(ValueError):
+            backends.configure('missing')
+        with self.assertRaises(ValueError):
+            backends.configure('recording', threshold=-1)
+
+    @skipUnless(backends.numpy, "NumPy is not installed")
+    def test_numpy_results_are_identical(self):
+        """Test that the NumPy backend gives the same values and storage as the pure-Python kernels."""
+        A = Matrix([[i - 2 * j for j in range(5)] for i in range(5)])
+        B = Matrix([[i * 0.5 + j for j in range(5)] for i in range(5)])
+        big = Matrix([[2 ** 62, 1], [1, 1]])
+        operations = [lambda: A + A, lambda: A - A, lambda: A * A, lambda: A * 3, lambda: A @ A, lambda: B + B,
+                      lambda: B * 1.5, lambda: B @ B, lambda: A.T.copy(), lambda: big + big, lambda: big @ big]
+        for operation in operations:
+            backends.configure('numpy', threshold=0)
+            result = operation()
+            backends.configure(None)
+            expected = operation()
+            self.assertEqual(expected, result)
+            self.assertEqual(type(expected._buf), type(result._buf))
@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from main.objects.batch import MatrixBatch
+from main.objects.matrix import Matrix
+
+
+class TestMatrixBatch(TestCase):
+
+    def setUp(self):
+        self.matrices = [Matrix([[i, i + 1, 2], [3, i * 2, 1], [0, 1, i]]) for i in range(4)]
+        self.others = [Matrix([[1.5, 0, i], [i, 1, 0], [2, 2, 2]]) for i in range(4)]
+        self.batch = MatrixBatch(self.matrices)
+        self.other_batch = MatrixBatch(self.others)
+        self.single = Matrix([[1, 0, 2], [0, 1, 0], [3, 0, 1]])
+
+    def assertBatchEqual(self, expected_matrices, batch):
+        self.assertIsInstance(batch, MatrixBatch)
+        self.assertEqual(expected_matrices, batch.to_matrices())
+
+    def test_round_trip(self):
+        """Test conversion to and from a list of matrices."""
+        self.assertEqual((4, 3, 3), self.batch.shape)
+        self.assertEqual(4, len(self.batch))
+        self.assertEqual(self.matrices, self.batch.to_matrices())
+        self.assertEqual(self.matrices[-1], self.batch[-1])
+
+    def test_invalid_batches(self):
+        """Test that empty batches and mixed dimensions are rejected."""
+        with self.assertRaises(ValueError):
+            MatrixBatch([])
+        with self.assertRaises(ValueError) as context:
+            MatrixBatch([Matrix([[1]]), Matrix([[1, 2]])])
+        self.assertEqual("All matrices in a batch must have the same dimensions.", str(context.exception))
+        with self.assertRaises(IndexError):
+            self.batch[4]
+
+    def test_elementwise_operators(self):
+        """Test batched +, -, * between batches and with scalars."""
+        pairs = list(zip(self.matrices, self.others))
+        self.assertBatchEqual([a + b for a, b in pairs], self.batch + self.other_batch)
+        self.assertBatchEqual([a - b for a, b in pairs], self.batch - self.other_batch)
+        self.assertBatchEqual([a * b for a, b in pairs], self.batch * self.other_batch)
+        self.assertBatchEqual([a * 2 for a in self.matrices], 2 * self.batch)
+
+    def test_broadcasting_a_matrix(self):
+        """Test that a single matrix is applied to every matrix of the batch, on either side."""
+        self.assertBatchEqual([a + self.single for a in self.matrices], self.single + self.batch)
+        self.assertBatchEqual([self.single - a for a in self.matrices], self.single - self.batch)
+        self.assertBatchEqual([a - self.single for a in self.matrices], self.batch - self.single)
+        self.assertBatchEqual([self.single * a for a in self.matrices], self.single * self.batch)
+        self.assertBatchEqual([a @ self.single for a in self.matrices], self.batch @ self.single)
+        self.assertBatchEqual([self.single @ a for a in self.matrices], self.single @ self.batch)
+
+    def test_matmul_and_transpose(self):
+        """Test batched matrix products with non-square matrices and transposes."""
+        wide = MatrixBatch([Matrix([[i, 1], [2, i], [1, 1]]) for i in range(4)])
+        self.assertBatchEqual([a @ b for a, b in zip(self.matrices, wide.to_matrices())], self.batch @ wide)
+        self.assertBatchEqual([b.T for b in wide.to_matrices()], wide.T)
+        with self.assertRaises(ValueError):
+            wide @ wide
+        with self.assertRaises(ValueError):
+            self.batch @ MatrixBatch(self.matrices[:2])
+
+    def test_equality(self):
+        """Test equality between batches."""
+        self.assertEqual(self.batch, MatrixBatch(self.matrices))
+        self.assertEqual(self.batch, self.batch.clone())
+        self.assertNotEqual(self.batch, self.other_batch)
+        self.assertNotEqual(self.batch, MatrixBatch(self.matrices[:2]))
+
+    def test_dtypes_follow_promotion_rules(self):
+        """Test that batch results have the dtype of the same Matrix operators."""
+        F = Matrix([[1, 2], [3, 4]], dtype='float32')
+        batch = MatrixBatch([F, F])
+        self.assertEqual('float32', batch[0].dtype)
+        for result in (batch + F, F - batch, batch * 2.5, batch @ F, F @ batch, batch.T):
+            self.assertEqual('float32', result[1].dtype)
+        self.assertEqual('float64', (batch + Matrix([[1, 2], [3, 4]]))[0].dtype)
+        self.assertEqual('float64', MatrixBatch([F, Matrix([[1, 2], [3, 4]])])[0].dtype)
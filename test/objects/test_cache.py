@@ -0,0 +1,114 @@
+import sys
+from fractions import Fraction
+from unittest import TestCase, mock
+
+from main.objects import cache
+from main.objects.matrix import Matrix
+
+
+class TestCache(TestCase):
+
+    def setUp(self):
+        cache.configure()
+        cache.clear()
+
+    def tearDown(self):
+        cache.configure()
+        cache.clear()
+
+    def test_products_of_frozen_matrices_are_cached(self):
+        """Test that a repeated product of frozen matrices is computed once."""
+        A = Matrix([[1, 2], [3, 4]]).freeze()
+        B = Matrix([[0, 1], [1, 0]]).freeze()
+        first = A @ B
+        self.assertIs(first, A @ B)
+        self.assertTrue(first.frozen)
+        self.assertEqual(Matrix([[2, 1], [4, 3]]), first)
+        stats = cache.get_stats()
+        self.assertEqual((1, 1, 1), (stats['hits'], stats['misses'], stats['entries']))
+
+    def test_equal_content_hits(self):
+        """Test that the cache is keyed by content, not by object."""
+        A = Matrix([[1, 2], [3, 4]]).freeze()
+        first = A.T
+        self.assertIs(first, Matrix([[1, 2], [3, 4]]).freeze().T)
+        self.assertEqual(Matrix([[1, 3], [2, 4]]), first)
+
+    def test_element_types_are_distinguished(self):
+        """Test that operands with equal values but other element types do not share results."""
+        ints = Matrix([[1, 2], [3, 4]]).freeze()
+        floats = Matrix([[1.0, 2.0], [3.0, 4.0]]).freeze()
+        self.assertEqual(hash(ints), hash(floats))
+        self.assertIsInstance((floats @ floats)[0, 0], float)
+        self.assertIsInstance((ints @ ints)[0, 0], int)
+
+    def test_hash_collisions_are_verified(self):
+        """Test that operands whose hashes collide do not share results."""
+        A, B = Matrix([[-1]]).freeze(), Matrix([[-2]]).freeze()
+        self.assertEqual(hash(A), hash(B))
+        self.assertEqual(Matrix([[1]]), A @ A)
+        self.assertEqual(Matrix([[4]]), B @ B)
+
+    def test_mutable_matrices_are_not_cached(self):
+        """Test that products involving a mutable matrix bypass the cache."""
+        A = Matrix([[1, 2], [3, 4]])
+        A @ A
+        A @ A.clone().freeze()
+        self.assertEqual(0, cache.get_stats()['misses'])
+
+    def test_budget_evicts_least_recently_used(self):
+        """Test that results are evicted, least recently used first, to stay within the budget."""
+        A, B, C = (Matrix([[i, i], [i, i]]).freeze() for i in range(1, 4))
+        cache.configure(budget=2 * 4 * 8)
+        A @ A
+        B @ B
+        A @ A
+        C @ C
+        stats = cache.get_stats()
+        self.assertEqual((1, 2, 64), (stats['evictions'], stats['entries'], stats['bytes']))
+        A @ A
+        self.assertEqual(2, cache.get_stats()['hits'])
+
+    def test_entries_do_not_keep_operands_alive(self):
+        """Test that only results count toward the budget because the operands are not retained."""
+        A = Matrix([[1, 2], [3, 4]]).freeze()
+        view = A[:1, :]
+        references = sys.getrefcount(A), sys.getrefcount(A._storage), sys.getrefcount(view)
+        first = A @ A
+        view.T
+        self.assertEqual(references, (sys.getrefcount(A), sys.getrefcount(A._storage), sys.getrefcount(view)))
+        self.assertIs(first, A @ A)
+        self.assertEqual(4 * 8 + 2 * 8, cache.get_stats()['bytes'])
+
+    def test_digest_is_computed_once_per_storage(self):
+        """Test that hits reuse the digest of frozen storage instead of rehashing the elements."""
+        A = Matrix([[Fraction(1, 2), 2], [3, 4]]).freeze()
+        with mock.patch.object(cache.hashlib, 'blake2b', wraps=cache.hashlib.blake2b) as blake2b:
+            first = A.T
+            self.assertIs(first, A.T)
+            A[:1, :].T
+            self.assertEqual(1, blake2b.call_count)
+        self.assertIsNotNone(A._storage.digest)
+
+    def test_views_with_other_layouts_do_not_share_results(self):
+        """Test that views over the same frozen storage are told apart by their layout."""
+        A = Matrix([[1, 2], [3, 4]]).freeze()
+        self.assertEqual(Matrix([[1], [2]]), A[:1, :].T)
+        self.assertEqual(Matrix([[3], [4]]), A[1:, :].T)
+        self.assertEqual(Matrix([[1, 2], [3, 4]]), A.T.T)
+
+    def test_power_is_cached(self):
+        """Test that powers of frozen matrices are cached by exponent."""
+        A = Matrix([[1, 1], [1, 0]]).freeze()
+        self.assertIs(A ** 10, A.power(10))
+        self.assertEqual(Matrix([[89, 55], [55, 34]]), A ** 10)
+        self.assertEqual(Matrix([[2, 1], [1, 1]]), A ** 2)
+
+    def test_disabled(self):
+        """Test that a zero budget keeps nothing."""
+        cache.configure(budget=0)
+        A = Matrix([[1]]).freeze()
+        self.assertIsNot(A @ A, A @ A)
+        self.assertEqual(0, cache.get_stats()['entries'])
+        with self.assertRaises(ValueError):
+            cache.configure(budget=-1)
@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from main.objects.chain import plan
+
+
+class TestChain(TestCase):
+    def test_plan_picks_cheapest_order(self):
+        """Test that the chain planner finds the cheapest parenthesization."""
+        chain = plan([(10, 100), (100, 5), (5, 50)])
+        self.assertEqual(chain.order, ((0, 1), 2))
+        self.assertEqual(chain.flops, 10 * 100 * 5 + 10 * 5 * 50)
+        self.assertEqual(chain.left_to_right_flops, chain.flops)
+        self.assertEqual(str(chain), "((A0 @ A1) @ A2)")
+
+    def test_plan_beats_left_to_right(self):
+        """Test that the planner reorders a chain that is expensive from left to right."""
+        chain = plan([(50, 10), (10, 40), (40, 30), (30, 5)])
+        self.assertEqual(chain.order, (0, (1, (2, 3))))
+        self.assertEqual(chain.flops, 40 * 30 * 5 + 10 * 40 * 5 + 50 * 10 * 5)
+        self.assertLess(chain.flops, chain.left_to_right_flops)
+
+    def test_plan_single_matrix(self):
+        """Test that a chain of one matrix costs nothing."""
+        chain = plan([(3, 4)])
+        self.assertEqual(chain.order, 0)
+        self.assertEqual(chain.flops, 0)
+
+    def test_plan_invalid(self):
+        """Test that empty and incompatible chains are rejected."""
+        with self.assertRaises(ValueError):
+            plan([])
+        with self.assertRaises(ValueError):
+            plan([(2, 3), (2, 3)])
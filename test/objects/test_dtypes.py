@@ -0,0 +1,85 @@
+from array import array
+from fractions import Fraction
+from unittest import TestCase
+
+from main.objects.dtypes import common_typecode, convert, dtype_of, pack_as, result_typecode
+from main.objects.matrix import Matrix
+
+
+class TestDtypes(TestCase):
+
+    def test_inferred_dtype(self):
+        """Test the dtype inferred from the elements."""
+        self.assertEqual('int64', Matrix([[1, 2]]).dtype)
+        self.assertEqual('float64', Matrix([[1.5, 2.5]]).dtype)
+        self.assertEqual('fraction', Matrix([[Fraction(1, 2), 2]]).dtype)
+        self.assertEqual('fraction', Matrix([[2 ** 70, 1]]).dtype)
+        self.assertEqual('object', Matrix([[1, 2.5]]).dtype)
+        self.assertEqual('object', Matrix([[1j, 2]]).dtype)
+
+    def test_explicit_dtype(self):
+        """Test converting the elements to the requested dtype at construction."""
+        A = Matrix([[1, 2], [3, 4]], dtype='float32')
+        self.assertEqual('f', A._buf.typecode)
+        self.assertEqual([[1.0, 2.0], [3.0, 4.0]], A.data)
+        self.assertEqual([[1, 2]], Matrix([[1.0, Fraction(4, 2)]], dtype='int64').data)
+        self.assertEqual([[Fraction(1, 2), 1]], Matrix([[0.5, 1]], dtype='fraction').data)
+        self.assertIsInstance(Matrix([[1, 2]], dtype='object')._buf, list)
+        with self.assertRaises(ValueError):
+            Matrix([[1.5]], dtype='int64')
+        with self.assertRaises(ValueError):
+            Matrix([[2 ** 70]], dtype='int64')
+        with self.assertRaises(ValueError):
+            Matrix([[1j]], dtype='float64')
+        with self.assertRaises(ValueError):
+            Matrix([[1]], dtype='int8')
+
+    def test_float32_rounds(self):
+        """Test that float32 storage rounds to single precision and halves the memory."""
+        A = Matrix([[0.1]], dtype='float32')
+        self.assertNotEqual(0.1, A[0, 0])
+        self.assertAlmostEqual(0.1, A[0, 0], places=7)
+        self.assertEqual(4, A._buf.itemsize)
+        A[0, 0] = 0.2
+        self.assertEqual('float32', A.dtype)
+
+    def test_astype(self):
+        """Test converting a matrix, views included, to another dtype."""
+        A = Matrix([[1, 2], [3, 4]])
+        self.assertEqual('float64', A.astype('float64').dtype)
+        self.assertEqual(Matrix([[1, 3], [2, 4]]), A.T.astype('fraction'))
+        self.assertEqual('int64', A.astype('float32').astype('int64').dtype)
+
+    def test_promotion(self):
+        """Test the dtype of results of operators on mixed dtypes."""
+        i, d = Matrix([[1, 2]]), Matrix([[1.5, 2.5]])
+        f, q = Matrix([[1, 2]], dtype='float32'), Matrix([[Fraction(1, 3), 1]])
+        for left, right, expected in ((i, i, 'int64'), (i, d, 'float64'), (f, f, 'float32'), (f, i, 'float64'),
+                                      (f, d, 'float64'), (i, q, 'fraction'), (q, q, 'fraction')):
+            self.assertEqual(expected, (left + right).dtype)
+            self.assertEqual(expected, (left * right).dtype)
+            self.assertEqual(expected, (left @ right.T).dtype)
+        self.assertEqual('float32', (f * 2.5).dtype)
+        self.assertEqual('float64', (i * 2.5).dtype)
+        self.assertEqual('fraction', (i * Fraction(1, 2)).dtype)
+        self.assertEqual('float64', (d + q).dtype)
+
+    def test_exact_paths(self):
+        """Test that int64 overflow and Fraction arithmetic stay exact."""
+        big = Matrix([[2 ** 62, 2 ** 62]])
+        self.assertEqual([[2 ** 63, 2 ** 63]], (big + big).data)
+        self.assertEqual('fraction', (big + big).dtype)
+        q = Matrix([[Fraction(1, 3), Fraction(2, 3)]])
+        self.assertEqual([[Fraction(1, 3)]], (q @ q.T - Matrix([[Fraction(2, 9)]])).data)
+
+    def test_helpers(self):
+        """Test the buffer-level helpers."""
+        self.assertEqual('float32', dtype_of(array('f')))
+        self.assertEqual('q', result_typecode(array('q'), 3))
+        self.assertIsNone(result_typecode(array('q'), Fraction(1, 2)))
+        self.assertIsNone(result_typecode([1], array('q')))
+        self.assertEqual([2 ** 64], pack_as([2 ** 64], 'q'))
+        self.assertEqual(array('d', [1.0]), convert([Fraction(1)], 'float64'))
+        self.assertEqual('f', common_typecode([array('f'), array('f'), 2, 0.5]))
+        self.assertEqual('d', common_typecode([array('q'), array('q'), 0.5]))
+        self.assertIsNone(common_typecode([array('f'), [1]]))
@@ -0,0 +1,74 @@
+from fractions import Fraction
+from unittest import TestCase
+
+from main.objects.expression import Expression
+from main.objects.matrix import Matrix
+
+
+class TestExpression(TestCase):
+
+    def setUp(self):
+        self.A = Matrix([[1, 2, 3], [4, 5, 6]])
+        self.B = Matrix([[6, 5, 4], [3, 2, 1]])
+        self.C = Matrix([[1.5, 0, 1], [0, 2.5, 1]])
+
+    def test_operators_return_expressions(self):
+        """Test that operators on a lazy matrix build expressions instead of matrices."""
+        expression = (self.A.lazy() + self.B) * 2 - self.C
+        self.assertIsInstance(expression, Expression)
+        self.assertIsInstance(self.A.lazy() @ self.B.T, Expression)
+        self.assertIsInstance(self.A * self.B.lazy(), Expression)
+        self.assertEqual((2, 3), expression.shape)
+
+    def test_fused_evaluation_matches_eager_evaluation(self):
+        """Test that a fused chain of elementwise operators gives the eager result."""
+        expression = (self.A.lazy() + self.B) * 2 - self.C
+        self.assertEqual((self.A + self.B) * 2 - self.C, expression.evaluate())
+        self.assertEqual(3 * self.A - self.A * self.B, 3 * self.A.lazy() - self.A * self.B.lazy())
+
+    def test_transposes_are_folded_into_indexing(self):
+        """Test expressions mixing transposed and non-transposed operands."""
+        D = Matrix([[1, 2], [3, 4], [5, 6]])
+        expression = (self.A.lazy().T + D) * Fraction(1, 2) - D.lazy().T.T
+        self.assertEqual((self.A.T + D) * Fraction(1, 2) - D, expression)
+        self.assertEqual(self.A, self.A.lazy().T.T.evaluate())
+        self.assertEqual(((self.A + self.B).T * 2).T, ((self.A.lazy() + self.B).T * 2).T)
+
+    def test_matmul_inside_expression(self):
+        """Test that a matrix product inside an expression is evaluated before the elementwise chain."""
+        expression = (self.A.lazy() @ self.B.T).T + Matrix.identity(2)
+        self.assertEqual((self.A @ self.B.T).T + Matrix.identity(2), expression)
+
+    def test_indexing_and_repr_evaluate(self):
+        """Test that indexing and repr evaluate the expression."""
+        expression = self.A.lazy() + self.B
+        self.assertEqual([7, 7, 7], expression[1])
+        self.assertEqual(repr(self.A + self.B), repr(expression))
+        self.assertIs(expression.evaluate(), expression.evaluate())
+
+    def test_dimension_errors(self):
+        """Test that mismatched shapes are rejected when the expression is built."""
+        with self.assertRaises(ValueError) as context:
+            self.A.lazy() + self.A.T
+        self.assertEqual("Matrices must have the same dimensions to be added. One is 2x3 and the other is 3x2",
+                         str(context.exception))
+        with self.assertRaises(ValueError):
+            self.A.lazy() @ self.B
+        with self.assertRaises(TypeError):
+            self.A.lazy() * "two"
+
+    def test_transposed_and_plain_reads_of_the_same_matrix(self):
+        """Test fusing a matrix with its own transpose, which reads one operand by rows and the other by columns."""
+        S = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        self.assertEqual(S + S.T * 3 - S, (S.lazy() + S.T * 3 - S).evaluate())
+        self.assertEqual((self.A.T + self.C.T) * 2, ((self.A.lazy() + self.C).T * 2).evaluate())
+
+    def test_result_dtype_matches_eager_evaluation(self):
+        """Test that fused expressions follow the promotion rules of the eager operators."""
+        F = Matrix([[1, 2], [3, 4]], dtype='float32')
+        I = Matrix([[1, 2], [3, 4]])
+        self.assertEqual('float32', (F.lazy() + F).evaluate().dtype)
+        self.assertEqual('float32', ((F.lazy().T + F) * 2.5).evaluate().dtype)
+        self.assertEqual('float64', (F.lazy() + I).evaluate().dtype)
+        self.assertEqual('int64', (I.lazy() * 3 - I).evaluate().dtype)
+        self.assertEqual(((F.T + F) * 2.5).data, ((F.lazy().T + F) * 2.5).evaluate().data)
@@ -0,0 +1,98 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from main.objects.fileformat import HEADER, matmul_files
+from main.objects.matrix import Matrix
+
+
+class TestFileFormat(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_save_and_load(self):
+        """Test that a matrix survives a round trip through a file, with and without mmap."""
+        A = Matrix([[1.5, 2.0, -3.0], [4.0, 5.0, 6.25]])
+        A.save(self.path('a.mtx'))
+        self.assertEqual(HEADER.size + 6 * 8, os.path.getsize(self.path('a.mtx')))
+        self.assertEqual(A, Matrix.load(self.path('a.mtx')))
+        self.assertEqual(A, Matrix.load(self.path('a.mtx'), mmap=False))
+        self.assertEqual(A.T, Matrix.load(self.path('a.mtx')).T)
+
+    def test_float32(self):
+        """Test that float32 matrices are saved with 4 bytes per element and multiplied out of core."""
+        A = Matrix([[1.5, 2.0], [-3.0, 4.25]], dtype='float32')
+        A.save(self.path('a.mtx'))
+        self.assertEqual(HEADER.size + 4 * 4, os.path.getsize(self.path('a.mtx')))
+        mapped = Matrix.load(self.path('a.mtx'))
+        self.assertEqual('float32', mapped.dtype)
+        product = matmul_files(self.path('a.mtx'), self.path('a.mtx'), self.path('b.mtx'))
+        self.assertEqual('float32', product.dtype)
+        self.assertEqual(A @ A, product)
+
+    def test_mapped_matrix_operations(self):
+        """Test that operators, views and clone work on memory-mapped matrices."""
+        A = Matrix([[1, 2], [3, 4]])
+        A.save(self.path('a.mtx'))
+        mapped = Matrix.load(self.path('a.mtx'))
+        self.assertEqual(A @ A, mapped @ mapped)
+        self.assertEqual(A + A.T, mapped + mapped.T)
+        self.assertEqual([[2], [4]], mapped.col(1).data)
+        clone = mapped.clone()
+        clone[0][0] = 10
+        self.assertEqual(1, mapped[0][0])
+
+    def test_writes_only_reach_the_file_when_writable(self):
+        """Test copy-on-write and write-through mappings."""
+        Matrix([[1, 2], [3, 4]]).save(self.path('a.mtx'))
+        private = Matrix.load(self.path('a.mtx'))
+        private[0][0] = 100
+        self.assertEqual(100, private[0][0])
+        self.assertEqual(1, Matrix.load(self.path('a.mtx'))[0][0])
+        shared = Matrix.load(self.path('a.mtx'), writable=True)
+        shared[0][0] = 100
+        del shared
+        self.assertEqual(100, Matrix.load(self.path('a.mtx'), mmap=False)[0][0])
+
+    def test_writing_a_value_that_does_not_fit_raises(self):
+        """Test that a mapped int64 matrix is not widened, so later writes still reach the file."""
+        Matrix([[1, 2], [3, 4]]).save(self.path('a.mtx'))
+        halves = Matrix([[0.5, 0.5], [0.5, 0.5]])
+        for writable in (True, False):
+            mapped = Matrix.load(self.path('a.mtx'), writable=writable)
+            with self.assertRaises(ValueError):
+                mapped[0][0] = 0.5
+            with self.assertRaises(ValueError):
+                mapped += halves
+            self.assertIsInstance(mapped._storage.buf, memoryview)
+            self.assertEqual([[1, 2], [3, 4]], mapped.data)
+        mapped = Matrix.load(self.path('a.mtx'), writable=True)
+        mapped[1][1] = 40
+        del mapped
+        self.assertEqual([[1, 2], [3, 40]], Matrix.load(self.path('a.mtx'), mmap=False).data)
+
+    def test_invalid_files(self):
+        """Test that unsupported matrices and corrupt files are rejected."""
+        with self.assertRaises(TypeError):
+            Matrix([[1, 2.5]]).save(self.path('mixed.mtx'))
+        with open(self.path('bad.mtx'), 'wb') as f:
+            f.write(b'not a matrix file at all')
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path('bad.mtx'))
+
+    def test_matmul_files(self):
+        """Test out-of-core multiplication with tiles smaller than the operands."""
+        A = Matrix([[i * 7 + j for j in range(7)] for i in range(5)])
+        B = Matrix([[float(i - j) for j in range(3)] for i in range(7)])
+        A.save(self.path('a.mtx'))
+        B.save(self.path('b.mtx'))
+        product = matmul_files(self.path('a.mtx'), self.path('b.mtx'), self.path('c.mtx'), tile_size=2)
+        self.assertEqual(A @ B, product)
+        self.assertEqual(A @ B, Matrix.load(self.path('c.mtx'), mmap=False))
+        with self.assertRaises(ValueError):
+            matmul_files(self.path('a.mtx'), self.path('a.mtx'), self.path('d.mtx'))
@@ -0,0 +1,77 @@
+from array import array
+from fractions import Fraction
+from unittest import TestCase, skipUnless
+
+from main.objects.matrix import Matrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestInterop(TestCase):
+
+    def test_from_buffer_shares_memory(self):
+        """Test that an int64 buffer is shared with the matrix without copying."""
+        values = array('q', [1, 2, 3, 4, 5, 6])
+        A = Matrix.from_buffer(values, 2, 3)
+        self.assertEqual([[1, 2, 3], [4, 5, 6]], A.data)
+        values[0] = 10
+        A[1][2] = 60
+        self.assertEqual([[10, 2, 3], [4, 5, 60]], A.data)
+        self.assertEqual(60, values[5])
+
+    def test_from_buffer_takes_shape_of_2d_buffers(self):
+        """Test that the dimensions of a 2-dimensional buffer are used."""
+        view = memoryview(array('d', [1.5, 2.5, 3.5, 4.5])).cast('B').cast('d', (2, 2))
+        self.assertEqual(Matrix([[1.5, 2.5], [3.5, 4.5]]), Matrix.from_buffer(view))
+
+    def test_from_buffer_copies_other_formats(self):
+        """Test that buffers of other element types are copied into a packed buffer."""
+        values = array('i', [1, 2, 3, 4])
+        A = Matrix.from_buffer(values, 2, 2)
+        values[0] = 10
+        self.assertEqual([[1, 2], [3, 4]], A.data)
+        self.assertEqual('q', A._buf.typecode)
+
+    def test_from_buffer_invalid(self):
+        """Test that buffers which cannot hold the matrix are rejected."""
+        with self.assertRaises(ValueError):
+            Matrix.from_buffer(array('q', [1, 2, 3]))
+        with self.assertRaises(ValueError):
+            Matrix.from_buffer(array('q', [1, 2, 3]), 2, 2)
+        with self.assertRaises(ValueError):
+            Matrix.from_buffer(array('q', [1]), 0, 1)
+
+    def test_array_interface(self):
+        """Test that the array interface describes the shared storage, views included."""
+        A = Matrix([[1, 2, 3], [4, 5, 6]])
+        interface = A.T.__array_interface__
+        self.assertEqual((3, 2), interface['shape'])
+        self.assertIs(A._storage.buf, interface['data'])
+        self.assertTrue(A.clone().freeze().__array_interface__['data'].readonly)
+        self.assertEqual((8, 24), interface['strides'])
+        self.assertEqual('f8', Matrix([[1.5]]).__array_interface__['typestr'][1:])
+        self.assertFalse(hasattr(Matrix([[Fraction(1, 2)]]), '__array_interface__'))
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_numpy_round_trip_shares_memory(self):
+        """Test that NumPy arrays and matrices share int64 and float64 memory both ways."""
+        ndarray = numpy.arange(6, dtype=numpy.int64).reshape(2, 3)
+        A = Matrix.from_numpy(ndarray)
+        ndarray[0, 0] = 7
+        self.assertEqual(7, A[0, 0])
+        B = Matrix([[1.5, 2.5], [3.5, 4.5]])
+        B_T = B.T.to_numpy()
+        B[0][1] = 9.5
+        self.assertEqual(9.5, B_T[1, 0])
+        self.assertEqual([[1.5, 3.5], [9.5, 4.5]], numpy.asarray(B.T).tolist())
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_numpy_object_arrays(self):
+        """Test that matrices of Python objects convert to and from object arrays."""
+        A = Matrix([[Fraction(1, 2), 1], [2, 3]])
+        ndarray = A.to_numpy()
+        self.assertEqual(object, ndarray.dtype)
+        self.assertEqual(A, Matrix.from_numpy(ndarray))
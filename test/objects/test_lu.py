@@ -0,0 +1,72 @@
+from fractions import Fraction
+from unittest import TestCase
+
+from main.objects.lu import LU
+from main.objects.matrix import Matrix
+
+
+class TestLU(TestCase):
+
+    def setUp(self):
+        self.A = Matrix([[Fraction(2), 1, 1], [4, -6, 0], [-2, 7, 2]])
+
+    def test_factors(self):
+        """Test that the permuted rows of the matrix are the product of the factors."""
+        lu = self.A.lu()
+        permuted = Matrix([self.A[i].tolist() for i in lu.perm])
+        self.assertEqual(permuted, lu.L @ lu.U)
+        self.assertEqual([1, 0, 2], lu.perm)
+
+    def test_solve(self):
+        """Test solving for one and for several right-hand sides."""
+        lu = self.A.lu()
+        self.assertEqual([1, 1, 2], lu.solve([5, -2, 9]))
+        B = Matrix([[5, 4], [-2, 4], [9, 0]])
+        X = lu.solve(B)
+        self.assertEqual(B, self.A @ X)
+        self.assertEqual([1, 1, 2], X.col(0).T.data[0])
+
+    def test_det_and_inverse(self):
+        """Test the determinant and the inverse computed from the factors."""
+        lu = self.A.lu()
+        self.assertEqual(-16, lu.det())
+        self.assertEqual(Matrix.identity(3), self.A @ lu.inverse())
+
+    def test_float_matrix(self):
+        """Test that integer matrices are factored in floating point."""
+        A = Matrix([[1, 2], [3, 4]])
+        lu = A.lu()
+        self.assertAlmostEqual(-2, lu.det())
+        x = lu.solve([5, 11])
+        self.assertAlmostEqual(1, x[0])
+        self.assertAlmostEqual(2, x[1])
+
+    def test_singular(self):
+        """Test that singular matrices have a zero determinant and cannot be solved."""
+        lu = Matrix([[1, 2], [2, 4]]).lu()
+        self.assertTrue(lu.is_singular())
+        self.assertEqual(0, lu.det())
+        with self.assertRaises(ValueError):
+            lu.solve([1, 2])
+        with self.assertRaises(ValueError):
+            lu.inverse()
+        self.assertEqual(0, Matrix([[0, 0], [0, 0]]).lu().det())
+
+    def test_invalid(self):
+        """Test that non-square matrices and mismatched right-hand sides are rejected."""
+        with self.assertRaises(ValueError):
+            LU(Matrix([[1, 2, 3]]))
+        lu = self.A.lu()
+        with self.assertRaises(ValueError):
+            lu.solve([1, 2])
+        with self.assertRaises(ValueError):
+            lu.solve(Matrix([[1, 2]]))
+
+    def test_cached_until_modified(self):
+        """Test that the factorization is reused until the matrix or a view of it is modified."""
+        lu = self.A.lu()
+        self.assertIs(lu, self.A.lu())
+        self.A.T[0, 0] = Fraction(3)
+        changed = self.A.lu()
+        self.assertIsNot(lu, changed)
+        self.assertEqual(-28, changed.det())
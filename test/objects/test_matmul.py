@@ -0,0 +1,64 @@
+import random
+from fractions import Fraction
+from unittest import TestCase
+
+from main.objects.matmul import (choose_algorithm, matmul, matmul_blocked, matmul_naive, matmul_strassen,
+                                 strassen_cost)
+from main.objects.matrix import Matrix
+
+
+def reference_product(a, b, n, m, p):
+    return [sum(a[i * m + k] * b[k * p + j] for k in range(m)) for i in range(n) for j in range(p)]
+
+
+class TestMatmul(TestCase):
+
+    def setUp(self):
+        self.random = random.Random(0)
+
+    def random_buffer(self, size):
+        return [self.random.randint(-9, 9) for _ in range(size)]
+
+    def test_kernels_match_reference_on_odd_and_rectangular_shapes(self):
+        """Test that every kernel computes the exact product for awkward shapes."""
+        for n, m, p in [(1, 1, 1), (3, 5, 2), (7, 7, 7), (9, 4, 11), (17, 17, 17)]:
+            a, b = self.random_buffer(n * m), self.random_buffer(m * p)
+            expected = reference_product(a, b, n, m, p)
+            self.assertEqual(expected, matmul_naive(a, b, n, m, p))
+            self.assertEqual(expected, matmul_blocked(a, b, n, m, p, block_size=4))
+            self.assertEqual(expected, matmul_strassen(a, b, n, m, p, cutoff=2))
+
+    def test_strassen_is_exact_for_fractions(self):
+        """Test that Strassen's recursion keeps exact arithmetic exact."""
+        a = [Fraction(self.random.randint(1, 9), self.random.randint(1, 9)) for _ in range(36)]
+        b = [Fraction(self.random.randint(1, 9), self.random.randint(1, 9)) for _ in range(36)]
+        self.assertEqual(reference_product(a, b, 6, 6, 6), matmul_strassen(a, b, 6, 6, 6, cutoff=1))
+
+    def test_choose_algorithm(self):
+        """Test that the automatic choice depends on the operand shapes."""
+        self.assertEqual('naive', choose_algorithm(8, 8, 8))
+        self.assertEqual('strassen', choose_algorithm(256, 256, 256))
+        self.assertEqual('blocked', choose_algorithm(4, 1024, 1024))
+
+    def test_choose_algorithm_avoids_padding_to_a_cube(self):
+        """Test that Strassen is not picked when padding to a cube costs more than the naive product."""
+        self.assertEqual('strassen', choose_algorithm(128, 128, 128))
+        self.assertEqual('naive', choose_algorithm(128, 256, 128))
+        self.assertEqual('naive', choose_algorithm(256, 128, 256))
+        self.assertLess(strassen_cost(256), 256 ** 3)
+        self.assertGreater(strassen_cost(256), 128 * 256 * 128)
+
+    def test_invalid_options(self):
+        """Test that unknown algorithms and non-positive block sizes are rejected."""
+        with self.assertRaises(ValueError):
+            matmul([1], [1], 1, 1, 1, algorithm='winograd')
+        with self.assertRaises(ValueError):
+            matmul_blocked([1], [1], 1, 1, 1, block_size=-1)
+
+    def test_matrix_matmul_algorithms_agree(self):
+        """Test that Matrix.matmul gives the same result whichever algorithm is selected."""
+        A = Matrix([self.random_buffer(6) for _ in range(5)])
+        B = Matrix([self.random_buffer(3) for _ in range(6)])
+        expected = A @ B
+        for algorithm in ('naive', 'blocked', 'strassen'):
+            self.assertEqual(expected, A.matmul(B, algorithm=algorithm, block_size=2))
@@ -1,3 +1,5 @@
+from decimal import Decimal
+from fractions import Fraction
 from unittest import TestCase
 
 from main.objects.matrix import Matrix
@@ -247,3 +249,226 @@ class TestMatrix(TestCase):
         self.assertEqual(original_matrix[0][0], 1, "Original matrix value should remain unchanged.")
 
 
+
+
+    def test_row_view_writes_through(self):
+        """Test that a row obtained with matrix[row] is a live view of the matrix."""
+        matrix = Matrix([[1, 2], [3, 4]])
+        row = matrix[0]
+        matrix[0][1] = 20
+        self.assertEqual(row, [1, 20])
+        self.assertEqual(matrix[-1], [3, 4])
+        self.assertEqual([[1, 20], [3, 4]], [list(r) for r in matrix])
+
+    def test_row_slice_assignment(self):
+        """Test that assigning to a slice of a row writes through to the matrix and its views."""
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        matrix[0][0:2] = [7, 8]
+        matrix[1][::-2] = (60, 40.5)
+        self.assertEqual([[7, 8, 3], [40.5, 5, 60]], matrix.data)
+        matrix.T[2][:] = [30, 600]
+        self.assertEqual([[7, 8, 30], [40.5, 5, 600]], matrix.data)
+        with self.assertRaises(ValueError):
+            matrix[0][0:2] = [1, 2, 3]
+
+    def test_row_index_out_of_range(self):
+        """Test that accessing a row or column outside the matrix raises an IndexError."""
+        matrix = Matrix([[1, 2], [3, 4]])
+        with self.assertRaises(IndexError):
+            matrix[2]
+        with self.assertRaises(IndexError):
+            matrix[0][2]
+
+    def test_setitem_widens_typed_storage(self):
+        """Test that writing a float into an int matrix keeps the exact value."""
+        matrix = Matrix([[1, 2], [3, 4]])
+        matrix[0][0] = 0.5
+        matrix[1] = [7, 2 ** 70]
+        self.assertEqual(matrix.data, [[0.5, 2], [7, 2 ** 70]])
+
+    def test_data_is_a_copy(self):
+        """Test that modifying the lists returned by data does not modify the matrix."""
+        matrix = Matrix([[1, 2], [3, 4]])
+        matrix.data[0][0] = 99
+        self.assertEqual(matrix[0][0], 1)
+
+    def test_validation_matches_check_methods(self):
+        """Test that the single-pass validator reports the same error as the individual _check_* methods."""
+        invalid_inputs = [1234, [], [[]], [1, 2], [[], 1], [[1, 2], [3]], [[1, "a"], [3]], [[1, "a"], [3, 4]],
+                          [[1], "row"], [[Fraction(1, 2), None]]]
+        matrix = Matrix([[1]])
+        for data in invalid_inputs:
+            with self.assertRaises(ValueError) as expected:
+                matrix._is_valid_data(data)
+            with self.assertRaises(ValueError) as context:
+                Matrix(data)
+            self.assertEqual(str(expected.exception), str(context.exception), data)
+
+    def test_exotic_numeric_elements(self):
+        """Test that numbers other than int and float are still accepted."""
+        data = [[Fraction(1, 2), 1j], [True, Decimal("1.5")]]
+        self.assertEqual(Matrix(data).data, data)
+
+    def test_identity_and_zero_are_int_matrices(self):
+        """Test that identity and zero matrices hold plain ints."""
+        self.assertEqual(Matrix.identity(2).data, [[1, 0], [0, 1]])
+        self.assertIs(type(Matrix.identity(2)[1][1]), int)
+        self.assertIs(type(Matrix.zero(1, 2)[0][1]), int)
+
+    def test_inplace_operators_keep_the_same_object(self):
+        """Test that +=, -=, *= and @= (with a square right operand) modify the matrix in place."""
+        A = Matrix([[1, 2], [3, 4]])
+        original = A
+        A += Matrix([[1, 1], [1, 1]])
+        A -= Matrix([[2, 2], [2, 2]])
+        A *= 2
+        A *= Matrix([[1, 0], [0, 1]])
+        self.assertIs(original, A)
+        self.assertEqual([[0, 0], [0, 6]], A.data)
+        A @= Matrix([[1, 2], [3, 4]])
+        self.assertIs(original, A)
+        self.assertEqual([[0, 0], [18, 24]], A.data)
+
+    def test_inplace_matmul_with_non_square_operand_returns_new_matrix(self):
+        """Test that @= falls back to a new matrix when the dimensions change."""
+        A = Matrix([[1, 2], [3, 4]])
+        original = A
+        A @= Matrix([[1, 0, 1], [0, 1, 1]])
+        self.assertIsNot(original, A)
+        self.assertEqual([[1, 2, 3], [3, 4, 7]], A.data)
+        self.assertEqual([[1, 2], [3, 4]], original.data)
+
+    def test_out_parameter(self):
+        """Test writing results into a preallocated matrix, including one of the operands."""
+        A = Matrix([[1, 2], [3, 4]])
+        B = Matrix([[5, 6], [7, 8]])
+        out = Matrix.zero(2, 2)
+        self.assertIs(out, A.add(B, out=out))
+        self.assertEqual(A + B, out)
+        self.assertIs(out, A.mul(0.5, out=out))
+        self.assertEqual([[0.5, 1.0], [1.5, 2.0]], out.data)
+        self.assertIs(B, A.matmul(B, out=B))
+        self.assertEqual([[19, 22], [43, 50]], B.data)
+        self.assertIs(A, A.matmul(A, out=A))
+        self.assertEqual([[7, 10], [15, 22]], A.data)
+
+    def test_out_parameter_with_wrong_dimensions(self):
+        """Test that an output matrix with the wrong dimensions is rejected."""
+        A = Matrix([[1, 2], [3, 4]])
+        with self.assertRaises(ValueError) as context:
+            A.sub(A, out=Matrix.zero(2, 3))
+        self.assertEqual("Output matrix must be 2x2, got 2x3.", str(context.exception))
+
+    def test_transpose_is_a_view(self):
+        """Test that the transpose shares storage with the original matrix."""
+        A = Matrix([[1, 2, 3], [4, 5, 6]])
+        A_T = A.T
+        A_T[2][0] = 30
+        self.assertEqual(30, A[0][2])
+        A[1][0] = 0.5
+        self.assertEqual([[1, 0.5], [2, 5], [30, 6]], A_T.data)
+
+    def test_submatrix_and_column_views(self):
+        """Test slicing rows, columns and submatrices without copying."""
+        A = Matrix([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])
+        sub = A[1:, 1:3]
+        self.assertEqual([[6, 7], [10, 11]], sub.data)
+        self.assertEqual([[1, 3], [9, 11]], A[::2, ::2].data)
+        self.assertEqual([[5, 6, 7, 8]], A[1:2].data)
+        self.assertEqual([[7], [11]], sub.col(1).data)
+        self.assertEqual([[3, 7, 11]], A.col(2).T.data)
+        self.assertEqual(7, A[1, 2])
+        sub[0, 1] = 70
+        self.assertEqual(70, A[1][2])
+
+    def test_invalid_slices(self):
+        """Test that empty and reversed slices are rejected."""
+        A = Matrix([[1, 2], [3, 4]])
+        with self.assertRaises(ValueError):
+            A[2:]
+        with self.assertRaises(ValueError):
+            A[::-1]
+        with self.assertRaises(IndexError):
+            A.col(2)
+
+    def test_operators_accept_views(self):
+        """Test that operators give the same results on views as on copies."""
+        A = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        sub = A[:2, 1:]
+        self.assertEqual(sub.copy() + sub.T.copy(), sub + sub.T)
+        self.assertEqual(sub.copy() @ A[1:, :2].copy(), sub @ A[1:, :2])
+        self.assertEqual(Matrix([[2, 3], [5, 6]]) * 2, sub * 2)
+
+    def test_copy_is_independent_of_view(self):
+        """Test that copying a view detaches it from the original storage."""
+        A = Matrix([[1, 2], [3, 4]])
+        copy = A.T.copy()
+        copy[0][1] = 99
+        self.assertEqual([[1, 2], [3, 4]], A.data)
+        self.assertEqual([[1, 99], [2, 4]], copy.data)
+
+    def test_out_parameter_with_view(self):
+        """Test writing a result into a view updates the viewed matrix."""
+        A = Matrix([[1, 2], [3, 4]])
+        A.T.add(Matrix([[1, 1], [1, 1]]), out=A.T)
+        self.assertEqual([[2, 3], [4, 5]], A.data)
+        A[:, 1:].mul(0.5, out=A[:, 1:])
+        self.assertEqual([[2, 1.5], [4, 2.5]], A.data)
+
+    def test_widening_is_shared_with_views(self):
+        """Test that widening the storage through one view is seen by the others."""
+        A = Matrix([[1, 2], [3, 4]])
+        A_T = A.T
+        A[0][0] = Fraction(1, 3)
+        self.assertEqual(Fraction(1, 3), A_T[0][0])
+
+    def test_multi_dot(self):
+        """Test that a chain product gives the same result as left-to-right multiplication."""
+        A = Matrix([[1, 2], [3, 4], [5, 6]])
+        B = Matrix([[1, 0, 2], [0, 1, 1]])
+        C = Matrix([[2], [1], [0]])
+        self.assertEqual((A @ B) @ C, Matrix.multi_dot([A, B, C]))
+        self.assertEqual((0, (1, 2)), Matrix.plan_chain([A, B, C]).order)
+        self.assertEqual(A, Matrix.multi_dot([A]))
+        with self.assertRaises(ValueError):
+            Matrix.multi_dot([A, A])
+
+    def test_power(self):
+        """Test raising a square matrix to integer powers."""
+        A = Matrix([[1, 1], [1, 0]])
+        self.assertEqual(Matrix.identity(2), A ** 0)
+        self.assertEqual(A, A ** 1)
+        self.assertIsNot(A, A ** 1)
+        self.assertEqual(A @ A @ A, A.power(3))
+        self.assertEqual([[89, 55], [55, 34]], (A ** 10).data)
+        self.assertEqual(A ** 50 @ A ** 50, A ** 100)
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2, 3]]) ** 2
+        with self.assertRaises(ValueError):
+            A ** -1
+
+    def test_freeze(self):
+        """Test that frozen matrices and their views reject writes and are hashable."""
+        A = Matrix([[1, 2], [3, 4]])
+        with self.assertRaises(TypeError):
+            hash(A)
+        A[0][0] = 5
+        self.assertEqual(1, A._storage.version)
+        A.freeze()
+        for write in (lambda: A.__setitem__((0, 0), 1), lambda: A[1].__setitem__(0, 1),
+                      lambda: A.T.__setitem__(0, [1, 1]), lambda: A.add(A, out=A)):
+            with self.assertRaises(ValueError):
+                write()
+        with self.assertRaises(ValueError):
+            A += A
+        self.assertEqual([[5, 2], [3, 4]], A.data)
+        self.assertEqual(hash(A), hash(Matrix([[5, 2], [3, 4]]).freeze()))
+        self.assertEqual({A}, {Matrix([[5, 2], [3, 4]]).freeze()})
+        self.assertFalse(A.clone().frozen)
+
+    def test_frozen_equality_short_circuits_on_hash(self):
+        """Test that frozen matrices with different hashes compare unequal."""
+        A, B = Matrix([[1, 2]]).freeze(), Matrix([[1, 3]]).freeze()
+        hash(A), hash(B)
+        self.assertNotEqual(A, B)
+        self.assertEqual(A, Matrix([[1, 2]]))
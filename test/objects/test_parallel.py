@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from main.objects import parallel
+from main.objects.matrix import Matrix
+
+
+class TestParallel(TestCase):
+
+    def setUp(self):
+        parallel.configure(workers=2, threshold=0)
+
+    def tearDown(self):
+        parallel.configure(workers=0)
+
+    def assertSameAsSerial(self, compute):
+        """Computes a result in parallel and again serially and checks that they are equal."""
+        result = compute()
+        parallel.configure(workers=0)
+        expected = compute()
+        self.assertEqual(expected, result)
+        self.assertEqual(type(expected._buf), type(result._buf))
+        return result
+
+    def test_disabled_by_default(self):
+        """Test that nothing runs in parallel unless configured."""
+        parallel.configure(workers=0)
+        self.assertFalse(parallel.should_parallelize(10 ** 9, Matrix([[1]])._buf))
+
+    def test_threshold_and_storage_type(self):
+        """Test that small operations and untyped storage stay serial."""
+        parallel.configure(workers=2, threshold=100)
+        self.assertFalse(parallel.should_parallelize(99, Matrix([[1]])._buf))
+        self.assertTrue(parallel.should_parallelize(100, Matrix([[1]])._buf))
+        self.assertFalse(parallel.should_parallelize(100, Matrix([[1, 2.5]])._buf))
+
+    def test_matmul(self):
+        """Test a parallel matrix product with more rows than workers."""
+        A = Matrix([[i + j for j in range(4)] for i in range(5)])
+        B = Matrix([[i * j - 1.5 for j in range(3)] for i in range(4)])
+        self.assertSameAsSerial(lambda: A @ B)
+
+    def test_elementwise_and_transpose(self):
+        """Test parallel addition, subtraction, multiplication and transpose."""
+        A = Matrix([[i * 3 + j for j in range(3)] for i in range(5)])
+        B = Matrix([[float(i - j) for j in range(3)] for i in range(5)])
+        self.assertSameAsSerial(lambda: A + B)
+        self.assertSameAsSerial(lambda: A - A)
+        self.assertSameAsSerial(lambda: A * B)
+        self.assertSameAsSerial(lambda: 0.5 * A)
+        self.assertSameAsSerial(lambda: A.T)
+
+    def test_int64_overflow_falls_back_to_exact_ints(self):
+        """Test that bands overflowing int64 keep their exact Python int values."""
+        A = Matrix([[2 ** 62, 1], [1, 2 ** 62]])
+        result = self.assertSameAsSerial(lambda: A * 4)
+        self.assertEqual([[2 ** 64, 4], [4, 2 ** 64]], result.data)
+
+    def test_invalid_configuration(self):
+        """Test that negative settings are rejected."""
+        with self.assertRaises(ValueError):
+            parallel.configure(workers=-1)
@@ -0,0 +1,79 @@
+import json
+import pstats
+from unittest import TestCase
+
+from main.objects import profiling
+from main.objects.matrix import Matrix
+
+
+class TestProfiling(TestCase):
+
+    def tearDown(self):
+        while profiling.disable() is not None:
+            pass
+
+    def test_disabled_by_default(self):
+        """Test that Matrix methods are not instrumented unless a profile is active."""
+        add = Matrix.add
+        with profiling.profile():
+            self.assertIsNot(add, Matrix.add)
+        self.assertIs(add, Matrix.add)
+
+    def test_records_operators(self):
+        """Test the recorded calls, elements, FLOPs, bytes and shapes."""
+        A = Matrix([[1, 2], [3, 4], [5, 6]])
+        B = Matrix([[1, 0, 1], [0, 1, 1]])
+        with profiling.profile() as profile:
+            A @ B
+            A + A
+            A * 2
+            A.T
+            A.clone()
+        stats = profile.to_dict()
+        self.assertEqual(1, stats['matmul']['calls'])
+        self.assertEqual(2 * 3 * 2 * 3, stats['matmul']['flops'])
+        self.assertEqual(9, stats['matmul']['elements'])
+        self.assertEqual(9 * 8, stats['matmul']['bytes'])
+        self.assertEqual({'3x2, 2x3': 1}, stats['matmul']['shapes'])
+        self.assertEqual({'3x2, scalar': 1}, stats['mul']['shapes'])
+        self.assertEqual(0, stats['T']['bytes'])
+        self.assertEqual(6 * 8, stats['clone']['bytes'])
+        self.assertEqual(json.loads(profile.to_json()), stats)
+
+    def test_construction_and_validation(self):
+        """Test that construction and validation are recorded separately."""
+        with profiling.profile() as profile:
+            Matrix([[1, 2], [3, 4]])
+        stats = profile.to_dict()
+        self.assertEqual(1, stats['construct']['calls'])
+        self.assertEqual(4, stats['validate']['elements'])
+        self.assertLessEqual(stats['construct']['self_seconds'], stats['construct']['seconds'])
+
+    def test_nested_time(self):
+        """Test that nested operators count in the cumulative time of the outer one only."""
+        A = Matrix([[1, 2], [3, 4]])
+        with profiling.profile() as profile:
+            A.T @ A
+        stats = profile.to_dict()
+        self.assertEqual(1, stats['transpose_buffer']['calls'])
+        self.assertGreaterEqual(stats['matmul']['seconds'], stats['transpose_buffer']['seconds'])
+        self.assertLess(stats['matmul']['self_seconds'], stats['matmul']['seconds'])
+
+    def test_pstats_summary(self):
+        """Test that the profile can be read by pstats."""
+        profile = profiling.enable()
+        Matrix([[1]]) + Matrix([[2]])
+        profiling.disable()
+        stats = pstats.Stats(profile)
+        self.assertIn(('~', 0, 'Matrix.add'), stats.stats)
+        self.assertIn('Matrix.add', profile.summary())
+
+    def test_nested_profiles(self):
+        """Test that every active profile records the calls made while it is active."""
+        A = Matrix([[1]])
+        with profiling.profile() as outer:
+            A + A
+            with profiling.profile() as inner:
+                A - A
+        self.assertEqual({'add', 'sub'}, set(outer.to_dict()))
+        self.assertEqual({'sub'}, set(inner.to_dict()))
@@ -0,0 +1,96 @@
+import math
+from fractions import Fraction
+from unittest import TestCase
+
+from main.objects.matrix import Matrix
+from main.objects.reductions import NORM_CHUNK_SIZE
+
+
+class TestReductions(TestCase):
+
+    def setUp(self):
+        self.A = Matrix([[1, -2, 3], [4, 5, -6]])
+
+    def test_sum_and_mean(self):
+        """Test sums and means of all elements and along each axis."""
+        self.assertEqual(5, self.A.sum())
+        self.assertEqual(Matrix([[5, 3, -3]]), self.A.sum(axis=0))
+        self.assertEqual(Matrix([[2], [3]]), self.A.sum(axis=1))
+        self.assertEqual(Matrix([[2.5, 1.5, -1.5]]), self.A.mean(axis=0))
+        self.assertEqual(Fraction(1, 6), Matrix([[Fraction(1, 3), 0]]).mean())
+        with self.assertRaises(ValueError):
+            self.A.sum(axis=2)
+
+    def test_max_min_and_positions(self):
+        """Test extrema and their positions."""
+        self.assertEqual(5, self.A.max())
+        self.assertEqual(-6, self.A.min())
+        self.assertEqual(Matrix([[4, 5, 3]]), self.A.max(axis=0))
+        self.assertEqual(Matrix([[-2], [-6]]), self.A.min(axis=1))
+        self.assertEqual((1, 1), self.A.argmax())
+        self.assertEqual((1, 2), self.A.argmin())
+        self.assertEqual(Matrix([[1, 1, 0]]), self.A.argmax(axis=0))
+        self.assertEqual(Matrix([[1], [2]]), self.A.argmin(axis=1))
+
+    def test_reductions_on_views(self):
+        """Test that reductions see the elements of views."""
+        self.assertEqual(Matrix([[2], [3]]), self.A.T.sum(axis=0).T)
+        self.assertEqual(5, self.A[:, 1:].max())
+
+    def test_norms(self):
+        """Test the Frobenius, 1 and inf norms."""
+        self.assertAlmostEqual(math.sqrt(91), self.A.norm())
+        self.assertEqual(9, self.A.norm(1))
+        self.assertEqual(5, self.A.norm(-1))
+        self.assertEqual(15, self.A.norm(math.inf))
+        self.assertEqual(6, self.A.norm(-math.inf))
+        self.assertEqual(5.0, Matrix([[3j, 4]]).norm())
+        self.assertEqual(1e300 * math.sqrt(2), Matrix([[1e300, 1e300]]).norm())
+        with self.assertRaises(ValueError):
+            self.A.norm(2)
+
+    def test_trace(self):
+        """Test the trace of matrices and views."""
+        B = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        self.assertEqual(15, B.trace())
+        self.assertEqual(15, B.T.trace())
+        self.assertEqual(14, B[1:, 1:].trace())
+        with self.assertRaises(ValueError):
+            self.A.trace()
+
+    def test_allclose(self):
+        """Test comparison within tolerances."""
+        B = Matrix([[1.0, 2.0], [3.0, math.inf]])
+        self.assertTrue(B.allclose(Matrix([[1.0 + 1e-9, 2.0], [3.0, math.inf]])))
+        self.assertFalse(B.allclose(Matrix([[1.1, 2.0], [3.0, math.inf]])))
+        self.assertTrue(B.allclose(Matrix([[1.1, 2.0], [3.0, math.inf]]), atol=0.2))
+        self.assertFalse(B.allclose(Matrix([[1.0, 2.0]])))
+        self.assertFalse(Matrix([[math.nan]]).allclose(Matrix([[math.nan]])))
+        self.assertTrue(B.allclose(B))
+        with self.assertRaises(ValueError):
+            B.allclose(B, rtol=-1)
+
+    def test_allclose_with_infinities(self):
+        """Test that infinities are only close to the same infinity, whichever side they are on."""
+        inf, ninf, one = Matrix([[math.inf]]), Matrix([[-math.inf]]), Matrix([[1.0]])
+        self.assertTrue(inf.allclose(Matrix([[math.inf]])))
+        self.assertFalse(ninf.allclose(inf))
+        self.assertFalse(inf.allclose(ninf))
+        self.assertFalse(one.allclose(inf))
+        self.assertFalse(inf.allclose(one))
+        self.assertFalse(Matrix([[1e308]]).allclose(Matrix([[-1e308]]), rtol=1))
+
+    def test_frobenius_norm_of_large_and_exact_matrices(self):
+        """Test the Frobenius norm over several chunks, of Fractions and of ints beyond the float range."""
+        ones = Matrix([[1.0] * (NORM_CHUNK_SIZE + 1)] * 4)
+        self.assertAlmostEqual(2 * math.sqrt(NORM_CHUNK_SIZE + 1), ones.norm())
+        self.assertEqual(0.5, Matrix([[Fraction(3, 10), Fraction(-2, 5)]]).norm())
+        self.assertEqual(math.inf, Matrix([[10 ** 400, 1]]).norm())
+
+    def test_eq_fast_paths(self):
+        """Test that a matrix equals itself and that shape mismatches are unequal."""
+        self.assertEqual(self.A, self.A)
+        self.assertEqual(self.A.T, self.A.T)
+        self.assertNotEqual(self.A, self.A.T)
+        self.assertTrue(self.A._shares_layout(self.A[:, :]))
+        self.assertFalse(self.A._shares_layout(self.A.clone()))
@@ -0,0 +1,93 @@
+from fractions import Fraction
+from unittest import TestCase
+
+from main.objects.matrix import Matrix
+from main.objects.sparse import SparseMatrix
+
+
+class TestSparseMatrix(TestCase):
+
+    def setUp(self):
+        self.dense = Matrix([[0, 2, 0], [0, 0, 0], [1, 0, 3]])
+        self.sparse = SparseMatrix.from_dense(self.dense)
+
+    def test_from_dense_stores_only_non_zeros(self):
+        """Test the CSR arrays built from a dense matrix."""
+        self.assertEqual(3, self.sparse.nnz)
+        self.assertEqual([0, 1, 1, 3], list(self.sparse.indptr))
+        self.assertEqual([1, 0, 2], list(self.sparse.indices))
+        self.assertEqual([2, 1, 3], list(self.sparse.values))
+        self.assertEqual(self.dense, self.sparse.to_dense())
+
+    def test_from_coo_sums_duplicates_and_drops_zeros(self):
+        """Test building from unordered triplets with duplicates and zeros."""
+        sparse = SparseMatrix.from_coo([2, 0, 2, 1, 2], [2, 1, 0, 1, 2], [1, 2, 1, 0, 2], 3, 3)
+        self.assertEqual(self.sparse, sparse)
+
+    def test_from_coo_invalid_input(self):
+        """Test that out-of-range coordinates and non-numeric values are rejected."""
+        with self.assertRaises(ValueError):
+            SparseMatrix.from_coo([3], [0], [1], 3, 3)
+        with self.assertRaises(ValueError) as context:
+            SparseMatrix.from_coo([0], [0], ["one"], 3, 3)
+        self.assertEqual("Matrix elements must be Numbers.", str(context.exception))
+        with self.assertRaises(ValueError):
+            SparseMatrix.from_coo([0, 1], [0], [1], 3, 3)
+
+    def test_identity(self):
+        """Test that identity(n, sparse=True) gives a sparse identity matrix."""
+        identity = Matrix.identity(3, sparse=True)
+        self.assertIsInstance(identity, SparseMatrix)
+        self.assertEqual(3, identity.nnz)
+        self.assertEqual(Matrix.identity(3), identity)
+        self.assertEqual(self.sparse, identity @ self.sparse)
+
+    def test_add_and_subtract(self):
+        """Test sparse +/- sparse and mixed sparse/dense additions."""
+        other = SparseMatrix.from_coo([0, 1], [1, 1], [-2, 5], 3, 3)
+        self.assertEqual(self.dense + other.to_dense(), self.sparse + other)
+        self.assertEqual(3, (self.sparse + other).nnz)
+        self.assertEqual(self.dense - other.to_dense(), self.sparse - other)
+        self.assertEqual(self.dense + self.dense, self.dense + self.sparse)
+        self.assertIsInstance(self.dense + self.sparse, Matrix)
+        with self.assertRaises(ValueError):
+            self.sparse + SparseMatrix.identity(2)
+
+    def test_scalar_multiplication(self):
+        """Test sparse * scalar on both sides."""
+        self.assertEqual(self.dense * Fraction(1, 2), self.sparse * Fraction(1, 2))
+        self.assertEqual(self.dense * 3, 3 * self.sparse)
+        self.assertEqual(0, (self.sparse * 0).nnz)
+
+    def test_matmul(self):
+        """Test sparse @ dense, dense @ sparse and sparse @ sparse."""
+        B = Matrix([[1, 2], [3, 4.5], [5, 6]])
+        self.assertEqual(self.dense @ B, self.sparse @ B)
+        self.assertEqual(B.T @ self.dense, B.T @ self.sparse)
+        self.assertEqual(self.dense @ self.dense, (self.sparse @ self.sparse).to_dense())
+        with self.assertRaises(ValueError):
+            self.sparse @ Matrix([[1, 2]])
+
+    def test_transpose(self):
+        """Test the CSR transpose."""
+        self.assertEqual(self.dense.T, self.sparse.T)
+        self.assertEqual(self.sparse, self.sparse.T.T)
+
+    def test_equality(self):
+        """Test equality between sparse matrices and with dense ones."""
+        self.assertEqual(self.sparse, self.dense)
+        self.assertEqual(self.dense, self.sparse)
+        self.assertNotEqual(self.sparse, SparseMatrix.identity(3))
+        self.assertNotEqual(self.sparse, Matrix.zero(3, 2))
+
+    def test_dtypes_follow_promotion_rules(self):
+        """Test that float32 values survive the sparse format and that results follow the Matrix promotion rules."""
+        F = Matrix([[0, 1.5], [2, 0]], dtype='float32')
+        sparse = SparseMatrix.from_dense(F)
+        self.assertEqual('float32', sparse.to_dense().dtype)
+        self.assertEqual('float32', (sparse @ F).dtype)
+        self.assertEqual('float32', (F @ sparse).dtype)
+        self.assertEqual('float32', (sparse @ sparse).to_dense().dtype)
+        self.assertEqual('float32', (sparse * 2 + sparse.T).to_dense().dtype)
+        self.assertEqual('float64', (sparse @ Matrix([[1, 0], [0, 1]])).dtype)
+        self.assertEqual(F @ F, sparse @ F)
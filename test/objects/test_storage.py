@@ -0,0 +1,38 @@
+from array import array
+from fractions import Fraction
+from unittest import TestCase
+
+from main.objects.storage import buffers_equal, fits, pack
+
+
+class TestStorage(TestCase):
+
+    def test_pack_ints_uses_int64_array(self):
+        """Test that plain ints are packed into an int64 array."""
+        buf = pack([1, 2, 3])
+        self.assertEqual(array('q', [1, 2, 3]), buf)
+
+    def test_pack_floats_uses_float64_array(self):
+        """Test that plain floats are packed into a float64 array."""
+        buf = pack([1.5, 2.0])
+        self.assertEqual(array('d', [1.5, 2.0]), buf)
+
+    def test_pack_keeps_mixed_and_exact_types_in_a_list(self):
+        """Test that mixed, exact and oversized values stay in a plain list."""
+        self.assertEqual([1, 2.0], pack([1, 2.0]))
+        self.assertEqual([Fraction(1, 3)], pack([Fraction(1, 3)]))
+        self.assertEqual([2 ** 70], pack([2 ** 70]))
+
+    def test_fits(self):
+        """Test which values can be written into typed buffers without widening them."""
+        self.assertTrue(fits(array('q', [0]), 5))
+        self.assertFalse(fits(array('q', [0]), 2.5))
+        self.assertFalse(fits(array('q', [0]), 2 ** 64))
+        self.assertTrue(fits(array('d', [0.0]), 5))
+        self.assertFalse(fits(array('d', [0.0]), Fraction(1, 3)))
+        self.assertTrue(fits([0], "anything"))
+
+    def test_buffers_equal_across_buffer_types(self):
+        """Test that buffers of different types compare by value."""
+        self.assertTrue(buffers_equal(array('q', [1, 2]), [1, 2.0]))
+        self.assertFalse(buffers_equal(array('q', [1, 2]), array('q', [1, 3])))
@@ -0,0 +1,78 @@
+import io
+import os
+import tempfile
+from array import array
+from fractions import Fraction
+from unittest import TestCase
+
+from main.objects.matrix import Matrix
+from main.objects.streaming import chunks, from_rows, read_csv, write_csv
+
+
+class TestStreaming(TestCase):
+
+    def test_from_rows_generator(self):
+        """Test building a matrix from a generator of rows of several types."""
+        A = Matrix.from_rows(([i, i + 1] for i in range(3)))
+        self.assertEqual(Matrix([[0, 1], [1, 2], [2, 3]]), A)
+        self.assertEqual('q', A._buf.typecode)
+        B = from_rows([(1.5, 2.5), array('d', [3.5, 4.5])])
+        self.assertEqual('d', B._buf.typecode)
+
+    def test_from_rows_packs_like_constructor(self):
+        """Test that rows of different types are packed as the constructor would pack them."""
+        for data in ([[1, 2], [3.5, 4.5]], [[1, 2], [2 ** 70, 1]], [[Fraction(1, 2), 1], [1, 2]]):
+            self.assertEqual(type(Matrix(data)._buf), type(from_rows(iter(data))._buf))
+            self.assertEqual(Matrix(data), from_rows(iter(data)))
+
+    def test_from_rows_invalid(self):
+        """Test that invalid rows are rejected with the constructor messages, and non-row objects with their own."""
+        for rows, message in (([], "Matrix cannot be empty."), ([[]], "Matrix cannot be empty."),
+                              ([[1, 2], [3]], "All rows must have the same length."),
+                              ([[1, 'a']], "Matrix elements must be Numbers."),
+                              ([(1, 2), (3, None)], "Matrix elements must be Numbers."),
+                              ([array('u', 'ab')], "Matrix elements must be Numbers."),
+                              ([[1], 2], "Each row must be a list, tuple, array or matrix row.")):
+            with self.assertRaises(ValueError) as context:
+                from_rows(iter(rows))
+            self.assertEqual(message, str(context.exception))
+        with self.assertRaises(ValueError):
+            from_rows([[1, 2]], n_cols=3)
+
+    def test_csv_round_trip(self):
+        """Test writing a matrix to CSV and reading it back."""
+        A = Matrix([[1, Fraction(1, 3)], [2.5, -4]])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.csv')
+            A.to_csv(path)
+            B = Matrix.from_csv(path)
+        self.assertEqual(A, B)
+        self.assertEqual([[1, Fraction(1, 3)], [2.5, -4]], B.data)
+
+    def test_csv_file_objects(self):
+        """Test reading and writing CSV through open text files."""
+        self.assertEqual([[1, 2], [3, 4]], list(read_csv(io.StringIO("1;2\n\n3;4\n"), delimiter=';')))
+        with self.assertRaises(ValueError):
+            Matrix.from_csv(io.StringIO("1,x\n"))
+        out = io.StringIO()
+        Matrix([[1, 2], [3, 4]]).T.to_csv(out)
+        self.assertEqual("1,3\r\n2,4\r\n", out.getvalue())
+
+    def test_iter_rows_and_chunks(self):
+        """Test iterating over the rows and over blocks of rows, views included."""
+        A = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        self.assertEqual([[1, 4, 7], [2, 5, 8], [3, 6, 9]], list(A.T.iter_rows()))
+        blocks = list(A.iter_chunks(2))
+        self.assertEqual([Matrix([[1, 2, 3], [4, 5, 6]]), Matrix([[7, 8, 9]])], blocks)
+        blocks[1][0, 0] = 70
+        self.assertEqual(70, A[2, 0])
+        with self.assertRaises(ValueError):
+            list(A.iter_chunks(0))
+
+    def test_chunked_pipeline(self):
+        """Test applying element-wise operators to a row stream chunk by chunk."""
+        rows = ([i, -i] for i in range(5))
+        offset = Matrix([[1, 1], [1, 1]])
+        out = io.StringIO()
+        write_csv((chunk * 2 + offset[:chunk.n_rows] for chunk in chunks(rows, 2)), out)
+        self.assertEqual(Matrix([[2 * i + 1, 1 - 2 * i] for i in range(5)]), Matrix.from_csv(io.StringIO(out.getvalue())))
@@ -0,0 +1,61 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from main import benchmark
+from main.main import main
+from main.objects.matrix import Matrix
+
+
+class TestBenchmark(TestCase):
+
+    def test_run_sweeps_sizes_shapes_and_dtypes(self):
+        """Test that run reports one result per operation, size, shape and element type."""
+        results = benchmark.run(sizes=[4, 8], operations=['add', 'matmul'], repeat=1, max_matmul_size=4)
+        self.assertEqual(2 * 3 * 3 + 1 * 3 * 3, len(results))
+        self.assertEqual({(8, 2), (2, 8), (4, 4), (16, 4), (4, 16), (8, 8)},
+                         {(result['n_rows'], result['n_cols']) for result in results})
+        for result in results:
+            self.assertGreater(result['ns_per_element'], 0)
+            self.assertGreater(result['peak_bytes'], 0)
+
+    def test_eq_compares_every_element(self):
+        """Test that the eq operation compares equal matrices that do not share storage."""
+        A, B = Matrix([[1, 2], [3, 4]]), Matrix([[5, 6], [7, 8]])
+        eq, elements = benchmark._operations(A.data, A, B)['eq']
+        self.assertEqual(4, elements)
+        self.assertIs(True, eq())
+
+    def test_unknown_operation(self):
+        """Test that unknown operation names are rejected."""
+        with self.assertRaises(ValueError):
+            benchmark.run(operations=['divide'])
+
+    def test_compare_reports_slowdowns_above_threshold(self):
+        """Test that only matching results slower than the threshold are reported."""
+        baseline = [{'operation': 'add', 'shape': 'square', 'n_rows': 4, 'n_cols': 4, 'dtype': 'int',
+                     'ns_per_element': 100.0}]
+        slower = [dict(baseline[0], ns_per_element=130.0)]
+        slightly_slower = [dict(baseline[0], ns_per_element=105.0)]
+        other_size = [dict(baseline[0], n_rows=8, ns_per_element=500.0)]
+        self.assertEqual(1, len(benchmark.compare(baseline, slower, threshold=0.1)))
+        self.assertAlmostEqual(0.3, benchmark.compare(baseline, slower)[0]['slowdown'])
+        self.assertEqual([], benchmark.compare(baseline, slightly_slower, threshold=0.1))
+        self.assertEqual([], benchmark.compare(baseline, other_size))
+
+    def test_cli_saves_and_compares_results(self):
+        """Test the bench command with a JSON output and a baseline."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.json')
+            arguments = ['bench', '--sizes', '4', '--shapes', 'square', '--dtypes', 'int', '--repeat', '1']
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(0, main(arguments + ['--output', path]))
+            self.assertIn('matmul', output.getvalue())
+            with open(path) as f:
+                self.assertEqual(len(benchmark.OPERATIONS), len(json.load(f)['results']))
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(1, main(arguments + ['--baseline', path, '--threshold', '-1']))
+            self.assertIn('REGRESSION', output.getvalue())